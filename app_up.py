@@ -3,7 +3,6 @@
 # ===================================
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import math
 
 #quando feito colocar no terminal: pip install streamlit pandas plotly
@@ -317,6 +316,9 @@ def tela_sistema():
     st.subheader("Resultado PROMETHEE II")
     st.dataframe(resultado)
 
+    # plotly só é importado quando o gráfico é desenhado
+    import plotly.express as px
+
     fig = px.bar(resultado, x='Fornecedor', y='Fluxo Líquido (ϕ)',
                  title="Ranking dos Fornecedores", color='Fornecedor')
     st.plotly_chart(fig)
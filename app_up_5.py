@@ -3,10 +3,10 @@
 # ===================================
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import math
 import numpy as np
 
+from promethee import DESCRICAO_CRITERIOS_PT, ESCALA_QUALITATIVA_PT, calcular_promethee_sem_normalizar
+
 #quando feito colocar no terminal: pip install streamlit pandas plotly
 # streamlit run app_up_5.py
 
@@ -70,179 +70,11 @@ st.markdown("""
 # ===================================
 # 🧠 Descrição dos Critérios e Escalas Qualitativas
 # ===================================
-descricao_criterios = {
-    'C1 - Preço': 'Valor monetário em reais. (↓)',
-    'C2 - Qualidade': 'Avaliação subjetiva da qualidade com base em padrões de referência. (↑)',
-    'C3 - Entrega': 'Prazo de entrega em dias. (↓)',
-    'C4 - Tecnologia': 'Nível de inovação e adoção de tecnologias avançadas. (↑)',
-    'C5 - Custos ambientais': 'Custos ambientais em reais, como multas ou tratamentos. (↓)',
-    'C6 - Projeto verde': 'Grau de adoção de práticas sustentáveis no projeto. (↑)',
-    'C7 - Gestão ambiental': 'Efetividade do sistema de gestão ambiental. (↑)',
-    'C8 - Partes interessadas': 'Comprometimento com direitos e atendimento das partes interessadas. (↑)',
-    'C9 - Segurança e saúde no trabalho': 'Taxa de acidentes ou incidentes ocupacionais. (↓)',
-    'C10 - Respeito pela política dos funcionários': 'Cumprimento das políticas e direitos dos funcionários. (↑)',
-    'C11 - Gestão social': 'Capacidade de implementar práticas de gestão social sustentável. (↑)',
-    'C12 - Histórico de desempenho': 'Número de anos em operação. (↑)',
-    'C13 - Reputação': 'Análise de mídia, avaliações e reconhecimentos. (↑)',
-    'C14 - Logística': 'Distância em quilômetros. (↓)'
-}
-
-escala_qualitativa = {
-    'C2 - Qualidade': """| Nota | Descrição |
-|------|-----------|
-| 1 | Produtos/serviços não atendem aos padrões de qualidade, resultando em retrabalho frequente e feedback negativo. |
-| 2 | Produtos/serviços geralmente abaixo do padrão, com problemas ocasionais e feedback predominantemente negativo. |
-| 3 | Produtos/serviços atendem ao padrão mínimo, com problemas ocasionais e feedback variado. |
-| 4 | Produtos/serviços atendem ou excedem padrões de qualidade, com feedback positivo e poucas rejeições. |
-| 5 | Produtos/serviços excepcionais, superando consistentemente os padrões, com feedback altamente positivo e mínimas rejeições. |""",
-
-    'C4 - Tecnologia': """| Nota | Descrição |
-|------|-----------|
-| 1 | Práticas e tecnologias desatualizadas, sem inovação ou certificações. |
-| 2 | Investimento limitado em tecnologia, com melhorias inconsistentes e poucas certificações. |
-| 3 | Alguma inovação e tecnologias avançadas em áreas específicas, mas não abrangente. |
-| 4 | Alinhado com as melhores práticas, com certificações, prêmios e parcerias relevantes. |
-| 5 | Líder em inovação, com certificações ISO, prêmios e parcerias estratégicas. |""",
-
-    'C6 - Projeto verde': """| Nota | Descrição |
-|------|-----------|
-| 1 | Sem práticas sustentáveis, ecoeficiência, certificações ou uso de energias renováveis. |
-| 2 | Esforços limitados em sustentabilidade, poucas certificações, uso esporádico de energias renováveis. |
-| 3 | Algumas práticas sustentáveis e certificações, uso moderado de energias renováveis. |
-| 4 | Práticas ecoeficientes, certificações reconhecidas, uso consistente de energias renováveis e materiais sustentáveis. |
-| 5 | Líder em sustentabilidade, práticas altamente ecoeficientes, certificações destacadas, uso significativo de energias renováveis e materiais sustentáveis. |""",
-
-    'C7 - Gestão ambiental': """| Nota | Descrição |
-|------|-----------|
-| 1 | Sem sistema de gestão ambiental, não conformidade com regulamentações, nenhuma documentação ou programas de treinamento. |
-| 2 | Esforços limitados em gestão ambiental, conformidade parcial, pouca documentação e poucos programas de treinamento. |
-| 3 | Capacidade moderada em gestão ambiental, conformidade parcial, documentação adequada, programas de treinamento limitados. |
-| 4 | Sistema de gestão ambiental eficaz, conformidade com regulamentações, documentação abrangente, programas de treinamento disponíveis. |
-| 5 | Líder em gestão ambiental, total conformidade, excelente documentação, programas de treinamento exemplares. |""",
+descricao_criterios = DESCRICAO_CRITERIOS_PT
 
-    'C8 - Partes interessadas': """| Nota | Descrição |
-|------|-----------|
-| 1 | Sem comprometimento com direitos das partes interessadas, não conformidade com normas, condições de trabalho e atendimento deficientes. |
-| 2 | Comprometimento limitado, conformidade parcial com normas, condições de trabalho e atendimento inconsistentes. |
-| 3 | Cumprimento parcial das normas, condições de trabalho e atendimento aceitáveis, feedback misto. |
-| 4 | Comprometimento sólido, conformidade com normas, condições de trabalho e atendimento de alta qualidade, feedback positivo. |
-| 5 | Comprometimento exemplar, alinhamento com melhores práticas, excelentes condições de trabalho e atendimento, feedback extremamente positivo. |""",
+escala_qualitativa = ESCALA_QUALITATIVA_PT
 
-    'C10 - Respeito pela política dos funcionários': """| Nota | Descrição |
-|------|-----------|
-| 1 | Sem comprometimento com igualdade, diversidade e não discriminação; ausência de políticas e procedimentos. |
-| 2 | Comprometimento mínimo, políticas limitadas e ineficazes, promoção de diversidade e inclusão é insuficiente. |
-| 3 | Comprometimento parcial, políticas e procedimentos adequados, alguns esforços na promoção da diversidade e inclusão. |
-| 4 | Comprometimento sólido, políticas alinhadas com melhores práticas, promoção ativa da diversidade e inclusão, políticas e procedimentos eficazes. |
-| 5 | Comprometimento exemplar, políticas abrangentes, promoção fundamental da diversidade e inclusão, procedimentos robustos e igualdade de oportunidades clara. |""",
 
-    'C11 - Gestão social': """| Nota | Descrição |
-|------|-----------|
-| 1 | Ausência de políticas de responsabilidade social corporativa (RSC), nenhum apoio à comunidade ou desenvolvimento sustentável. |
-| 2 | Políticas de RSC limitadas, poucas ações concretas em apoio à comunidade e desenvolvimento sustentável, envolvimento mínimo com organizações sem fins lucrativos. |
-| 3 | Algumas políticas de RSC e ações em apoio à comunidade, parcialmente desenvolvidas, envolvimento moderado com organizações sem fins lucrativos. |
-| 4 | Políticas sólidas de RSC, envolvimento ativo em ações de apoio à comunidade e desenvolvimento sustentável, colaboração com organizações sem fins lucrativos. |
-| 5 | Excelência em RSC, políticas abrangentes e eficazes, significativo apoio à comunidade, desenvolvimento sustentável e filantropia, colaboração destacada com organizações sem fins lucrativos. |""",
-
-    'C13 - Reputação': """| Nota | Descrição |
-|------|-----------|
-| 1 | Reportagens negativas frequentes na mídia, avaliações online predominantemente negativas (1-2 estrelas), problemas recorrentes de conformidade. |
-| 2 | Reportagens negativas ocasionais, avaliações abaixo da média (2-3 estrelas), questões esporádicas de conformidade. |
-| 3 | Raramente em mídia, avaliações medianas (3 estrelas), conformidade com normas básicas sem grandes problemas. |
-| 4 | Reportagens positivas frequentes, avaliações acima da média (4 estrelas), conformidade com todas as normas relevantes, boas práticas reconhecidas. |
-| 5 | Destaque positivo constante na mídia, avaliações muito altas (4-5 estrelas), conformidade exemplar, líder em boas práticas. |"""
-}
-
-
-# ===================================
-# 🚀 Cálculo PROMETHEE II
-# ===================================
-def calcular_promethee_sem_normalizar(df, criterios, objetivo, pesos, funcoes, parametros):
-    alternativas = df.index.tolist()
-    n = len(alternativas)
-    peso_total = sum(pesos.values())
-
-    # Inicializar matrizes
-    matriz_d = {crit: np.zeros((n, n)) for crit in criterios}
-    matriz_pref = {crit: np.zeros((n, n)) for crit in criterios}
-    matriz_agregada = np.zeros((n, n))
-
-    # Passo 1 e 2: calcular d(a,b) e aplicar F_j(a,b)
-    for c_idx, crit in enumerate(criterios):
-        for i, a in enumerate(alternativas):
-            for j, b in enumerate(alternativas):
-                if i == j:
-                    continue
-
-                # Diferença direta dos valores (sem normalizar)
-                d = df.loc[a, crit] - df.loc[b, crit]
-
-                # Inverter se critério for de minimização
-                if objetivo[crit] == 'Minimizado':
-                    d = -d
-
-                matriz_d[crit][i][j] = d
-
-                # Parâmetros q, p, s
-                q = parametros[crit].get('q', 0)
-                p = parametros[crit].get('p', 0)
-                s = parametros[crit].get('s', 1)
-                func = funcoes[crit]
-
-                # Aplicar F_j conforme tipo
-                if func == 'Usual':
-                    pref = 1 if d > 0 else 0
-                elif func == 'Quase-critério':
-                    pref = 1 if d > q else 0
-                elif func == 'Limiar de preferência':
-                    if d <= 0:
-                        pref = 0
-                    elif d <= p:
-                        pref = d / p
-                    else:
-                        pref = 1
-                elif func == 'Pseudo-critério':
-                    if d <= q:
-                        pref = 0
-                    elif d <= p:
-                        pref = 0.5
-                    else:
-                        pref = 1
-                elif func == 'Área de indiferença':
-                    if d <= q:
-                        pref = 0
-                    elif d <= p:
-                        pref = (d - q) / (p - q)
-                    else:
-                        pref = 1
-                elif func == 'Gaussiana':
-                    pref = 1 - math.exp(-(d ** 2) / (2 * s ** 2)) if d > 0 else 0
-                else:
-                    pref = 0
-
-                matriz_pref[crit][i][j] = pref
-                matriz_agregada[i][j] += pesos[crit] * pref
-
-    # Passo 3: matriz de preferência agregada (dividir pelo peso total)
-    matriz_agregada /= peso_total
-
-    # Passo 4: cálculo dos fluxos
-    fluxo_positivo = matriz_agregada.sum(axis=1) / (n - 1)
-    fluxo_negativo = matriz_agregada.sum(axis=0) / (n - 1)
-    fluxo_liquido = fluxo_positivo - fluxo_negativo
-
-    # Ranking final
-    resultado = pd.DataFrame({
-        'Fornecedor': alternativas,
-        'Fluxo Positivo (ϕ+)': fluxo_positivo,
-        'Fluxo Negativo (ϕ-)': fluxo_negativo,
-        'Fluxo Líquido (ϕ)': fluxo_liquido
-    })
-    resultado = resultado.sort_values('Fluxo Líquido (ϕ)', ascending=False)
-    resultado['Ranking'] = range(1, len(resultado) + 1)
-
-    return resultado, matriz_d, matriz_pref, matriz_agregada
-    
 # ===================================
 # Tela Inicial
 # ===================================
@@ -474,8 +306,6 @@ def tela_sistema():
                 parametros_preferencia
             )
         
-        n = len(resultado)
-        
         # Exibir resultados
         st.subheader("Resultados PROMETHEE II")
         
@@ -511,6 +341,9 @@ def tela_sistema():
         
         # Gráfico de barras
         st.subheader("Visualização do Fluxo Líquido")
+        # plotly só é importado quando o gráfico é desenhado
+        import plotly.express as px
+
         fig = px.bar(
             resultado,
             x='Fornecedor',
@@ -528,18 +361,22 @@ def tela_sistema():
         )
         st.plotly_chart(fig, use_container_width=True)
         
+        # As matrizes do motor vêm na ordem de df; aqui são exibidas na ordem do ranking
+        posicoes = df.index.get_indexer(resultado['Fornecedor'])
+        ordem = np.ix_(posicoes, posicoes)
+
         # Matriz normalizada
         st.subheader("Matriz de Diferenças d(a,b) por Critério")
         for crit in criterios_selecionados:
             st.markdown(f"**Critério: {crit}**")
-            df_dif = pd.DataFrame(matriz_d[crit],
+            df_dif = pd.DataFrame(matriz_d[crit][ordem],
                           index=resultado['Fornecedor'],
                           columns=resultado['Fornecedor'])
             st.dataframe(df_dif.style.format("{:.4f}").background_gradient(cmap='PuBu'))
 
         # Matriz de preferência agregada
         st.subheader("Matriz de Preferência Agregada")
-        df_pref = pd.DataFrame(pref_agregada, 
+        df_pref = pd.DataFrame(pref_agregada[ordem], 
                                index=resultado['Fornecedor'], 
                                columns=resultado['Fornecedor'])
         st.write("Matriz π(a, b) – Grau de preferência de a sobre b:")
@@ -547,10 +384,7 @@ def tela_sistema():
 
         # Matriz de Fluxo Líquido π(a,b) - π(b,a)
         st.subheader("Matriz de Fluxo Líquido Final (ϕ(a,b))")
-        fluxo_liquido_matriz = np.zeros((n, n))
-        for i in range(n):
-            for j in range(n):
-                fluxo_liquido_matriz[i][j] = pref_agregada[i][j] - pref_agregada[j][i]
+        fluxo_liquido_matriz = pref_agregada[ordem] - pref_agregada[ordem].T
         
         df_fluxo_liquido = pd.DataFrame(fluxo_liquido_matriz, 
                                         index=resultado['Fornecedor'], 
@@ -561,55 +395,12 @@ def tela_sistema():
        
         for crit in criterios_selecionados:
             st.markdown(f"**Critério: {crit}**")
-            pref_crit = np.zeros((n, n))
-            for i in range(n):
-                for j in range(n):
-                    d = df.loc[resultado['Fornecedor'].iloc[i], crit] - df.loc[resultado['Fornecedor'].iloc[j], crit]
-                    if objetivo[crit] == 'Minimizado':
-                        d = -d
-
-                    q = parametros_preferencia[crit].get('q', 0)
-                    p = parametros_preferencia[crit].get('p', 0)
-                    s = parametros_preferencia[crit].get('s', 1)
-                    func = funcoes_preferencia[crit]
-
-                    if func == 'Usual':
-                        pref = 1 if d > 0 else 0
-                    elif func == 'Quase-critério':
-                        pref = 1 if d > q else 0
-                    elif func == 'Limiar de preferência':
-                        if d <= 0:
-                            pref = 0
-                        elif d <= p:
-                            pref = d / p
-                        else:
-                            pref = 1
-                    elif func == 'Pseudo-critério':
-                        if d <= q:
-                            pref = 0
-                        elif d <= p:
-                            pref = 0.5
-                        else:
-                            pref = 1
-                    elif func == 'Área de indiferença':
-                        if d <= q:
-                            pref = 0
-                        elif d <= p:
-                            pref = (d - q) / (p - q)
-                        else:
-                            pref = 1
-                    elif func == 'Gaussiana':
-                        pref = 1 - math.exp(-(d ** 2) / (2 * s ** 2)) if d > 0 else 0
-                    else:
-                        pref = 0
-
-                    pref_crit[i][j] = pref
-
-        # Cria e exibe o DataFrame dentro do loop para cada critério
-        df_pi = pd.DataFrame(pref_crit,
-                         index=resultado['Fornecedor'],
-                         columns=resultado['Fornecedor'])
-        st.dataframe(df_pi.style.format("{:.4f}").background_gradient(cmap='OrRd'))
+            # π_j(a,b) do próprio motor: Usual/Quase-critério e Pseudo-critério chegam
+            # compactados (ver promethee/compactas.py) e são decodificados só aqui
+            df_pi = pd.DataFrame(matriz_pref[crit][ordem],
+                             index=resultado['Fornecedor'],
+                             columns=resultado['Fornecedor'])
+            st.dataframe(df_pi.style.format("{:.4f}").background_gradient(cmap='OrRd'))
 
 # ===================================
 # Roteamento entre telas
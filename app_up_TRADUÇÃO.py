@@ -3,10 +3,10 @@
 # ===================================
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import math
 import numpy as np
 
+from promethee import DESCRICAO_CRITERIOS, ESCALA_QUALITATIVA, calcular_promethee_sem_normalizar
+
 #quando feito colocar no terminal: pip install streamlit pandas plotly
 #streamlit run app_up_TRADUÇÃO.py
 
@@ -70,186 +70,10 @@ st.markdown("""
 # ===================================
 # Descrição dos Critérios e Escalas Qualitativas
 # ===================================
-descricao_criterios = {
-    'C1 - Custo / Cost': 'Valor monetário em uma moeda específica / Monetary value in a specific currency. (↓)',
-    'C2 - Qualidade / Quality': 'Avaliação subjetiva da qualidade com base em padrões de referência. (↑) / Subjective quality assessment based on benchmark standards. (↑)',
-    'C3 - Entrega / Delivery': 'Prazo de entrega em dias. (↓) / Delivery time in days. (↓)',
-    'C4 - Tecnologia / Technology': 'Nível de inovação e adoção de tecnologias avançadas. (↑) / Level of innovation and adoption of advanced technologies. (↑)',
-    'C5 - Custos ambientais / Environmental Costs': 'Custos ambientais em reais, como multas ou tratamentos. (↓) / Environmental costs in BRL, such as fines or treatment. (↓)',
-    'C6 - Projeto verde / Green Design': 'Grau de adoção de práticas sustentáveis no projeto. (↑) / Degree of adoption of sustainable practices in the project. (↑)',
-    'C7 - Gestão ambiental / Environmental Management': 'Efetividade do sistema de gestão ambiental. (↑) / Effectiveness of the environmental management system. (↑)',
-    'C8 - Partes interessadas / Stakeholders': 'Comprometimento com direitos e atendimento das partes interessadas. (↑) / Commitment to stakeholder rights and service. (↑)',
-    'C9 - Segurança e saúde no trabalho / Occupational Health and Safety': 'Taxa de acidentes ou incidentes ocupacionais. (↓) / Rate of workplace accidents or incidents. (↓)',
-    'C10 - Respeito pela política dos funcionários / Employee Policy Compliance': 'Cumprimento das políticas e direitos dos funcionários. (↑) / Compliance with employee policies and rights. (↑)',
-    'C11 - Gestão social / Social Management': 'Capacidade de implementar práticas de gestão social sustentável. (↑) / Capacity to implement sustainable social management practices. (↑)',
-    'C12 - Histórico de desempenho / Performance History': 'Número de anos em operação. (↑) / Number of years in operation. (↑)',
-    'C13 - Reputação / Reputation': 'Análise de mídia, avaliações e reconhecimentos. (↑) / Media analysis, reviews, and recognitions. (↑)',
-    'C14 - Logística / Logistics': 'Distância em quilômetros. (↓) / Distance in kilometers. (↓)'
-}
-
-escala_qualitativa = {
-      'C2 - Qualidade / Quality': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Produtos/serviços não atendem aos padrões de qualidade, resultando em retrabalho frequente e feedback negativo. / Products/services do not meet quality standards, leading to frequent rework and negative feedback. |
-| 2 | Produtos/serviços geralmente abaixo do padrão, com problemas ocasionais e feedback predominantemente negativo. / Products/services generally below standard, with occasional issues and mostly negative feedback. |
-| 3 | Produtos/serviços atendem ao padrão mínimo, com problemas ocasionais e feedback variado. / Products/services meet the minimum standard, with occasional problems and mixed feedback. |
-| 4 | Produtos/serviços atendem ou excedem padrões de qualidade, com feedback positivo e poucas rejeições. / Products/services meet or exceed quality standards, with positive feedback and few rejections. |
-| 5 | Produtos/serviços excepcionais, superando consistentemente os padrões, com feedback altamente positivo e mínimas rejeições. / Exceptional products/services, consistently exceeding standards, with highly positive feedback and minimal rejections. |
-""",
-
-    'C4 - Tecnologia / Technology': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Nenhuma tecnologia atual utilizada; processos manuais predominam. / No current technology used; manual processes dominate. |
-| 2 | Baixa adoção de tecnologia, com melhorias mínimas nos processos. / Low technology adoption, with minimal process improvements. |
-| 3 | Uso moderado de tecnologias conhecidas; eficiência padrão. / Moderate use of known technologies; standard efficiency. |
-| 4 | Alta adoção de tecnologias, promovendo ganho de eficiência. / High adoption of technologies, promoting efficiency gains. |
-| 5 | Utilização de tecnologias de ponta e inovação contínua. / Use of cutting-edge technologies and continuous innovation. |
-""",
-
-    'C6 - Projeto verde / Green Design': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Nenhuma preocupação com sustentabilidade no projeto. / No concern with sustainability in the project. |
-| 2 | Ações sustentáveis mínimas e pontuais. / Minimal and occasional sustainable actions. |
-| 3 | Algumas iniciativas sustentáveis em práticas ou materiais. / Some sustainable initiatives in practices or materials. |
-| 4 | Projeto incorpora várias práticas sustentáveis relevantes. / Project incorporates various relevant sustainable practices. |
-| 5 | Projeto fortemente orientado à sustentabilidade em todas as etapas. / Project strongly oriented to sustainability in all stages. |
-""",
-
-    'C7 - Gestão ambiental / Environmental Management': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Sem sistema de gestão ambiental estruturado. / No structured environmental management system. |
-| 2 | Sistema informal e pouco eficaz. / Informal and ineffective system. |
-| 3 | Sistema básico implementado com limitações. / Basic system implemented with limitations. |
-| 4 | Sistema bem estruturado e em conformidade com normas. / Well-structured system in compliance with standards. |
-| 5 | Sistema robusto, certificado e com melhoria contínua. / Robust, certified system with continuous improvement. |
-""",
+descricao_criterios = DESCRICAO_CRITERIOS
 
-    'C8 - Partes interessadas / Stakeholders': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Ignora interesses das partes envolvidas. / Ignores stakeholder interests. |
-| 2 | Responde de forma reativa e limitada. / Reactively and minimally responsive. |
-| 3 | Atendimento mínimo às partes interessadas. / Minimal stakeholder engagement. |
-| 4 | Compromisso com políticas de engajamento ativo. / Commitment to active engagement policies. |
-| 5 | Envolvimento transparente, ativo e responsável. / Transparent, active, and responsible stakeholder involvement. |
-""",
+escala_qualitativa = ESCALA_QUALITATIVA
 
-    'C10 - Respeito pela política dos funcionários / Employee Policy Compliance': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Não respeita normas trabalhistas básicas. / Does not respect basic labor standards. |
-| 2 | Apresenta falhas frequentes no cumprimento das normas. / Frequent failures in policy compliance. |
-| 3 | Cumpre requisitos mínimos exigidos por lei. / Complies with minimum legal requirements. |
-| 4 | Cumpre e monitora práticas e direitos dos funcionários. / Complies with and monitors employee rights and practices. |
-| 5 | Promove ambiente justo, seguro e participativo. / Promotes a fair, safe, and participatory environment. |
-""",
-
-    'C11 - Gestão social / Social Management': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Nenhuma ação voltada ao bem-estar social. / No action focused on social well-being. |
-| 2 | Práticas sociais reativas e pouco estruturadas. / Reactive and poorly structured social practices. |
-| 3 | Algumas práticas sociais implementadas. / Some social practices implemented. |
-| 4 | Políticas sociais definidas e em operação. / Defined and operational social policies. |
-| 5 | Gestão social estratégica, com forte impacto positivo. / Strategic social management with strong positive impact. |
-""",
-
-    'C13 - Reputação / Reputation': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Reputação muito negativa ou desconhecida. / Very negative or unknown reputation. |
-| 2 | Imagem desfavorável ou instável no mercado. / Unfavorable or unstable market image. |
-| 3 | Reputação aceitável, sem grandes destaques. / Acceptable reputation, no major highlights. |
-| 4 | Boa reputação com avaliações positivas consistentes. / Good reputation with consistent positive evaluations. |
-| 5 | Reputação excelente, reconhecida amplamente no setor. / Excellent reputation, widely recognized in the industry. |
-"""
-}
-
-# ===================================
-# Cálculo PROMETHEE II
-# ===================================
-def calcular_promethee_sem_normalizar(df, criterios, objetivo, pesos, funcoes, parametros):
-    alternativas = df.index.tolist()
-    n = len(alternativas)
-    peso_total = sum(pesos.values())
-
-    # Inicializar matrizes
-    matriz_d = {crit: np.zeros((n, n)) for crit in criterios}
-    matriz_pref = {crit: np.zeros((n, n)) for crit in criterios}
-    matriz_agregada = np.zeros((n, n))
-
-    # Passo 1 e 2: calcular d(a,b) e aplicar F_j(a,b)
-    for c_idx, crit in enumerate(criterios):
-        for i, a in enumerate(alternativas):
-            for j, b in enumerate(alternativas):
-                if i == j:
-                    continue
-
-                # Diferença direta dos valores (sem normalizar)
-                d = df.loc[a, crit] - df.loc[b, crit]
-
-                # Inverter se critério for de minimização
-                if objetivo[crit] == 'Minimizado':
-                    d = -d
-
-                matriz_d[crit][i][j] = d
-
-                # Parâmetros q, p, s
-                q = parametros[crit].get('q', 0)
-                p = parametros[crit].get('p', 0)
-                s = parametros[crit].get('s', 1)
-                func = funcoes[crit]
-
-                # Aplicar F_j conforme tipo
-                if func == 'Usual':
-                    pref = 1 if d > 0 else 0
-                elif func == 'Quase-critério':
-                    pref = 1 if d > q else 0
-                elif func == 'Limiar de preferência':
-                    if d <= 0:
-                        pref = 0
-                    elif d <= p:
-                        pref = d / p
-                    else:
-                        pref = 1
-                elif func == 'Pseudo-critério':
-                    if d <= q:
-                        pref = 0
-                    elif d <= p:
-                        pref = 0.5
-                    else:
-                        pref = 1
-                elif func == 'Área de indiferença':
-                    if d <= q:
-                        pref = 0
-                    elif d <= p:
-                        pref = (d - q) / (p - q)
-                    else:
-                        pref = 1
-                elif func == 'Gaussiana':
-                    pref = 1 - math.exp(-(d ** 2) / (2 * s ** 2)) if d > 0 else 0
-                else:
-                    pref = 0
-
-                matriz_pref[crit][i][j] = pref
-                matriz_agregada[i][j] += pesos[crit] * pref
-
-    # Passo 3: matriz de preferência agregada (dividir pelo peso total)
-    matriz_agregada /= peso_total
-
-    # Passo 4: cálculo dos fluxos
-    fluxo_positivo = matriz_agregada.sum(axis=1) / (n - 1)
-    fluxo_negativo = matriz_agregada.sum(axis=0) / (n - 1)
-    fluxo_liquido = fluxo_positivo - fluxo_negativo
-
-    # Ranking final
-    resultado = pd.DataFrame({
-        'Fornecedor': alternativas,
-        'Fluxo Positivo (ϕ+)': fluxo_positivo,
-        'Fluxo Negativo (ϕ-)': fluxo_negativo,
-        'Fluxo Líquido (ϕ)': fluxo_liquido
-    })
-    resultado = resultado.sort_values('Fluxo Líquido (ϕ)', ascending=False)
-    resultado['Ranking'] = range(1, len(resultado) + 1)
-
-    return resultado, matriz_d, matriz_pref, matriz_agregada
-    
 # ===================================
 # Tela Inicial
 # ===================================
@@ -478,8 +302,6 @@ def tela_sistema():
                 parametros_preferencia
             )
         
-        n = len(resultado)
-        
         # Exibir resultados
         st.subheader("Resultados PROMETHEE II / / PROMETHEE II Results")
         
@@ -515,6 +337,9 @@ def tela_sistema():
         
         # Gráfico de barras
         st.subheader("Visualização do Fluxo Líquido / Net Flow Chart")
+        # plotly só é importado quando o gráfico é desenhado
+        import plotly.express as px
+
         fig = px.bar(
             resultado,
             x='Fornecedor',
@@ -532,18 +357,22 @@ def tela_sistema():
         )
         st.plotly_chart(fig, use_container_width=True)
         
+        # As matrizes do motor vêm na ordem de df; aqui são exibidas na ordem do ranking
+        posicoes = df.index.get_indexer(resultado['Fornecedor'])
+        ordem = np.ix_(posicoes, posicoes)
+
         # Matriz normalizada
         st.subheader("Matriz de Diferenças d(a,b) por Critério")
         for crit in criterios_selecionados:
             st.markdown(f"**Critério: {crit}**")
-            df_dif = pd.DataFrame(matriz_d[crit],
+            df_dif = pd.DataFrame(matriz_d[crit][ordem],
                           index=resultado['Fornecedor'],
                           columns=resultado['Fornecedor'])
             st.dataframe(df_dif.style.format("{:.4f}").background_gradient(cmap='PuBu'))
 
         # Matriz de preferência agregada
         st.subheader("Matriz de Preferência Agregada")
-        df_pref = pd.DataFrame(pref_agregada, 
+        df_pref = pd.DataFrame(pref_agregada[ordem], 
                                index=resultado['Fornecedor'], 
                                columns=resultado['Fornecedor'])
         st.write("Matriz π(a, b) – Grau de preferência de a sobre b:")
@@ -551,10 +380,7 @@ def tela_sistema():
 
         # Matriz de Fluxo Líquido π(a,b) - π(b,a)
         st.subheader("Matriz de Fluxo Líquido Final (ϕ(a,b))")
-        fluxo_liquido_matriz = np.zeros((n, n))
-        for i in range(n):
-            for j in range(n):
-                fluxo_liquido_matriz[i][j] = pref_agregada[i][j] - pref_agregada[j][i]
+        fluxo_liquido_matriz = pref_agregada[ordem] - pref_agregada[ordem].T
         
         df_fluxo_liquido = pd.DataFrame(fluxo_liquido_matriz, 
                                         index=resultado['Fornecedor'], 
@@ -565,55 +391,12 @@ def tela_sistema():
        
         for crit in criterios_selecionados:
             st.markdown(f"**Critério: {crit}**")
-            pref_crit = np.zeros((n, n))
-            for i in range(n):
-                for j in range(n):
-                    d = df.loc[resultado['Fornecedor'].iloc[i], crit] - df.loc[resultado['Fornecedor'].iloc[j], crit]
-                    if objetivo[crit] == 'Minimizado':
-                        d = -d
-
-                    q = parametros_preferencia[crit].get('q', 0)
-                    p = parametros_preferencia[crit].get('p', 0)
-                    s = parametros_preferencia[crit].get('s', 1)
-                    func = funcoes_preferencia[crit]
-
-                    if func == 'Usual':
-                        pref = 1 if d > 0 else 0
-                    elif func == 'Quase-critério':
-                        pref = 1 if d > q else 0
-                    elif func == 'Limiar de preferência':
-                        if d <= 0:
-                            pref = 0
-                        elif d <= p:
-                            pref = d / p
-                        else:
-                            pref = 1
-                    elif func == 'Pseudo-critério':
-                        if d <= q:
-                            pref = 0
-                        elif d <= p:
-                            pref = 0.5
-                        else:
-                            pref = 1
-                    elif func == 'Área de indiferença':
-                        if d <= q:
-                            pref = 0
-                        elif d <= p:
-                            pref = (d - q) / (p - q)
-                        else:
-                            pref = 1
-                    elif func == 'Gaussiana':
-                        pref = 1 - math.exp(-(d ** 2) / (2 * s ** 2)) if d > 0 else 0
-                    else:
-                        pref = 0
-
-                    pref_crit[i][j] = pref
-
-        # Cria e exibe o DataFrame dentro do loop para cada critério
-        df_pi = pd.DataFrame(pref_crit,
-                         index=resultado['Fornecedor'],
-                         columns=resultado['Fornecedor'])
-        st.dataframe(df_pi.style.format("{:.4f}").background_gradient(cmap='OrRd'))
+            # π_j(a,b) do próprio motor: Usual/Quase-critério e Pseudo-critério chegam
+            # compactados (ver promethee/compactas.py) e são decodificados só aqui
+            df_pi = pd.DataFrame(matriz_pref[crit][ordem],
+                             index=resultado['Fornecedor'],
+                             columns=resultado['Fornecedor'])
+            st.dataframe(df_pi.style.format("{:.4f}").background_gradient(cmap='OrRd'))
 
 # ===================================
 # Roteamento entre telas
@@ -3,10 +3,13 @@
 # ===================================
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import math
 import numpy as np
 
+from promethee import (DESCRICAO_CRITERIOS, ESCALA_QUALITATIVA, EXTENSOES_SUPORTADAS, MATRIZES_DETALHE, Medicao,
+                       PrometheeIncremental, bloco_detalhe, calcular_aceitabilidade,
+                       calcular_intervalos_estabilidade, fase, importar_matriz_desempenho, interpretar_filtros)
+
 #quando feito colocar no terminal: pip install streamlit pandas plotly
 #streamlit run app_up_TRADUÇÃO.py
 
@@ -70,186 +73,10 @@ st.markdown("""
 # ===================================
 # Descrição dos Critérios e Escalas Qualitativas
 # ===================================
-descricao_criterios = {
-    'C1 - Custo / Cost': 'Valor monetário em uma moeda específica / Monetary value in a specific currency. (↓)',
-    'C2 - Qualidade / Quality': 'Avaliação subjetiva da qualidade com base em padrões de referência. (↑) / Subjective quality assessment based on benchmark standards. (↑)',
-    'C3 - Entrega / Delivery': 'Prazo de entrega em dias. (↓) / Delivery time in days. (↓)',
-    'C4 - Tecnologia / Technology': 'Nível de inovação e adoção de tecnologias avançadas. (↑) / Level of innovation and adoption of advanced technologies. (↑)',
-    'C5 - Custos ambientais / Environmental Costs': 'Custos ambientais em reais, como multas ou tratamentos. (↓) / Environmental costs in BRL, such as fines or treatment. (↓)',
-    'C6 - Projeto verde / Green Design': 'Grau de adoção de práticas sustentáveis no projeto. (↑) / Degree of adoption of sustainable practices in the project. (↑)',
-    'C7 - Gestão ambiental / Environmental Management': 'Efetividade do sistema de gestão ambiental. (↑) / Effectiveness of the environmental management system. (↑)',
-    'C8 - Partes interessadas / Stakeholders': 'Comprometimento com direitos e atendimento das partes interessadas. (↑) / Commitment to stakeholder rights and service. (↑)',
-    'C9 - Segurança e saúde no trabalho / Occupational Health and Safety': 'Taxa de acidentes ou incidentes ocupacionais. (↓) / Rate of workplace accidents or incidents. (↓)',
-    'C10 - Respeito pela política dos funcionários / Employee Policy Compliance': 'Cumprimento das políticas e direitos dos funcionários. (↑) / Compliance with employee policies and rights. (↑)',
-    'C11 - Gestão social / Social Management': 'Capacidade de implementar práticas de gestão social sustentável. (↑) / Capacity to implement sustainable social management practices. (↑)',
-    'C12 - Histórico de desempenho / Performance History': 'Número de anos em operação. (↑) / Number of years in operation. (↑)',
-    'C13 - Reputação / Reputation': 'Análise de mídia, avaliações e reconhecimentos. (↑) / Media analysis, reviews, and recognitions. (↑)',
-    'C14 - Logística / Logistics': 'Distância em quilômetros. (↓) / Distance in kilometers. (↓)'
-}
-
-escala_qualitativa = {
-      'C2 - Qualidade / Quality': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Produtos/serviços não atendem aos padrões de qualidade, resultando em retrabalho frequente e feedback negativo. / Products/services do not meet quality standards, leading to frequent rework and negative feedback. |
-| 2 | Produtos/serviços geralmente abaixo do padrão, com problemas ocasionais e feedback predominantemente negativo. / Products/services generally below standard, with occasional issues and mostly negative feedback. |
-| 3 | Produtos/serviços atendem ao padrão mínimo, com problemas ocasionais e feedback variado. / Products/services meet the minimum standard, with occasional problems and mixed feedback. |
-| 4 | Produtos/serviços atendem ou excedem padrões de qualidade, com feedback positivo e poucas rejeições. / Products/services meet or exceed quality standards, with positive feedback and few rejections. |
-| 5 | Produtos/serviços excepcionais, superando consistentemente os padrões, com feedback altamente positivo e mínimas rejeições. / Exceptional products/services, consistently exceeding standards, with highly positive feedback and minimal rejections. |
-""",
-
-    'C4 - Tecnologia / Technology': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Nenhuma tecnologia atual utilizada; processos manuais predominam. / No current technology used; manual processes dominate. |
-| 2 | Baixa adoção de tecnologia, com melhorias mínimas nos processos. / Low technology adoption, with minimal process improvements. |
-| 3 | Uso moderado de tecnologias conhecidas; eficiência padrão. / Moderate use of known technologies; standard efficiency. |
-| 4 | Alta adoção de tecnologias, promovendo ganho de eficiência. / High adoption of technologies, promoting efficiency gains. |
-| 5 | Utilização de tecnologias de ponta e inovação contínua. / Use of cutting-edge technologies and continuous innovation. |
-""",
-
-    'C6 - Projeto verde / Green Design': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Nenhuma preocupação com sustentabilidade no projeto. / No concern with sustainability in the project. |
-| 2 | Ações sustentáveis mínimas e pontuais. / Minimal and occasional sustainable actions. |
-| 3 | Algumas iniciativas sustentáveis em práticas ou materiais. / Some sustainable initiatives in practices or materials. |
-| 4 | Projeto incorpora várias práticas sustentáveis relevantes. / Project incorporates various relevant sustainable practices. |
-| 5 | Projeto fortemente orientado à sustentabilidade em todas as etapas. / Project strongly oriented to sustainability in all stages. |
-""",
-
-    'C7 - Gestão ambiental / Environmental Management': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Sem sistema de gestão ambiental estruturado. / No structured environmental management system. |
-| 2 | Sistema informal e pouco eficaz. / Informal and ineffective system. |
-| 3 | Sistema básico implementado com limitações. / Basic system implemented with limitations. |
-| 4 | Sistema bem estruturado e em conformidade com normas. / Well-structured system in compliance with standards. |
-| 5 | Sistema robusto, certificado e com melhoria contínua. / Robust, certified system with continuous improvement. |
-""",
-
-    'C8 - Partes interessadas / Stakeholders': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Ignora interesses das partes envolvidas. / Ignores stakeholder interests. |
-| 2 | Responde de forma reativa e limitada. / Reactively and minimally responsive. |
-| 3 | Atendimento mínimo às partes interessadas. / Minimal stakeholder engagement. |
-| 4 | Compromisso com políticas de engajamento ativo. / Commitment to active engagement policies. |
-| 5 | Envolvimento transparente, ativo e responsável. / Transparent, active, and responsible stakeholder involvement. |
-""",
-
-    'C10 - Respeito pela política dos funcionários / Employee Policy Compliance': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Não respeita normas trabalhistas básicas. / Does not respect basic labor standards. |
-| 2 | Apresenta falhas frequentes no cumprimento das normas. / Frequent failures in policy compliance. |
-| 3 | Cumpre requisitos mínimos exigidos por lei. / Complies with minimum legal requirements. |
-| 4 | Cumpre e monitora práticas e direitos dos funcionários. / Complies with and monitors employee rights and practices. |
-| 5 | Promove ambiente justo, seguro e participativo. / Promotes a fair, safe, and participatory environment. |
-""",
-
-    'C11 - Gestão social / Social Management': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Nenhuma ação voltada ao bem-estar social. / No action focused on social well-being. |
-| 2 | Práticas sociais reativas e pouco estruturadas. / Reactive and poorly structured social practices. |
-| 3 | Algumas práticas sociais implementadas. / Some social practices implemented. |
-| 4 | Políticas sociais definidas e em operação. / Defined and operational social policies. |
-| 5 | Gestão social estratégica, com forte impacto positivo. / Strategic social management with strong positive impact. |
-""",
-
-    'C13 - Reputação / Reputation': """| Nota | Descrição (PT / EN) |
-|------|----------------------|
-| 1 | Reputação muito negativa ou desconhecida. / Very negative or unknown reputation. |
-| 2 | Imagem desfavorável ou instável no mercado. / Unfavorable or unstable market image. |
-| 3 | Reputação aceitável, sem grandes destaques. / Acceptable reputation, no major highlights. |
-| 4 | Boa reputação com avaliações positivas consistentes. / Good reputation with consistent positive evaluations. |
-| 5 | Reputação excelente, reconhecida amplamente no setor. / Excellent reputation, widely recognized in the industry. |
-"""
-}
-
-# ===================================
-# Cálculo PROMETHEE II
-# ===================================
-def calcular_promethee_sem_normalizar(df, criterios, objetivo, pesos, funcoes, parametros):
-    alternativas = df.index.tolist()
-    n = len(alternativas)
-    peso_total = sum(pesos.values())
-
-    # Inicializar matrizes
-    matriz_d = {crit: np.zeros((n, n)) for crit in criterios}
-    matriz_pref = {crit: np.zeros((n, n)) for crit in criterios}
-    matriz_agregada = np.zeros((n, n))
-
-    # Passo 1 e 2: calcular d(a,b) e aplicar F_j(a,b)
-    for c_idx, crit in enumerate(criterios):
-        for i, a in enumerate(alternativas):
-            for j, b in enumerate(alternativas):
-                if i == j:
-                    continue
-
-                # Diferença direta dos valores (sem normalizar)
-                d = df.loc[a, crit] - df.loc[b, crit]
-
-                # Inverter se critério for de minimização
-                if objetivo[crit] == 'Minimizado':
-                    d = -d
-
-                matriz_d[crit][i][j] = d
-
-                # Parâmetros q, p, s
-                q = parametros[crit].get('q', 0)
-                p = parametros[crit].get('p', 0)
-                s = parametros[crit].get('s', 1)
-                func = funcoes[crit]
-
-                # Aplicar F_j conforme tipo
-                if func == 'Usual':
-                    pref = 1 if d > 0 else 0
-                elif func == 'Quase-critério':
-                    pref = 1 if d > q else 0
-                elif func == 'Limiar de preferência':
-                    if d <= 0:
-                        pref = 0
-                    elif d <= p:
-                        pref = d / p
-                    else:
-                        pref = 1
-                elif func == 'Pseudo-critério':
-                    if d <= q:
-                        pref = 0
-                    elif d <= p:
-                        pref = 0.5
-                    else:
-                        pref = 1
-                elif func == 'Área de indiferença':
-                    if d <= q:
-                        pref = 0
-                    elif d <= p:
-                        pref = (d - q) / (p - q)
-                    else:
-                        pref = 1
-                elif func == 'Gaussiana':
-                    pref = 1 - math.exp(-(d ** 2) / (2 * s ** 2)) if d > 0 else 0
-                else:
-                    pref = 0
-
-                matriz_pref[crit][i][j] = pref
-                matriz_agregada[i][j] += pesos[crit] * pref
+descricao_criterios = DESCRICAO_CRITERIOS
 
-    # Passo 3: matriz de preferência agregada (dividir pelo peso total)
-    matriz_agregada /= peso_total
+escala_qualitativa = ESCALA_QUALITATIVA
 
-    # Passo 4: cálculo dos fluxos
-    fluxo_positivo = matriz_agregada.sum(axis=1) / (n - 1)
-    fluxo_negativo = matriz_agregada.sum(axis=0) / (n - 1)
-    fluxo_liquido = fluxo_positivo - fluxo_negativo
-
-    # Ranking final
-    resultado = pd.DataFrame({
-        'Fornecedor': alternativas,
-        'Fluxo Positivo (ϕ+)': fluxo_positivo,
-        'Fluxo Negativo (ϕ-)': fluxo_negativo,
-        'Fluxo Líquido (ϕ)': fluxo_liquido
-    })
-    resultado = resultado.sort_values('Fluxo Líquido (ϕ)', ascending=False)
-    resultado['Ranking'] = range(1, len(resultado) + 1)
-
-    return resultado, matriz_d, matriz_pref, matriz_agregada
-    
 # ===================================
 # Tela Inicial
 # ===================================
@@ -286,6 +113,14 @@ def tela_inicial():
 # ===================================
 # Tela do Sistema PROMETHEE II
 # ===================================
+# Linhas/colunas por página nas matrizes de detalhe e pares nas relações de preferência
+LIMITE_LINHAS_DETALHE = 25
+# Acima disso o ranking abre mostrando só os primeiros e os últimos fornecedores
+LIMITE_RANKING_COMPLETO = 200
+# Sorteios e variação dos pesos (±) na análise de Monte Carlo
+AMOSTRAS_MONTE_CARLO = 10000
+VARIACAO_MONTE_CARLO = 0.2
+
 def tela_sistema():
     st.title("Decision Support System for the Selection of Sustainable Suppliers - PROMETHEE II")
     
@@ -307,20 +142,58 @@ def tela_sistema():
                     'Fornecedor D / Supplier D', 'Fornecedor E / Supplier E', 'Fornecedor F / Supplier F']
     criterios = list(descricao_criterios.keys())
     criterios_qualitativos = list(escala_qualitativa.keys())
-    
+
+    # Importação opcional da matriz de desempenho (fornecedores nas linhas, critérios nas colunas)
+    arquivo = st.file_uploader(
+        "Importar matriz de desempenho (CSV, XLSX ou Parquet) / Import performance matrix (CSV, XLSX or Parquet)",
+        type=list(EXTENSOES_SUPORTADAS)
+    )
+    importada = None
+    origem = None
+    if arquivo is not None:
+        # Filtros aplicados durante a leitura, antes de os dados chegarem ao PROMETHEE
+        texto_filtros = st.text_input(
+            "Filtros do catálogo (opcional) / Catalog filters (optional)",
+            placeholder="Regiao == Sul; C1 <= 1000",
+            help="Colunas do arquivo ou critérios, separados por ';'. Operadores: == != < <= > >="
+        )
+        try:
+            filtros = interpretar_filtros(texto_filtros)
+            importada, mapeamento = importar_matriz_desempenho(arquivo.getvalue(), arquivo.name, criterios, filtros)
+        except (ValueError, ImportError) as erro:
+            st.error(f"Não foi possível importar {arquivo.name} / Could not import {arquivo.name}: {erro}")
+            st.stop()
+        if importada.empty:
+            st.warning("Nenhum fornecedor atende aos filtros / No supplier matches the filters.")
+            st.stop()
+        fornecedores = importada.index.tolist()
+        # file_id muda a cada envio: um arquivo editado com o mesmo nome e tamanho
+        # não reaproveita a grade salva do envio anterior
+        origem = (arquivo.file_id, tuple(filtros))
+        st.success(
+            f"{len(importada)} fornecedores importados / suppliers imported. Colunas / Columns: "
+            + "; ".join(f"{coluna} → {crit}" for coluna, crit in mapeamento.items())
+        )
+        if 'ingestao' in importada.attrs:
+            ingestao = importada.attrs['ingestao']
+            st.caption(
+                f"{ingestao['linhas_lidas']:,} linhas lidas, {ingestao['linhas_mantidas']:,} mantidas, "
+                f"{ingestao['linhas_por_segundo']:,.0f} linhas/s / rows read, kept, rows/s"
+            )
+
     col1, col2 = st.columns(2)
     with col1:
         fornecedores_selecionados = st.multiselect(
             "Selecione os fornecedores / Select the suppliers:",
             fornecedores,
-            default=fornecedores[:3]
+            default=fornecedores if importada is not None else fornecedores[:3]
         )
     
     with col2:
         criterios_selecionados = st.multiselect(
             "Selecione os critérios / Select the criteria:",
             criterios,
-            default=criterios[:3]
+            default=importada.columns.tolist() if importada is not None else criterios[:3]
         )
     
     if len(fornecedores_selecionados) < 2:
@@ -338,97 +211,95 @@ def tela_sistema():
     objetivo = {}
     funcoes_preferencia = {}
     parametros_preferencia = {}
-    desempenho = {forn: {} for forn in fornecedores_selecionados}
     
-    for criterio in criterios_selecionados:
-        with st.expander(f"Configuração do critério: {criterio}"):
-            st.info(descricao_criterios[criterio])
-            
-            if criterio in escala_qualitativa:
-                st.markdown("**Escala Qualitativa:**")
-                st.markdown(escala_qualitativa[criterio])
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                pesos[criterio] = st.number_input(
-                    f"Peso do critério {criterio}",
-                    min_value=0.0,
-                    value=1.0,
-                    step=0.1,
-                    key=f"peso_{criterio}"
-                )
-            
-            with col2:
-                objetivo[criterio] = st.radio(
-                    f"O critério {criterio} deve ser:",
-                    ['Maximizado', 'Minimizado'],
-                    index=0 if '↓' not in descricao_criterios[criterio] else 1,
-                    horizontal=True,
-                    key=f"objetivo_{criterio}"
-                )
-            
-            with col3:
-                funcoes_preferencia[criterio] = st.selectbox(
-                    f"Função de preferência para {criterio}",
-                    ['Usual', 'Quase-critério', 'Limiar de preferência', 
-                     'Pseudo-critério', 'Área de indiferença', 'Gaussiana'],
-                    key=f"funcao_{criterio}"
-                )
-            
-            # Parâmetros específicos para cada função
-            parametros = {}
-            func = funcoes_preferencia[criterio]
-            
-            if func in ['Quase-critério', 'Pseudo-critério', 'Área de indiferença']:
-                parametros['q'] = st.number_input(
-                    f"Limiar de indiferença (q) para {criterio}",
-                    min_value=0.0,
-                    value=0.1,
-                    step=0.01,
-                    key=f"q_{criterio}"
-                )
-            
-            if func in ['Limiar de preferência', 'Pseudo-critério', 'Área de indiferença']:
-                parametros['p'] = st.number_input(
-                    f"Limiar de preferência (p) para {criterio}",
-                    min_value=0.0,
-                    value=0.5,
-                    step=0.01,
-                    key=f"p_{criterio}"
-                )
-            
-            if func == 'Gaussiana':
-                parametros['s'] = st.number_input(
-                    f"Parâmetro s (desvio padrão) para {criterio}",
-                    min_value=0.01,
-                    value=0.5,
-                    step=0.01,
-                    key=f"s_{criterio}"
-                )
-            
-            parametros_preferencia[criterio] = parametros
-            
-            # Entrada de desempenho dos fornecedores
-            st.markdown("**Avaliação dos fornecedores:**")
-            
-            if criterio in criterios_qualitativos:
-                for forn in fornecedores_selecionados:
-                    desempenho[forn][criterio] = st.slider(
-                        f"{forn} no critério {criterio} (1-5)",
-                        1, 5, 3,
-                        key=f"aval_{forn}_{criterio}"
+    # As edições ficam pendentes no formulário e são aplicadas juntas em uma única reexecução
+    with st.form("configuracao_criterios"):
+        for criterio in criterios_selecionados:
+            with st.expander(f"Configuração do critério: {criterio}"):
+                st.info(descricao_criterios[criterio])
+
+                if criterio in escala_qualitativa:
+                    st.markdown("**Escala Qualitativa:**")
+                    st.markdown(escala_qualitativa[criterio])
+
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    pesos[criterio] = st.number_input(
+                        f"Peso do critério {criterio}",
+                        min_value=0.0,
+                        value=1.0,
+                        step=0.1,
+                        key=f"peso_{criterio}"
                     )
-            else:
-                cols = st.columns(len(fornecedores_selecionados))
-                for i, forn in enumerate(fornecedores_selecionados):
-                    with cols[i]:
-                        desempenho[forn][criterio] = st.number_input(
-                            f"{forn}",
-                            min_value=0.0,
-                            step=0.1,
-                            key=f"aval_{forn}_{criterio}"
-                        )
+
+                with col2:
+                    objetivo[criterio] = st.radio(
+                        f"O critério {criterio} deve ser:",
+                        ['Maximizado', 'Minimizado'],
+                        index=0 if '↓' not in descricao_criterios[criterio] else 1,
+                        horizontal=True,
+                        key=f"objetivo_{criterio}"
+                    )
+
+                with col3:
+                    funcoes_preferencia[criterio] = st.selectbox(
+                        f"Função de preferência para {criterio}",
+                        ['Usual', 'Quase-critério', 'Limiar de preferência',
+                         'Pseudo-critério', 'Área de indiferença', 'Gaussiana'],
+                        key=f"funcao_{criterio}"
+                    )
+
+                # Dentro do formulário os campos não reagem à função escolhida antes do envio,
+                # então q, p e s ficam sempre visíveis e só os usados pela função entram no cálculo
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    q = st.number_input(
+                        f"Limiar de indiferença (q) para {criterio}",
+                        min_value=0.0,
+                        value=0.1,
+                        step=0.01,
+                        help="Quase-critério, Pseudo-critério, Área de indiferença",
+                        key=f"q_{criterio}"
+                    )
+
+                with col2:
+                    p = st.number_input(
+                        f"Limiar de preferência (p) para {criterio}",
+                        min_value=0.0,
+                        value=0.5,
+                        step=0.01,
+                        help="Limiar de preferência, Pseudo-critério, Área de indiferença",
+                        key=f"p_{criterio}"
+                    )
+
+                with col3:
+                    s = st.number_input(
+                        f"Parâmetro s (desvio padrão) para {criterio}",
+                        min_value=0.01,
+                        value=0.5,
+                        step=0.01,
+                        help="Gaussiana",
+                        key=f"s_{criterio}"
+                    )
+
+                # Parâmetros específicos para cada função
+                parametros = {}
+                func = funcoes_preferencia[criterio]
+
+                if func in ['Quase-critério', 'Pseudo-critério', 'Área de indiferença']:
+                    parametros['q'] = q
+
+                if func in ['Limiar de preferência', 'Pseudo-critério', 'Área de indiferença']:
+                    parametros['p'] = p
+
+                if func == 'Gaussiana':
+                    parametros['s'] = s
+
+                parametros_preferencia[criterio] = parametros
+
+        st.form_submit_button("Aplicar configuração / Apply settings")
     
     # Validação dos parâmetros
     for crit in criterios_selecionados:
@@ -444,9 +315,6 @@ def tela_sistema():
             st.error(f"Para o critério {crit}, o parâmetro s deve ser POSITIVO")
             st.stop()
     
-    # Criar dataframe de desempenho
-    df = pd.DataFrame(desempenho).T
-    
     # Tabela resumo dos critérios
     st.subheader("Resumo dos Critérios Configurados")
     
@@ -462,30 +330,181 @@ def tela_sistema():
     
     st.dataframe(resumo_criterios)
     
-    # Exibir matriz de desempenho
-    st.subheader("Matriz de Desempenho")
-    st.dataframe(df.style.background_gradient(cmap='Blues'))
+    # Grade, cálculo e resultados ficam em um fragmento: interações nessa parte não reexecutam a tela toda
+    secao_desempenho_e_resultados(fornecedores, criterios, criterios_qualitativos, fornecedores_selecionados, criterios_selecionados,
+                                  pesos, objetivo, funcoes_preferencia, parametros_preferencia, importada, origem)
+
+
+# ===================================
+# Desempenho e Resultados (fragmento)
+# ===================================
+@st.fragment
+def secao_desempenho_e_resultados(*args, **kwargs):
+    # Cada execução do fragmento é medida por fase; com o diagnóstico ligado na
+    # barra lateral, o pico de memória também é medido e a tabela é exibida
+    diagnostico = st.session_state.get('diagnostico', False)
+    with Medicao('Calcular Ranking', memoria=diagnostico) as medicao:
+        desempenho_e_resultados(*args, **kwargs)
+    if diagnostico:
+        painel_diagnostico(medicao)
+
+
+def painel_diagnostico(medicao):
+    with st.sidebar:
+        st.markdown("**Diagnóstico de desempenho / Performance diagnostics**")
+        fases = pd.DataFrame(medicao.fases + [{'fase': 'total', 'nivel': 0, 'chamadas': 1,
+                                               'segundos': medicao.segundos, 'pico_mb': medicao.pico_mb}])
+        fases['fase'] = ['\u2003' * nivel + nome for nivel, nome in zip(fases['nivel'], fases['fase'])]
+        fases['ms'] = fases['segundos'] * 1000
+        st.dataframe(
+            fases[['fase', 'chamadas', 'ms', 'pico_mb']].rename(columns={'pico_mb': 'pico (MB)'})
+            .style.format({'ms': "{:.1f}", 'pico (MB)': "{:.2f}"}, na_rep='-'),
+            hide_index=True
+        )
+        st.caption("Pico de memória medido com tracemalloc, que deixa o cálculo mais lento enquanto o diagnóstico está ligado. / Peak memory is measured with tracemalloc, which slows the run while diagnostics are on.")
+
+
+def desempenho_e_resultados(fornecedores, criterios, criterios_qualitativos, fornecedores_selecionados, criterios_selecionados,
+                            pesos, objetivo, funcoes_preferencia, parametros_preferencia, importada=None, origem=None):
+    with fase('entrada'):
+        # Matriz de desempenho editável: um único componente para todos os pares
+        st.subheader("Matriz de Desempenho / Performance Matrix")
+        st.write("Critérios qualitativos usam a escala 1-5; os quantitativos aceitam valores maiores ou iguais a zero. / Qualitative criteria use the 1-5 scale; quantitative ones accept values greater than or equal to zero.")
+
+        # Valores de todos os fornecedores × critérios, preservados entre seleções
+        # e recriados quando um arquivo é importado ou removido
+        if 'desempenho_salvo' not in st.session_state or st.session_state.get('desempenho_origem') != origem:
+            salvo = pd.DataFrame(
+                {crit: [3 if crit in criterios_qualitativos else 0.0] * len(fornecedores) for crit in criterios},
+                index=fornecedores
+            )
+            if importada is not None:
+                for crit in importada.columns:
+                    valores = importada[crit]
+                    # Notas inteiras continuam inteiras; notas fracionárias são barradas na validação
+                    inteiras = crit in criterios_qualitativos and (valores % 1 == 0).all()
+                    salvo[crit] = valores.astype(int) if inteiras else valores
+            st.session_state['desempenho_salvo'] = salvo
+            st.session_state['desempenho_origem'] = origem
+            st.session_state['desempenho_selecao'] = None
+        salvo = st.session_state['desempenho_salvo']
+
+        # A grade só é reconstruída quando a seleção muda; as edições ficam no estado do componente
+        selecao = (tuple(fornecedores_selecionados), tuple(criterios_selecionados))
+        if st.session_state.get('desempenho_selecao') != selecao:
+            st.session_state['desempenho_selecao'] = selecao
+            st.session_state['desempenho_base'] = salvo.loc[fornecedores_selecionados, criterios_selecionados].copy()
+            st.session_state['desempenho_versao'] = st.session_state.get('desempenho_versao', 0) + 1
+
+        configuracao_colunas = {}
+        for crit in criterios_selecionados:
+            if crit in criterios_qualitativos:
+                configuracao_colunas[crit] = st.column_config.NumberColumn(
+                    crit, help=descricao_criterios[crit], min_value=1, max_value=5, step=1, required=True
+                )
+            else:
+                configuracao_colunas[crit] = st.column_config.NumberColumn(
+                    crit, help=descricao_criterios[crit], min_value=0.0, step=0.1, required=True
+                )
+
+        df = st.data_editor(
+            st.session_state['desempenho_base'],
+            column_config=configuracao_colunas,
+            num_rows="fixed",
+            key=f"grade_desempenho_{st.session_state['desempenho_versao']}"
+        )
+
+        # Validação por coluna (células apagadas ou fora da escala)
+        for crit in criterios_selecionados:
+            coluna = df[crit]
+            if coluna.isna().any():
+                st.error(f"Preencha todos os valores do critério {crit} / Fill in every value for criterion {crit}")
+                st.stop()
+            if crit in criterios_qualitativos and not (coluna.between(1, 5) & (coluna % 1 == 0)).all():
+                st.error(f"O critério {crit} usa notas inteiras de 1 a 5 / Criterion {crit} uses integer scores from 1 to 5")
+                st.stop()
+            if crit not in criterios_qualitativos and (coluna < 0).any():
+                st.error(f"O critério {crit} não aceita valores negativos / Criterion {crit} does not accept negative values")
+                st.stop()
+
+        df = df.astype({crit: int for crit in criterios_selecionados if crit in criterios_qualitativos})
+        salvo.loc[fornecedores_selecionados, criterios_selecionados] = df
     
+    # Modo top-k: tabela, relações, gráfico e Monte Carlo só com os k primeiros
+    # (e os últimos), escolhidos sem ordenar o ranking inteiro
+    total = len(df)
+    top_k = None
+    ultimos = 0
+    if st.toggle("Mostrar só os primeiros e os últimos do ranking / Show only the top and bottom of the ranking",
+                 value=total > LIMITE_RANKING_COMPLETO, key='modo_top_k'):
+        col1, col2 = st.columns(2)
+        with col1:
+            top_k = st.number_input("Primeiros (k) / Top k", 1, max(total, 1), min(10, max(total, 1)), key='top_k')
+        with col2:
+            ultimos = st.number_input("Últimos / Bottom", 0, max(total - 1, 0), 0, key='top_k_ultimos')
+
     # Botão para calcular
     if st.button("Calcular Ranking PROMETHEE II / / Run PROMETHEE II Ranking"):
-        with st.spinner("Calculando ranking..."):
-            resultado, matriz_d, matriz_pref, pref_agregada = calcular_promethee_sem_normalizar(
-                df,
-                criterios_selecionados,
-                objetivo,
-                pesos,
-                funcoes_preferencia,
-                parametros_preferencia
+        with st.spinner("Calculando ranking..."), fase('cálculo'):
+            # Motor incremental guardado na sessão: incluir, excluir ou editar um
+            # fornecedor refaz só a linha e a coluna dele (O(n·m)); mudar
+            # critérios, pesos ou funções monta o motor de novo pelo cálculo ordenado
+            configuracao = (
+                list(criterios_selecionados), dict(objetivo), dict(pesos), dict(funcoes_preferencia),
+                {crit: dict(params) for crit, params in parametros_preferencia.items()}
             )
-        
-        n = len(resultado)
-        
-        # Exibir resultados
-        st.subheader("Resultados PROMETHEE II / / PROMETHEE II Results")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
+            motor = st.session_state.get('motor_incremental')
+            if motor is None or st.session_state.get('motor_incremental_configuracao') != configuracao:
+                with fase('fluxos (carga inicial)'):
+                    motor = PrometheeIncremental.a_partir_de(
+                        df, criterios_selecionados, objetivo, pesos, funcoes_preferencia, parametros_preferencia
+                    )
+                st.session_state['motor_incremental'] = motor
+                st.session_state['motor_incremental_configuracao'] = configuracao
+            else:
+                with fase('fluxos (inclusões e exclusões)'):
+                    motor.sincronizar(df)
+            resultado = motor.resultado(df.index.tolist(), top_k=top_k, ultimos=ultimos)
+        # Guarda o cálculo para que os painéis de detalhe sobrevivam às reexecuções
+        st.session_state['calculo_promethee'] = {
+            'df': df,
+            'criterios': list(criterios_selecionados),
+            'objetivo': dict(objetivo),
+            'pesos': dict(pesos),
+            'funcoes': dict(funcoes_preferencia),
+            'parametros': {crit: dict(params) for crit, params in parametros_preferencia.items()},
+            'top_k': (top_k, ultimos),
+            'resultado': resultado
+        }
+
+    calculo = st.session_state.get('calculo_promethee')
+    if calculo is None:
+        return
+
+    if not (calculo['df'].equals(df) and calculo['criterios'] == list(criterios_selecionados)
+            and calculo['objetivo'] == objetivo and calculo['pesos'] == pesos
+            and calculo['funcoes'] == funcoes_preferencia and calculo['parametros'] == parametros_preferencia
+            and calculo['top_k'] == (top_k, ultimos)):
+        st.info("Os dados mudaram desde o último cálculo; clique no botão para atualizar o ranking. / The inputs changed since the last run; click the button to refresh the ranking.")
+
+    df = calculo['df']
+    criterios_selecionados = calculo['criterios']
+    objetivo = calculo['objetivo']
+    pesos = calculo['pesos']
+    funcoes_preferencia = calculo['funcoes']
+    parametros_preferencia = calculo['parametros']
+    top_k, ultimos = calculo['top_k']
+    resultado = calculo['resultado']
+
+    # Exibir resultados
+    st.subheader("Resultados PROMETHEE II / / PROMETHEE II Results")
+    if top_k is not None:
+        st.caption(f"Mostrando {len(resultado)} de {len(df)} fornecedores; a coluna Ranking traz a posição no ranking completo. / Showing {len(resultado)} of {len(df)} suppliers; the Ranking column holds the position in the full ranking.")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        with fase('tabela do ranking (estilo)'):
             st.markdown("**Ranking Final**")
             st.dataframe(
                 resultado.style.format({
@@ -495,26 +514,98 @@ def tela_sistema():
                 }).background_gradient(subset=['Fluxo Líquido (ϕ)'], cmap='RdYlGn'
                 )
             )
-        
-        with col2:
-            st.markdown("**Relações de Preferência**")
-            for i in range(len(resultado)):
-                a = resultado.iloc[i]['Fornecedor']
-                flux_a = resultado.iloc[i]['Fluxo Líquido (ϕ)']
-                
-                for j in range(i+1, len(resultado)):
-                    b = resultado.iloc[j]['Fornecedor']
-                    flux_b = resultado.iloc[j]['Fluxo Líquido (ϕ)']
-                    
-                    if abs(flux_a - flux_b) < 0.0001:  # Considera indiferença
-                        st.write(f"🔹 {a} I {b} (Indiferentes)")
-                    elif flux_a > flux_b:
-                        st.write(f"✅ {a} P {b} (Preferência)")
-                    else:
-                        st.write(f"✅ {b} P {a} (Preferência)")
-        
-        # Gráfico de barras
-        st.subheader("Visualização do Fluxo Líquido / Net Flow Chart")
+
+    with col2:
+        st.markdown("**Relações de Preferência**")
+        with fase('relações de preferência'):
+            # Só pares vizinhos no ranking; a lista completa teria n(n-1)/2 linhas
+            nomes = resultado['Fornecedor'].tolist()
+            fluxos = resultado['Fluxo Líquido (ϕ)'].tolist()
+            posicoes = resultado['Ranking'].tolist()
+            for i in range(min(len(resultado), LIMITE_LINHAS_DETALHE + 1) - 1):
+                if posicoes[i + 1] != posicoes[i] + 1:  # Entre os primeiros e os últimos no modo top-k
+                    st.write("⋯")
+                    continue
+                a, b = nomes[i], nomes[i + 1]
+                if abs(fluxos[i] - fluxos[i + 1]) < 0.0001:  # Considera indiferença
+                    st.write(f"🔹 {a} I {b} (Indiferentes)")
+                else:
+                    st.write(f"✅ {a} P {b} (Preferência)")
+
+    # Intervalos de estabilidade dos pesos
+    st.markdown("**Intervalos de Estabilidade dos Pesos / Weight Stability Intervals**")
+    st.write("Faixa em que cada peso pode variar, com os demais fixos, sem alterar o ranking. / Range over which each weight can vary, with the others fixed, without changing the ranking.")
+    with fase('estabilidade dos pesos'):
+        estabilidade = calcular_intervalos_estabilidade(
+            df,
+            criterios_selecionados,
+            objetivo,
+            pesos,
+            funcoes_preferencia,
+            parametros_preferencia
+        )
+        st.dataframe(
+            estabilidade.style.format({
+                'Peso': "{:.4f}",
+                'Peso mínimo': "{:.4f}",
+                'Peso máximo': "{:.4f}"
+            })
+        )
+
+    # Robustez do ranking com todos os pesos variando juntos (Monte Carlo): só
+    # roda quando pedida, e o resultado fica guardado para o cálculo atual, sem
+    # repetir os sorteios a cada reexecução do fragmento (paginação, seletores)
+    with st.expander("Robustez dos Pesos (Monte Carlo) / Weight Robustness (Monte Carlo)"):
+        st.write(f"Probabilidade de cada fornecedor ocupar cada posição quando todos os pesos variam ±{VARIACAO_MONTE_CARLO:.0%} ao mesmo tempo ({AMOSTRAS_MONTE_CARLO:,} sorteios). / Probability of each supplier holding each rank when all weights vary ±{VARIACAO_MONTE_CARLO:.0%} at once ({AMOSTRAS_MONTE_CARLO:,} draws).")
+        monte_carlo = st.session_state.get('monte_carlo')
+        if monte_carlo is not None and not (monte_carlo['calculo'] is calculo
+                                            and monte_carlo['amostras'] == AMOSTRAS_MONTE_CARLO
+                                            and monte_carlo['variacao'] == VARIACAO_MONTE_CARLO):
+            # De um cálculo anterior: descartado para não segurar o cálculo antigo na sessão
+            del st.session_state['monte_carlo']
+            monte_carlo = None
+        if st.button("Rodar simulação / Run simulation", key='rodar_monte_carlo'):
+            with st.spinner("Sorteando pesos..."), fase('monte carlo'):
+                aceitabilidade, pesos_centrais = calcular_aceitabilidade(
+                    df,
+                    criterios_selecionados,
+                    objetivo,
+                    pesos,
+                    funcoes_preferencia,
+                    parametros_preferencia,
+                    amostras=AMOSTRAS_MONTE_CARLO,
+                    variacao=VARIACAO_MONTE_CARLO,
+                    semente=0,
+                    posicoes=top_k
+                )
+            monte_carlo = {
+                'calculo': calculo,
+                'amostras': AMOSTRAS_MONTE_CARLO,
+                'variacao': VARIACAO_MONTE_CARLO,
+                'aceitabilidade': aceitabilidade,
+                'pesos_centrais': pesos_centrais
+            }
+            st.session_state['monte_carlo'] = monte_carlo
+        if monte_carlo is not None:
+            aceitabilidade = monte_carlo['aceitabilidade']
+            pesos_centrais = monte_carlo['pesos_centrais']
+            if top_k is not None:
+                # Só os fornecedores exibidos e as k primeiras posições
+                exibidos = resultado['Fornecedor'].tolist()
+                aceitabilidade = aceitabilidade.loc[exibidos]
+                pesos_centrais = pesos_centrais.loc[exibidos]
+            st.dataframe(
+                aceitabilidade.style.format("{:.1%}").background_gradient(cmap='Greens', axis=None)
+            )
+            st.markdown("**Pesos centrais (média dos sorteios em que o fornecedor fica em 1º) / Central weights**")
+            st.dataframe(pesos_centrais.style.format("{:.4f}", na_rep='-'))
+
+    # Gráfico de barras
+    st.subheader("Visualização do Fluxo Líquido / Net Flow Chart")
+    with fase('gráfico'):
+        # plotly só é importado quando o gráfico é desenhado
+        import plotly.express as px
+
         fig = px.bar(
             resultado,
             x='Fornecedor',
@@ -531,89 +622,47 @@ def tela_sistema():
             showlegend=False
         )
         st.plotly_chart(fig, use_container_width=True)
-        
-        # Matriz normalizada
-        st.subheader("Matriz de Diferenças d(a,b) por Critério")
-        for crit in criterios_selecionados:
-            st.markdown(f"**Critério: {crit}**")
-            df_dif = pd.DataFrame(matriz_d[crit],
-                          index=resultado['Fornecedor'],
-                          columns=resultado['Fornecedor'])
-            st.dataframe(df_dif.style.format("{:.4f}").background_gradient(cmap='PuBu'))
-
-        # Matriz de preferência agregada
-        st.subheader("Matriz de Preferência Agregada")
-        df_pref = pd.DataFrame(pref_agregada, 
-                               index=resultado['Fornecedor'], 
-                               columns=resultado['Fornecedor'])
-        st.write("Matriz π(a, b) – Grau de preferência de a sobre b:")
-        st.dataframe(df_pref.style.format("{:.4f}").background_gradient(cmap='Oranges'))
-
-        # Matriz de Fluxo Líquido π(a,b) - π(b,a)
-        st.subheader("Matriz de Fluxo Líquido Final (ϕ(a,b))")
-        fluxo_liquido_matriz = np.zeros((n, n))
-        for i in range(n):
-            for j in range(n):
-                fluxo_liquido_matriz[i][j] = pref_agregada[i][j] - pref_agregada[j][i]
-        
-        df_fluxo_liquido = pd.DataFrame(fluxo_liquido_matriz, 
-                                        index=resultado['Fornecedor'], 
-                                        columns=resultado['Fornecedor'])
-        st.dataframe(df_fluxo_liquido.style.format("{:.4f}").background_gradient(cmap='RdBu', axis=None))
 
-        st.subheader("Matriz de Diferenças Normalizadas d(a,b) por Critério")
-       
-        for crit in criterios_selecionados:
-            st.markdown(f"**Critério: {crit}**")
-            pref_crit = np.zeros((n, n))
-            for i in range(n):
-                for j in range(n):
-                    d = df.loc[resultado['Fornecedor'].iloc[i], crit] - df.loc[resultado['Fornecedor'].iloc[j], crit]
-                    if objetivo[crit] == 'Minimizado':
-                        d = -d
-
-                    q = parametros_preferencia[crit].get('q', 0)
-                    p = parametros_preferencia[crit].get('p', 0)
-                    s = parametros_preferencia[crit].get('s', 1)
-                    func = funcoes_preferencia[crit]
-
-                    if func == 'Usual':
-                        pref = 1 if d > 0 else 0
-                    elif func == 'Quase-critério':
-                        pref = 1 if d > q else 0
-                    elif func == 'Limiar de preferência':
-                        if d <= 0:
-                            pref = 0
-                        elif d <= p:
-                            pref = d / p
-                        else:
-                            pref = 1
-                    elif func == 'Pseudo-critério':
-                        if d <= q:
-                            pref = 0
-                        elif d <= p:
-                            pref = 0.5
-                        else:
-                            pref = 1
-                    elif func == 'Área de indiferença':
-                        if d <= q:
-                            pref = 0
-                        elif d <= p:
-                            pref = (d - q) / (p - q)
-                        else:
-                            pref = 1
-                    elif func == 'Gaussiana':
-                        pref = 1 - math.exp(-(d ** 2) / (2 * s ** 2)) if d > 0 else 0
-                    else:
-                        pref = 0
-
-                    pref_crit[i][j] = pref
-
-        # Cria e exibe o DataFrame dentro do loop para cada critério
-        df_pi = pd.DataFrame(pref_crit,
-                         index=resultado['Fornecedor'],
-                         columns=resultado['Fornecedor'])
-        st.dataframe(df_pi.style.format("{:.4f}").background_gradient(cmap='OrRd'))
+    # Matrizes de detalhe: calculadas só para a matriz escolhida e o recorte visível
+    st.subheader("Matrizes de Detalhe / Detail Matrices")
+    tipo = st.selectbox(
+        "Matriz a exibir / Matrix to display:",
+        ['Nenhuma / None'] + list(MATRIZES_DETALHE),
+        key="detalhe_tipo"
+    )
+    if tipo in MATRIZES_DETALHE:
+        criterio = None
+        if tipo in MATRIZES_DETALHE[:2]:
+            criterio = st.selectbox("Critério / Criterion:", criterios_selecionados, key="detalhe_criterio")
+
+        # Fornecedores na ordem do ranking, paginados nas linhas e nas colunas
+        nomes = resultado['Fornecedor'].tolist()
+        paginas = math.ceil(len(nomes) / LIMITE_LINHAS_DETALHE)
+        col1, col2 = st.columns(2)
+        with col1:
+            pagina_linhas = st.number_input("Página das linhas / Row page", 1, paginas, 1, key="detalhe_pagina_linhas")
+        with col2:
+            pagina_colunas = st.number_input("Página das colunas / Column page", 1, paginas, 1, key="detalhe_pagina_colunas")
+        inicio_linhas = (pagina_linhas - 1) * LIMITE_LINHAS_DETALHE
+        inicio_colunas = (pagina_colunas - 1) * LIMITE_LINHAS_DETALHE
+
+        with fase('matriz de detalhe'):
+            bloco = bloco_detalhe(
+                df,
+                criterios_selecionados,
+                objetivo,
+                pesos,
+                funcoes_preferencia,
+                parametros_preferencia,
+                tipo,
+                nomes[inicio_linhas:inicio_linhas + LIMITE_LINHAS_DETALHE],
+                nomes[inicio_colunas:inicio_colunas + LIMITE_LINHAS_DETALHE],
+                criterio
+            )
+            if len(nomes) > LIMITE_LINHAS_DETALHE:
+                st.caption(f"Mostrando até {LIMITE_LINHAS_DETALHE} × {LIMITE_LINHAS_DETALHE} pares de {len(nomes)} fornecedores, na ordem do ranking. / Showing up to {LIMITE_LINHAS_DETALHE} × {LIMITE_LINHAS_DETALHE} pairs of {len(nomes)} suppliers, in ranking order.")
+            mapas = dict(zip(MATRIZES_DETALHE, ['PuBu', 'OrRd', 'Oranges', 'RdBu']))
+            st.dataframe(bloco.style.format("{:.4f}").background_gradient(cmap=mapas[tipo], axis=None))
 
 # ===================================
 # Roteamento entre telas
@@ -625,6 +674,8 @@ def main():
     if escolha == "Tela Inicial":
         tela_inicial()
     elif escolha == "Sistema PROMETHEE II":
+        st.sidebar.toggle("Diagnóstico de desempenho / Performance diagnostics", key='diagnostico',
+                          help="Tempo e pico de memória de cada fase do cálculo. / Time and peak memory of each phase of the run.")
         tela_sistema()
 
 if __name__ == "__main__":
@@ -3,10 +3,10 @@
 # ===================================
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import math
 import numpy as np
 
+from promethee import DESCRICAO_CRITERIOS_EN, ESCALA_QUALITATIVA_EN, calcular_promethee_sem_normalizar
+
 # When setting up, run in terminal: pip install streamlit pandas plotly
 # streamlit run app_up_ingles.py
 
@@ -71,187 +71,25 @@ st.markdown(
 # ===================================
 # Criteria Descriptions and Qualitative Scales
 # ===================================
-criteria_description = {
-    'C1 - Cost': 'Monetary cost of the proposal.(↓)',
-    'C2 - Quality': 'Subjective quality assessment based on benchmark standards. (↑)',
-    'C3 - Delivery': 'Delivery time in days. (↓)',
-    'C4 - Technology': 'Level of innovation and adoption of advanced technologies. (↑)',
-    'C5 - Environmental Costs': 'Annual monetary value or percentage of revenue invested in environmental management (e.g., waste treatment, emissions control, certifications). (↓)',
-    'C6 - Green Design': 'Degree of integration of sustainable design practices in the supplier’s products, services, or processes, including choice of materials, production methods, packaging, and lifecycle considerations. (↑)',
-    'C7 - Environmental Management': 'Effectiveness of the environmental management system. (↑)',
-    'C8 - Stakeholders Management': 'Commitment to stakeholder rights and service. (↑)',
-    'C9 - Occupational Health and Safety': (
-        'TRIR calculated according to OSHA methodology (Total Recordable Incident Rate). '
-        'Value provided by the supplier or verified via audit/documentation. (↓)\n\n'
-        'TRIR = (Total number of recordable incidents × 200,000) / Total hours worked by all employees.'
-    ),
-    'C10 - Compliance with Labor Policies': 'Adherence to employee rights, labor laws, and ethical workplace standards, including diversity, inclusion, and non-discrimination measures. Evidence may include labor policy documents, compliance certificates (e.g., SA8000), diversity reports, and complaint-handling procedures. (↑)',
-    'C11 - Social Management': 'Capacity to develop and implement structured social responsibility policies and programs, including community engagement, partnerships with NGOs, and measurable contributions to social well-being. Evidence may include CSR reports, certifications (ISO 26000, SA8000), project portfolios, and investment data. (↑)',
-    'C12 - Performance History': 'Number of years of experience. (↑)',
-    'C13 - Reputation': 'Media analysis, reviews, and recognitions. (↑)',
-    'C14 - Logistics': 'Distance in kilometers. (↓)'
-}
-
-qualitative_scale = {
-    'C2 - Quality': """| Scale Level | Description |
-|------|-------------|
-| 1 | Products/services do not meet quality standards, leading to frequent rework and negative feedback. |
-| 2 | Products/services generally below standard, with occasional issues and mostly negative feedback. |
-| 3 | Products/services meet the minimum standard, with occasional problems and mixed feedback. |
-| 4 | Products/services meet or exceed quality standards, with positive feedback and few rejections. |
-| 5 | Exceptional products/services, consistently exceeding standards, with highly positive feedback and minimal rejections. |
-""",
-
-    'C4 - Technology': """| Scale Level | Description |
-|------|-------------|
-| 1 | No current technology used; manual processes dominate. |
-| 2 | Low technology adoption, with minimal process improvements. |
-| 3 | Moderate use of known technologies; standard efficiency. |
-| 4 | High adoption of technologies, promoting efficiency gains. |
-| 5 | Use of cutting-edge technologies and continuous innovation. |
-""",
-
-    'C6 - Green Design': """| Scale Level | Description |
-|------|-------------|
-| 1 | The supplier does not apply any sustainable design principles. Products/services are developed without consideration for environmental impacts, recyclability, or resource efficiency. |
-| 2 | Minimal and occasional sustainable actions in design. Examples: limited use of recyclable materials or occasional waste reduction initiatives. No systematic approach. |
-| 3 | Some sustainable design initiatives are present, such as partial use of eco-friendly materials, basic packaging reduction, or energy efficiency in certain processes. However, these are not applied consistently across all projects. |
-| 4 | Sustainable design principles are incorporated in several key aspects of the supplier’s operations: consistent use of recyclable or renewable materials, reduced energy consumption, optimized packaging, and partial application of lifecycle assessment. |
-| 5 | The supplier’s design approach is fully sustainability-oriented, integrating eco-design principles at every stage: product conception, material selection, manufacturing, packaging, and end-of-life. Includes full lifecycle assessment, zero-waste strategies, renewable energy use, and alignment with international eco-certifications. |
-""",
-
-    'C7 - Environmental Management': """| Scale Level | Description |
-|------|-------------|
-| 1 | No structured environmental management system. |
-| 2 | Informal and ineffective system. |
-| 3 | Basic system implemented with limitations. |
-| 4 | Well-structured system in compliance with standards. |
-| 5 | Robust, certified system with continuous improvement. |
-""",
-
-    'C8 - Stakeholders Management': """| Scale Level | Description |
-|------|-------------|
-| 1 | Ignores stakeholder interests. |
-| 2 | Reactively and minimally responsive. |
-| 3 | Minimal stakeholder engagement. |
-| 4 | Commitment to active engagement policies. |
-| 5 | Transparent, active, and responsible stakeholder involvement. |
-""",
-
-    'C10 - Compliance with Labor Policies': """| Scale Level | Description |
-|------|-------------|
-| 1 | No formal labor policies; repeated violations in last 3 years. |
-| 2 | Minimal/incomplete policies; limited diversity/inclusion; minor violations. |
-| 3 | Basic policies covering essential rights; some diversity efforts; no serious violations. |
-| 4 | Comprehensive policies aligned with law; active diversity programs; no violations. |
-| 5 | Exemplary policies exceeding legal requirements; diversity and inclusion embedded in culture; recognized certifications or awards. |
-""",
-
-    'C11 - Social Management': """| Scale Level | Description |
-|------|-------------|
-| 1 | No CSR policies or social initiatives. |
-| 2 | Limited or reactive initiatives with minimal documentation. |
-| 3 | Some structured social programs, but inconsistent execution or limited scope. |
-| 4 | Comprehensive CSR policies with consistent community engagement and documented results. |
-| 5 | Strategic, certified, and impactful CSR programs integrated into corporate culture. |
-""",
+criteria_description = DESCRICAO_CRITERIOS_EN
 
-    'C13 - Reputation': """| Scale Level | Description |
-|------|-------------|
-| 1 | Very negative or unknown reputation. |
-| 2 | Unfavorable or unstable market image. |
-| 3 | Acceptable reputation, no major highlights. |
-| 4 | Good reputation with consistent positive evaluations. |
-| 5 | Excellent reputation, widely recognized in the industry. |
-"""
-}
+qualitative_scale = ESCALA_QUALITATIVA_EN
 
 # ===================================
 # PROMETHEE II Calculation
 # ===================================
 def compute_promethee_without_normalizing(df, criteria, objective, weights, functions, parameters):
-    alternatives = df.index.tolist()
-    n = len(alternatives)
-    total_weight = sum(weights.values())
-
-    # Initialize matrices
-    d_matrix = {crit: np.zeros((n, n)) for crit in criteria}
-    pref_matrix = {crit: np.zeros((n, n)) for crit in criteria}
-    aggregated_matrix = np.zeros((n, n))
-
-    # Steps 1 & 2: compute d(a,b) and apply F_j(a,b)
-    for c_idx, crit in enumerate(criteria):
-        for i, a in enumerate(alternatives):
-            for j, b in enumerate(alternatives):
-                if i == j:
-                    continue
-
-                # Direct difference of values (no normalization)
-                d = df.loc[a, crit] - df.loc[b, crit]
-
-                # Invert if criterion is minimization
-                if objective[crit] == 'Minimize':
-                    d = -d
-
-                d_matrix[crit][i][j] = d
-
-                # Parameters q, p, s
-                q = parameters[crit].get('q', 0)
-                p = parameters[crit].get('p', 0)
-                s = parameters[crit].get('s', 1)
-                func = functions[crit]
-
-                # Apply F_j according to type
-                if func == 'Usual':
-                    pref = 1 if d > 0 else 0
-                elif func == 'U-Shape':
-                    pref = 1 if d > q else 0
-                elif func == 'V-Shape':
-                    if d <= 0:
-                        pref = 0
-                    elif d <= p:
-                        pref = d / p
-                    else:
-                        pref = 1
-                elif func == 'Level':
-                    if d <= q:
-                        pref = 0
-                    elif d <= p:
-                        pref = 0.5
-                    else:
-                        pref = 1
-                elif func == 'V-Shape with Indifference':
-                    if d <= q:
-                        pref = 0
-                    elif d <= p:
-                        pref = (d - q) / (p - q)
-                    else:
-                        pref = 1
-                elif func == 'Gaussian':
-                    pref = 1 - math.exp(-(d ** 2) / (2 * s ** 2)) if d > 0 else 0
-                else:
-                    pref = 0
-
-                pref_matrix[crit][i][j] = pref
-                aggregated_matrix[i][j] += weights[crit] * pref
-
-    # Step 3: aggregated preference matrix (divide by total weight)
-    aggregated_matrix /= total_weight
-
-    # Step 4: flows
-    positive_flow = aggregated_matrix.sum(axis=1) / (n - 1)
-    negative_flow = aggregated_matrix.sum(axis=0) / (n - 1)
-    net_flow = positive_flow - negative_flow
-
-    # Final ranking
-    result = pd.DataFrame({
-        'Supplier': alternatives,
-        'Positive Flow (ϕ+)': positive_flow,
-        'Negative Flow (ϕ-)': negative_flow,
-        'Net Flow (ϕ)': net_flow
+    # Same engine as the Portuguese screen: the preference-function registry
+    # maps the English names (U-Shape, V-Shape, Level, ...) onto the same kernels
+    result, d_matrix, pref_matrix, aggregated_matrix = calcular_promethee_sem_normalizar(
+        df, criteria, objective, weights, functions, parameters
+    )
+    result = result.rename(columns={
+        'Fornecedor': 'Supplier',
+        'Fluxo Positivo (ϕ+)': 'Positive Flow (ϕ+)',
+        'Fluxo Negativo (ϕ-)': 'Negative Flow (ϕ-)',
+        'Fluxo Líquido (ϕ)': 'Net Flow (ϕ)'
     })
-    result = result.sort_values('Net Flow (ϕ)', ascending=False)
-    result['Ranking'] = range(1, len(result) + 1)
 
     return result, d_matrix, pref_matrix, aggregated_matrix
 
@@ -500,8 +338,6 @@ def promethee_screen():
                 preference_parameters
             )
         
-        n = len(result)
-        
         # Show results
         st.subheader("PROMETHEE II Results")
         
@@ -536,6 +372,9 @@ def promethee_screen():
         
         # Bar chart
         st.subheader("Net Flow Chart")
+        # plotly is only imported when the chart is drawn
+        import plotly.express as px
+
         fig = px.bar(
             result,
             x='Supplier',
@@ -553,12 +392,16 @@ def promethee_screen():
         )
         st.plotly_chart(fig, use_container_width=True)
         
+        # The engine returns the matrices in df order; they are shown in ranking order
+        positions = df.index.get_indexer(result['Supplier'])
+        order = np.ix_(positions, positions)
+
         # d(a,b) matrices by criterion
         st.subheader("Difference Matrices d(a,b) by Criterion")
         for crit in selected_criteria:
             st.markdown(f"**Criterion: {crit}**")
             df_diff = pd.DataFrame(
-                d_matrix[crit],
+                d_matrix[crit][order],
                 index=result['Supplier'],
                 columns=result['Supplier']
             )
@@ -567,7 +410,7 @@ def promethee_screen():
         # Aggregated preference matrix
         st.subheader("Aggregated Preference Matrix")
         df_pref = pd.DataFrame(
-            aggregated_pref,
+            aggregated_pref[order],
             index=result['Supplier'],
             columns=result['Supplier']
         )
@@ -576,10 +419,7 @@ def promethee_screen():
 
         # Final net flow matrix π(a,b) - π(b,a)
         st.subheader("Final Net Flow Matrix (ϕ(a,b))")
-        net_flow_matrix = np.zeros((n, n))
-        for i in range(n):
-            for j in range(n):
-                net_flow_matrix[i][j] = aggregated_pref[i][j] - aggregated_pref[j][i]
+        net_flow_matrix = aggregated_pref[order] - aggregated_pref[order].T
         
         df_net_flow = pd.DataFrame(
             net_flow_matrix,
@@ -592,53 +432,10 @@ def promethee_screen():
         st.subheader("Normalized Difference Matrices d(a,b) by Criterion")
         for crit in selected_criteria:
             st.markdown(f"**Criterion: {crit}**")
-            pref_crit = np.zeros((n, n))
-            for i in range(n):
-                for j in range(n):
-                    d = df.loc[result['Supplier'].iloc[i], crit] - df.loc[result['Supplier'].iloc[j], crit]
-                    if objective[crit] == 'Minimize':
-                        d = -d
-
-                    q = preference_parameters[crit].get('q', 0)
-                    p = preference_parameters[crit].get('p', 0)
-                    s = preference_parameters[crit].get('s', 1)
-                    func = preference_functions[crit]
-
-                    if func == 'Usual':
-                        pref = 1 if d > 0 else 0
-                    elif func == 'U-Shape':
-                        pref = 1 if d > q else 0
-                    elif func == 'V-Shape':
-                        if d <= 0:
-                            pref = 0
-                        elif d <= p:
-                            pref = d / p
-                        else:
-                            pref = 1
-                    elif func == 'Level':
-                        if d <= q:
-                            pref = 0
-                        elif d <= p:
-                            pref = 0.5
-                        else:
-                            pref = 1
-                    elif func == 'V-Shape with Indifference':
-                        if d <= q:
-                            pref = 0
-                        elif d <= p:
-                            pref = (d - q) / (p - q)
-                        else:
-                            pref = 1
-                    elif func == 'Gaussian':
-                        pref = 1 - math.exp(-(d ** 2) / (2 * s ** 2)) if d > 0 else 0
-                    else:
-                        pref = 0
-
-                    pref_crit[i][j] = pref
-
-            # NOTE: This mirrors your original structure: build and display after the loop.
+            # π_j(a,b) straight from the engine: Usual/U-Shape and Level arrive
+            # compacted (see promethee/compactas.py) and are only decoded here
             df_pi = pd.DataFrame(
-                pref_crit,
+                pref_matrix[crit][order],
                 index=result['Supplier'],
                 columns=result['Supplier']
             )
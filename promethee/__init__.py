@@ -0,0 +1,50 @@
+# ===================================
+# Núcleo de cálculo PROMETHEE II compartilhado pelas telas
+# ===================================
+# Os submódulos são carregados no primeiro acesso ao nome (PEP 562):
+# `import promethee` não importa numpy nem pandas, e quem só usa os fluxos
+# (fluxos, cache, paralelo) não paga a importação do pandas.
+import importlib
+
+_EXPORTACOES = {
+    'preferencias': ('FUNCOES_PREFERENCIA', 'NOMES_ALTERNATIVOS', 'FuncaoPreferencia', 'nome_canonico',
+                     'resolver_funcao_preferencia'),
+    'catalogo': ('DESCRICAO_CRITERIOS', 'DESCRICAO_CRITERIOS_EN', 'DESCRICAO_CRITERIOS_PT', 'ESCALA_QUALITATIVA',
+                 'ESCALA_QUALITATIVA_EN', 'ESCALA_QUALITATIVA_PT'),
+    'compactas': ('MatrizBinaria', 'MatrizNivel', 'compactar'),
+    'motor': ('OBJETIVOS_MAXIMIZACAO', 'OBJETIVOS_MINIMIZACAO', 'calcular_promethee_sem_normalizar', 'montar_resultado', 'montar_top_k',
+              'valores_orientados'),
+    'fluxos': ('calcular_promethee_somente_fluxos', 'somas_unicriterio'),
+    'blocos': ('calcular_promethee_em_blocos', 'linhas_por_bloco'),
+    'paralelo': ('calcular_promethee_paralelo', 'somas_unicriterio_paralelas'),
+    'cache': ('CACHE_PADRAO', 'CacheFluxosUnicriterio', 'calcular_promethee_com_cache', 'combinar_pesos',
+              'fluxos_liquidos_unicriterio', 'somas_por_criterio'),
+    'dominancia': ('banda_dominancia', 'calcular_top_k_por_dominancia'),
+    'duplicados': ('agrupar_perfis', 'calcular_promethee_sem_duplicados'),
+    'erros': ('ErroEntrada',),
+    'incremental': ('PrometheeIncremental',),
+    'instrumentacao': ('Medicao', 'fase'),
+    'sensibilidade': ('calcular_intervalos_estabilidade', 'intervalos_estabilidade_pesos'),
+    'monte_carlo': ('analise_monte_carlo', 'calcular_aceitabilidade'),
+    'detalhes': ('MATRIZES_DETALHE', 'bloco_detalhe'),
+    'colunas': ('mapear_colunas',),
+    'ingestao': ('LINHAS_POR_BLOCO', 'ingerir_em_blocos', 'interpretar_filtros'),
+    'importacao': ('EXTENSOES_SUPORTADAS', 'importar_matriz_desempenho'),
+}
+
+_MODULO_DO_NOME = {nome: modulo for modulo, nomes in _EXPORTACOES.items() for nome in nomes}
+
+__all__ = sorted(_MODULO_DO_NOME)
+
+
+def __getattr__(nome):
+    modulo = _MODULO_DO_NOME.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(importlib.import_module(f'.{modulo}', __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,362 @@
+# ===================================
+# Benchmark dos motores PROMETHEE II
+# ===================================
+# python -m promethee.benchmark [--rapido] [--motores fluxos blocos ...]
+# python -m promethee.benchmark --salvar-referencia
+#
+# Gera matrizes de desempenho sintéticas numa grade de fornecedores × critérios
+# × funções de preferência e mede, por motor, o tempo (menor de algumas
+# repetições), o pico de memória (tracemalloc, em uma execução separada) e a
+# vazão em pares (a,b) por segundo. Com uma referência salva, cada medição é
+# comparada com a dela e o comando sai com código 1 se algum tempo ou pico de
+# memória de um motor do pacote piorar além da tolerância.
+#
+# Os tempos não são comparados em segundos: a referência foi gravada em outra
+# máquina (ou com outra carga). Um núcleo fixo de trabalho é cronometrado
+# intercalado com cada motor, e cada tempo é guardado e comparado como múltiplo
+# dele (menor de várias repetições de cada um), o que desconta a carga do momento.
+# Uma piora num motor do pacote é medida de novo antes de reprovar: rajadas de
+# carga passam, regressões de verdade se repetem. A referência gravada é a
+# mediana de algumas rodadas da grade, não uma rodada que pode ter tido sorte.
+#
+# Além dos motores do pacote entram as versões antigas dos protótipos
+# (calcular_fluxos de sad.py/finale1.py, calcular_fluxo de app2.py/app3.py e
+# calculate_preference_matrix de learning/sad.py), só para comparação: eles são
+# medidos e listados, mas não reprovam a execução. As funções são extraídas dos
+# scripts sem executá-los, pois o corpo deles desenha telas do Streamlit.
+import argparse
+import ast
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .blocos import calcular_promethee_em_blocos
+from .fluxos import calcular_promethee_somente_fluxos
+from .motor import calcular_promethee_sem_normalizar
+from .paralelo import calcular_promethee_paralelo
+from .preferencias import FUNCOES_PREFERENCIA
+
+RAIZ = Path(__file__).resolve().parent.parent
+REFERENCIA_PADRAO = RAIZ / 'referencias' / 'benchmark.json'
+
+FORNECEDORES = (10, 100, 1000, 10_000, 50_000)
+CRITERIOS = (1, 4, 14)
+FORNECEDORES_RAPIDO = (10, 100, 1000)
+CRITERIOS_RAPIDO = (1, 14)
+
+TOLERANCIA = 0.5
+# Só estes motores reprovam a execução; os protótipos são apenas informados
+MOTORES_DO_PACOTE = ('completo', 'fluxos', 'blocos', 'paralelo')
+# Mesmo em múltiplos do núcleo sobram variações de ~20% entre execuções, e
+# diferenças menores que as folgas são ruído de medição, não regressão
+FOLGA_SEGUNDOS = 0.005
+FOLGA_MEMORIA_MB = 1.0
+# Novas medições de uma piora antes de contá-la como regressão
+REMEDICOES = 2
+# Rodadas da grade ao gravar a referência (fica a mediana de cada medição)
+RODADAS_REFERENCIA = 3
+
+# Repete a medição ao menos REPETICOES_MIN vezes, até somar este tempo (ou
+# REPETICOES_MAX vezes), e fica com a menor
+TEMPO_MINIMO = 0.2
+REPETICOES_MIN = 3
+REPETICOES_MAX = 5
+
+# Módulos que os protótipos importam só para a tela
+_IMPORTS_DE_TELA = ('streamlit', 'plotly')
+
+
+def carregar_funcoes(caminho, nomes):
+    # Compila só os imports e as definições `nomes` do script, sem rodar o resto
+    arvore = ast.parse(Path(caminho).read_text(encoding='utf-8'), filename=str(caminho))
+    corpo = []
+    for no in arvore.body:
+        if isinstance(no, ast.Import):
+            if not any(alias.name.split('.')[0] in _IMPORTS_DE_TELA for alias in no.names):
+                corpo.append(no)
+        elif isinstance(no, ast.ImportFrom):
+            if (no.module or '').split('.')[0] not in _IMPORTS_DE_TELA:
+                corpo.append(no)
+        elif isinstance(no, ast.FunctionDef) and no.name in nomes:
+            corpo.append(no)
+    espaco = {}
+    exec(compile(ast.Module(body=corpo, type_ignores=[]), str(caminho), 'exec'), espaco)
+    return [espaco[nome] for nome in nomes]
+
+
+def matriz_sintetica(n, m, funcao, semente=0):
+    # Critérios alternam quantitativos (0 a 1000, minimizados) e qualitativos
+    # (notas 1 a 5, maximizados, com muitos empates); q, p e s seguem a amplitude
+    rng = np.random.default_rng(semente)
+    criterios = [f'C{j + 1}' for j in range(m)]
+    colunas = {}
+    objetivo, parametros = {}, {}
+    for j, crit in enumerate(criterios):
+        if j % 2 == 0:
+            colunas[crit] = np.round(rng.uniform(0, 1000, n), 2)
+            objetivo[crit] = 'Minimizado'
+            amplitude = 1000.0
+        else:
+            colunas[crit] = rng.integers(1, 6, n).astype(float)
+            objetivo[crit] = 'Maximizado'
+            amplitude = 4.0
+        parametros[crit] = {'q': 0.1 * amplitude, 'p': 0.5 * amplitude, 's': 0.25 * amplitude}
+    df = pd.DataFrame(colunas, index=[f'Fornecedor {i + 1}' for i in range(n)])
+    pesos = {crit: float(rng.integers(1, 10)) for crit in criterios}
+    funcoes = {crit: funcao for crit in criterios}
+    return df, criterios, objetivo, pesos, funcoes, parametros
+
+
+# ===================================
+# Motores
+# ===================================
+# Cada motor recebe o cenário e devolve uma função sem argumentos que faz só o
+# cálculo (conversões de formato ficam fora da medição).
+
+def _pacote(calcular):
+    def preparar(df, criterios, objetivo, pesos, funcoes, parametros):
+        return lambda: calcular(df, criterios, objetivo, pesos, funcoes, parametros)
+    return preparar
+
+
+def _sad_finale(caminho, por_fornecedor):
+    # calcular_fluxos(df, pesos, funcoes, parametros): fornecedores nas colunas,
+    # critérios nas linhas; em sad.py funções e parâmetros vêm por fornecedor
+    def preparar(df, criterios, objetivo, pesos, funcoes, parametros):
+        *_, calcular_fluxos = carregar_funcoes(
+            RAIZ / caminho, ('calcular_diferencial', 'aplicar_funcao_preferencia', 'calcular_fluxos')
+        )
+        tabela = df[criterios].T
+        if por_fornecedor:
+            funcoes = {f: funcoes for f in tabela.columns}
+            parametros = {f: parametros for f in tabela.columns}
+        return lambda: calcular_fluxos(tabela, pesos, funcoes, parametros)
+    return preparar
+
+
+def _app2_app3(caminho):
+    # calcular_fluxo(df, pesos): comparação simples (Usual), escreve colunas no df
+    def preparar(df, criterios, objetivo, pesos, funcoes, parametros):
+        (calcular_fluxo,) = carregar_funcoes(RAIZ / caminho, ('calcular_fluxo',))
+        tabela = df[criterios].reset_index(names='Fornecedor')
+        return lambda: calcular_fluxo(tabela.copy(), pesos)
+    return preparar
+
+
+def _learning_sad(df, criterios, objetivo, pesos, funcoes, parametros):
+    # calculate_preference_matrix(matrix, weights): soma ponderada das diferenças, sem função
+    calcular_matriz, calcular_fluxos = carregar_funcoes(
+        RAIZ / 'learning' / 'sad.py', ('calculate_preference_matrix', 'calculate_flows')
+    )
+    matriz = df[criterios].to_numpy()
+    vetor_pesos = [pesos[crit] for crit in criterios]
+    return lambda: calcular_fluxos(calcular_matriz(matriz, vetor_pesos))
+
+
+# nome: (preparar, limite de n²·m, subquadrático fora da Gaussiana, usa a função de preferência)
+# O limite evita combinações que levariam minutos (ou gigabytes, no motor completo)
+MOTORES = {
+    'completo': (_pacote(calcular_promethee_sem_normalizar), 2.5e7, False, True),
+    'fluxos': (_pacote(calcular_promethee_somente_fluxos), 2e9, True, True),
+    'blocos': (_pacote(calcular_promethee_em_blocos), 2e9, False, True),
+    'paralelo': (_pacote(calcular_promethee_paralelo), 2e9, True, True),
+    'sad.calcular_fluxos': (_sad_finale('sad.py', True), 2e4, False, True),
+    'finale1.calcular_fluxos': (_sad_finale('finale1.py', False), 2e4, False, True),
+    'app2.calcular_fluxo': (_app2_app3('app2.py'), 2e5, False, False),
+    'app3.calcular_fluxo': (_app2_app3('app3.py'), 2e5, False, False),
+    'learning.calculate_preference_matrix': (_learning_sad, 2e6, False, False),
+}
+
+
+def _dentro_do_limite(motor, n, m, funcao):
+    _, limite, subquadratico, _ = MOTORES[motor]
+    if subquadratico and funcao != 'Gaussiana':
+        return True
+    return n * n * m <= limite
+
+
+def _cronometrar(executar):
+    # (menor tempo do motor, menor tempo do núcleo), alternando os dois para que
+    # sofram a mesma carga da máquina
+    tempos, nucleo = [], []
+    while len(tempos) < REPETICOES_MIN or (len(tempos) < REPETICOES_MAX and sum(tempos) < TEMPO_MINIMO):
+        inicio = time.perf_counter()
+        _nucleo_referencia()
+        meio = time.perf_counter()
+        executar()
+        nucleo.append(meio - inicio)
+        tempos.append(time.perf_counter() - meio)
+    return min(tempos), min(nucleo)
+
+
+def _pico_memoria_mb(executar):
+    tracemalloc.start()
+    try:
+        executar()
+        return tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    finally:
+        tracemalloc.stop()
+
+
+def _nucleo_referencia():
+    # Trabalho fixo com a mesma mistura dos motores: operações numpy n×n e laço Python
+    x = np.linspace(0.0, 1.0, 600)
+    total = float(np.maximum(x[:, np.newaxis] - x[np.newaxis, :], 0).sum())
+    for i in range(20_000):
+        total += i % 7
+    return total
+
+
+def medir(motor, n, m, funcao):
+    preparar, _, _, usa_funcao = MOTORES[motor]
+    executar = preparar(*matriz_sintetica(n, m, funcao if usa_funcao else 'Usual'))
+    segundos, nucleo = _cronometrar(executar)
+    return {
+        'motor': motor,
+        'fornecedores': n,
+        'criterios': m,
+        'funcao': funcao,
+        'segundos': segundos,
+        'relativo': segundos / nucleo,
+        'pico_mb': _pico_memoria_mb(executar),
+        'pares_por_segundo': n * (n - 1) / segundos if segundos > 0 else float('inf'),
+    }
+
+
+def executar_grade(motores=None, fornecedores=FORNECEDORES, criterios=CRITERIOS, funcoes=None, ao_medir=None):
+    motores = list(MOTORES) if motores is None else motores
+    funcoes = list(FUNCOES_PREFERENCIA) if funcoes is None else funcoes
+    medicoes = []
+    for motor in motores:
+        # Motores que ignoram a função de preferência são medidos uma vez por (n, m)
+        funcoes_motor = funcoes if MOTORES[motor][3] else funcoes[:1]
+        for n in fornecedores:
+            for m in criterios:
+                for funcao in funcoes_motor:
+                    if not _dentro_do_limite(motor, n, m, funcao):
+                        continue
+                    medicao = medir(motor, n, m, funcao)
+                    medicoes.append(medicao)
+                    if ao_medir is not None:
+                        ao_medir(medicao)
+    return medicoes
+
+
+def chave(medicao):
+    return f"{medicao['motor']}|{medicao['fornecedores']}|{medicao['criterios']}|{medicao['funcao']}"
+
+
+def mediana_das_rodadas(rodadas):
+    # Uma rodada sozinha pode sair mais rápida que o normal e deixar a referência
+    # rigorosa demais; de cada medição fica a rodada com o tempo relativo mediano
+    return [sorted(medicoes, key=lambda m: m['relativo'])[len(medicoes) // 2] for medicoes in zip(*rodadas)]
+
+
+def salvar_referencia(medicoes, caminho=REFERENCIA_PADRAO):
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    referencia = {chave(m): {k: m[k] for k in ('segundos', 'relativo', 'pico_mb', 'pares_por_segundo')}
+                  for m in medicoes}
+    caminho.write_text(json.dumps(referencia, indent=1, ensure_ascii=False, sort_keys=True) + '\n', encoding='utf-8')
+
+
+def comparar(medicoes, referencia, tolerancia=TOLERANCIA):
+    # [(medição, referência, motivo)] das medições que pioraram além da tolerância.
+    # Tempo em múltiplos do núcleo de referência; a folga em segundos usa o
+    # núcleo medido junto com o motor
+    regressoes = []
+    for medicao in medicoes:
+        base = referencia.get(chave(medicao))
+        if base is None or 'relativo' not in base:
+            continue
+        unidade = medicao['segundos'] / medicao['relativo'] if medicao['relativo'] else 0.0
+        if (medicao['relativo'] > base['relativo'] * (1 + tolerancia)
+                and (medicao['relativo'] - base['relativo']) * unidade > FOLGA_SEGUNDOS):
+            regressoes.append((medicao, base, f"tempo {base['relativo']:.2f} → {medicao['relativo']:.2f} "
+                                              f"× núcleo de referência ({medicao['segundos']:.4f} s)"))
+        if (medicao['pico_mb'] > base['pico_mb'] * (1 + tolerancia)
+                and medicao['pico_mb'] - base['pico_mb'] > FOLGA_MEMORIA_MB):
+            regressoes.append((medicao, base, f"memória {base['pico_mb']:.1f} MB → {medicao['pico_mb']:.1f} MB"))
+    return regressoes
+
+
+def confirmar(regressoes, referencia, tolerancia=TOLERANCIA, remedicoes=REMEDICOES):
+    # Mede de novo cada medição que piorou, fica com o melhor tempo e o menor
+    # pico de memória e devolve só as regressões que persistem
+    confirmadas = []
+    for medicao in {chave(m): m for m, _, _ in regressoes}.values():
+        for _ in range(remedicoes):
+            nova = medir(medicao['motor'], medicao['fornecedores'], medicao['criterios'], medicao['funcao'])
+            melhor = min(medicao, nova, key=lambda m: m['relativo'])
+            medicao = dict(melhor, pico_mb=min(medicao['pico_mb'], nova['pico_mb']))
+            if not comparar([medicao], referencia, tolerancia):
+                break
+        confirmadas.extend(comparar([medicao], referencia, tolerancia))
+    return confirmadas
+
+
+def _imprimir(medicao):
+    print(f"{medicao['motor']:38} n={medicao['fornecedores']:<6} m={medicao['criterios']:<3} "
+          f"{medicao['funcao']:22} {medicao['segundos']:10.4f} s {medicao['pico_mb']:9.1f} MB "
+          f"{medicao['pares_por_segundo']:14,.0f} pares/s", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m promethee.benchmark',
+        description="Mede tempo, pico de memória e vazão dos motores PROMETHEE II e compara com a referência.",
+    )
+    parser.add_argument('--motores', nargs='+', choices=list(MOTORES), help="motores medidos (padrão: todos)")
+    parser.add_argument('--funcoes', nargs='+', choices=list(FUNCOES_PREFERENCIA),
+                        help="funções de preferência (padrão: as seis)")
+    parser.add_argument('--rapido', action='store_true',
+                        help=f"grade reduzida: n em {FORNECEDORES_RAPIDO}, m em {CRITERIOS_RAPIDO}")
+    parser.add_argument('--referencia', default=REFERENCIA_PADRAO, help="arquivo JSON da referência")
+    parser.add_argument('--salvar-referencia', action='store_true',
+                        help="grava as medições como nova referência em vez de comparar")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help=f"piora relativa aceita (padrão: {TOLERANCIA})")
+    parser.add_argument('--saida', help="grava as medições em CSV")
+    args = parser.parse_args(argv)
+
+    grade = (
+        args.motores,
+        FORNECEDORES_RAPIDO if args.rapido else FORNECEDORES,
+        CRITERIOS_RAPIDO if args.rapido else CRITERIOS,
+        args.funcoes,
+    )
+    medicoes = executar_grade(*grade, ao_medir=_imprimir)
+    if args.saida:
+        pd.DataFrame(medicoes).to_csv(args.saida, index=False)
+
+    referencia = Path(args.referencia)
+    if args.salvar_referencia:
+        rodadas = [medicoes] + [executar_grade(*grade) for _ in range(RODADAS_REFERENCIA - 1)]
+        medicoes = mediana_das_rodadas(rodadas)
+        salvar_referencia(medicoes, referencia)
+        print(f"referência gravada em {referencia} ({len(medicoes)} medições)")
+        return 0
+    if not referencia.exists():
+        print(f"sem referência em {referencia}; use --salvar-referencia para criar")
+        return 0
+
+    referencia = json.loads(referencia.read_text(encoding='utf-8'))
+    regressoes = comparar(medicoes, referencia, args.tolerancia)
+    avisos = [r for r in regressoes if r[0]['motor'] not in MOTORES_DO_PACOTE]
+    regressoes = confirmar([r for r in regressoes if r[0]['motor'] in MOTORES_DO_PACOTE],
+                           referencia, args.tolerancia)
+    for medicao, _, motivo in avisos:
+        print(f"aviso (protótipo, não reprova) {chave(medicao)}: {motivo}")
+    for medicao, _, motivo in regressoes:
+        print(f"REGRESSÃO {chave(medicao)}: {motivo}")
+    print(f"{len(medicoes)} medições, {len(regressoes)} regressões nos motores do pacote, "
+          f"{len(avisos)} avisos em protótipos (tolerância {args.tolerancia:.0%})")
+    return 1 if regressoes else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+# ===================================
+# PROMETHEE II em blocos de linhas (memória limitada)
+# ===================================
+# Só as somas de linha e de coluna da matriz agregada entram no ranking.
+# Cada bloco de linhas [inicio, fim) gera um ladrilho (fim - inicio)×n da
+# matriz agregada, acumula ϕ+ das linhas do bloco e ϕ- de todas as colunas
+# e é descartado em seguida.
+import numpy as np
+
+from .motor import montar_resultado, valores_orientados
+from .preferencias import resolver_funcao_preferencia
+
+MEMORIA_PADRAO_MB = 256
+
+# Bytes por par (a,b) vivos ao mesmo tempo em um bloco: ladrilho agregado,
+# d(a,b), F_j(d) e as máscaras/temporários da função de preferência
+BYTES_POR_PAR = 64
+
+
+def linhas_por_bloco(n, memoria_mb=MEMORIA_PADRAO_MB):
+    # Maior número de linhas cujo ladrilho cabe no orçamento de memória
+    orcamento = memoria_mb * 1024 ** 2
+    return int(max(1, min(n, orcamento // (BYTES_POR_PAR * max(n, 1)))))
+
+
+def calcular_promethee_em_blocos(df, criterios, objetivo, pesos, funcoes, parametros,
+                                 memoria_mb=MEMORIA_PADRAO_MB):
+    alternativas = df.index.tolist()
+    n = len(alternativas)
+    peso_total = sum(pesos.values())
+
+    # Colunas orientadas e F_j resolvidas uma vez: O(n·m), independente do bloco
+    colunas = {crit: valores_orientados(df, crit, objetivo) for crit in criterios}
+    funcoes_resolvidas = {
+        crit: resolver_funcao_preferencia(funcoes[crit], parametros[crit])
+        for crit in criterios
+    }
+
+    fluxo_positivo = np.empty(n)
+    fluxo_negativo = np.zeros(n)
+
+    linhas = linhas_por_bloco(n, memoria_mb)
+    for inicio in range(0, n, linhas):
+        fim = min(inicio + linhas, n)
+        diagonal = (np.arange(fim - inicio), np.arange(inicio, fim))
+        ladrilho = np.zeros((fim - inicio, n))
+
+        for crit in criterios:
+            x = colunas[crit]
+            d = x[inicio:fim, np.newaxis] - x[np.newaxis, :]
+            pref = funcoes_resolvidas[crit](d)
+            pref[diagonal] = 0
+            ladrilho += pesos[crit] * pref
+
+        fluxo_positivo[inicio:fim] = ladrilho.sum(axis=1)
+        fluxo_negativo += ladrilho.sum(axis=0)
+
+    fluxo_positivo /= peso_total * (n - 1)
+    fluxo_negativo /= peso_total * (n - 1)
+
+    return montar_resultado(alternativas, fluxo_positivo, fluxo_negativo)
@@ -0,0 +1,112 @@
+# ===================================
+# Cache de fluxos unicritério
+# ===================================
+# O fluxo do PROMETHEE II é linear nos pesos:
+#   ϕ+(a) = Σ_j w_j · S+_j(a) / (W·(n-1)),   S+_j(a) = Σ_b P_j(a,b)
+# Guardando S+_j e S-_j por critério, qualquer novo vetor de pesos gera o
+# ranking com um único produto matriz-vetor (m×n · m), em O(n·m).
+# A chave identifica o conteúdo da coluna (hash), o objetivo, a função e
+# q, p, s; assim a mesma coluna é reaproveitada entre execuções da tela e
+# entre edições de peso.
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from .fluxos import somas_unicriterio
+from .instrumentacao import fase
+from .motor import OBJETIVOS_MINIMIZACAO, montar_resultado, montar_top_k
+from .preferencias import resolver_funcao_preferencia
+
+
+class CacheFluxosUnicriterio:
+    def __init__(self, max_entradas=512):
+        self.max_entradas = max_entradas
+        self._entradas = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    @staticmethod
+    def chave(valores, minimizar, funcao):
+        resumo = hashlib.blake2b(np.ascontiguousarray(valores, dtype=np.float64).tobytes(),
+                                 digest_size=16).hexdigest()
+        return (resumo, bool(minimizar), funcao.nome, float(funcao.q), float(funcao.p), float(funcao.s))
+
+    def somas(self, valores, minimizar, funcao):
+        # (S+_j, S-_j) da coluna bruta `valores`; calcula e guarda em caso de falha
+        chave = self.chave(valores, minimizar, funcao)
+        if chave in self._entradas:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return self._entradas[chave]
+
+        self.falhas += 1
+        x = np.asarray(valores, dtype=np.float64)
+        if minimizar:
+            x = -x
+        resultado = somas_unicriterio(x, funcao)
+        for array in resultado:
+            array.flags.writeable = False
+
+        self._entradas[chave] = resultado
+        if len(self._entradas) > self.max_entradas:
+            self._entradas.popitem(last=False)
+        return resultado
+
+    def limpar(self):
+        self._entradas.clear()
+        self.acertos = 0
+        self.falhas = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+
+# Cache do processo: sobrevive às reexecuções do script do Streamlit
+CACHE_PADRAO = CacheFluxosUnicriterio()
+
+
+def somas_por_criterio(df, criterios, objetivo, funcoes, parametros, cache=None):
+    # Matrizes m×n com S+_j e S-_j de cada critério, na ordem de `criterios`
+    cache = CACHE_PADRAO if cache is None else cache
+    somas_pos = np.empty((len(criterios), len(df)))
+    somas_neg = np.empty((len(criterios), len(df)))
+    for j, crit in enumerate(criterios):
+        funcao = resolver_funcao_preferencia(funcoes[crit], parametros[crit])
+        minimizar = objetivo[crit] in OBJETIVOS_MINIMIZACAO
+        somas_pos[j], somas_neg[j] = cache.somas(df[crit].to_numpy(dtype=float), minimizar, funcao)
+    return somas_pos, somas_neg
+
+
+def combinar_pesos(somas_pos, somas_neg, vetor_pesos, peso_total=None):
+    # ϕ+ e ϕ- para um vetor de pesos (ordem dos critérios) a partir das somas unicritério
+    vetor_pesos = np.asarray(vetor_pesos, dtype=float)
+    n = somas_pos.shape[1]
+    if peso_total is None:
+        peso_total = vetor_pesos.sum()
+    fluxo_positivo = vetor_pesos @ somas_pos / (peso_total * (n - 1))
+    fluxo_negativo = vetor_pesos @ somas_neg / (peso_total * (n - 1))
+    return fluxo_positivo, fluxo_negativo
+
+
+def fluxos_liquidos_unicriterio(somas_pos, somas_neg):
+    # ϕ_j(a) = (S+_j(a) - S-_j(a)) / (n-1), matriz m×n
+    return (somas_pos - somas_neg) / (somas_pos.shape[1] - 1)
+
+
+def calcular_promethee_com_cache(df, criterios, objetivo, pesos, funcoes, parametros, cache=None,
+                                 top_k=None, ultimos=0):
+    # d(a,b) e π(a,b) nunca viram matrizes: ficam dentro das somas unicritério.
+    # Com `top_k`, a tabela traz só os top_k primeiros (e os `ultimos` últimos)
+    # do ranking, escolhidos por seleção parcial (ver motor.montar_top_k)
+    with fase('d(a,b) e π(a,b): somas unicritério'):
+        somas_pos, somas_neg = somas_por_criterio(df, criterios, objetivo, funcoes, parametros, cache)
+    with fase('fluxos'):
+        fluxo_positivo, fluxo_negativo = combinar_pesos(
+            somas_pos, somas_neg,
+            [pesos[crit] for crit in criterios],
+            sum(pesos.values()),
+        )
+    if top_k is not None:
+        return montar_top_k(df.index.tolist(), fluxo_positivo, fluxo_negativo, top_k, ultimos)
+    return montar_resultado(df.index.tolist(), fluxo_positivo, fluxo_negativo)
@@ -0,0 +1,279 @@
+# ===================================
+# Catálogo de critérios e escalas qualitativas
+# ===================================
+# Fonte única das descrições dos 14 critérios de fornecedores sustentáveis e
+# das escalas 1-5 dos critérios qualitativos, usada pelas telas em PT/EN,
+# somente PT e somente EN. Um "(↓)" na descrição indica critério de minimização.
+
+# Telas bilíngues (PT / EN)
+DESCRICAO_CRITERIOS = {
+    'C1 - Custo / Cost': 'Valor monetário em uma moeda específica / Monetary value in a specific currency. (↓)',
+    'C2 - Qualidade / Quality': 'Avaliação subjetiva da qualidade com base em padrões de referência. (↑) / Subjective quality assessment based on benchmark standards. (↑)',
+    'C3 - Entrega / Delivery': 'Prazo de entrega em dias. (↓) / Delivery time in days. (↓)',
+    'C4 - Tecnologia / Technology': 'Nível de inovação e adoção de tecnologias avançadas. (↑) / Level of innovation and adoption of advanced technologies. (↑)',
+    'C5 - Custos ambientais / Environmental Costs': 'Custos ambientais em reais, como multas ou tratamentos. (↓) / Environmental costs in BRL, such as fines or treatment. (↓)',
+    'C6 - Projeto verde / Green Design': 'Grau de adoção de práticas sustentáveis no projeto. (↑) / Degree of adoption of sustainable practices in the project. (↑)',
+    'C7 - Gestão ambiental / Environmental Management': 'Efetividade do sistema de gestão ambiental. (↑) / Effectiveness of the environmental management system. (↑)',
+    'C8 - Partes interessadas / Stakeholders': 'Comprometimento com direitos e atendimento das partes interessadas. (↑) / Commitment to stakeholder rights and service. (↑)',
+    'C9 - Segurança e saúde no trabalho / Occupational Health and Safety': 'Taxa de acidentes ou incidentes ocupacionais. (↓) / Rate of workplace accidents or incidents. (↓)',
+    'C10 - Respeito pela política dos funcionários / Employee Policy Compliance': 'Cumprimento das políticas e direitos dos funcionários. (↑) / Compliance with employee policies and rights. (↑)',
+    'C11 - Gestão social / Social Management': 'Capacidade de implementar práticas de gestão social sustentável. (↑) / Capacity to implement sustainable social management practices. (↑)',
+    'C12 - Histórico de desempenho / Performance History': 'Número de anos em operação. (↑) / Number of years in operation. (↑)',
+    'C13 - Reputação / Reputation': 'Análise de mídia, avaliações e reconhecimentos. (↑) / Media analysis, reviews, and recognitions. (↑)',
+    'C14 - Logística / Logistics': 'Distância em quilômetros. (↓) / Distance in kilometers. (↓)'
+}
+
+ESCALA_QUALITATIVA = {
+    'C2 - Qualidade / Quality': """| Nota | Descrição (PT / EN) |
+|------|----------------------|
+| 1 | Produtos/serviços não atendem aos padrões de qualidade, resultando em retrabalho frequente e feedback negativo. / Products/services do not meet quality standards, leading to frequent rework and negative feedback. |
+| 2 | Produtos/serviços geralmente abaixo do padrão, com problemas ocasionais e feedback predominantemente negativo. / Products/services generally below standard, with occasional issues and mostly negative feedback. |
+| 3 | Produtos/serviços atendem ao padrão mínimo, com problemas ocasionais e feedback variado. / Products/services meet the minimum standard, with occasional problems and mixed feedback. |
+| 4 | Produtos/serviços atendem ou excedem padrões de qualidade, com feedback positivo e poucas rejeições. / Products/services meet or exceed quality standards, with positive feedback and few rejections. |
+| 5 | Produtos/serviços excepcionais, superando consistentemente os padrões, com feedback altamente positivo e mínimas rejeições. / Exceptional products/services, consistently exceeding standards, with highly positive feedback and minimal rejections. |
+""",
+
+    'C4 - Tecnologia / Technology': """| Nota | Descrição (PT / EN) |
+|------|----------------------|
+| 1 | Nenhuma tecnologia atual utilizada; processos manuais predominam. / No current technology used; manual processes dominate. |
+| 2 | Baixa adoção de tecnologia, com melhorias mínimas nos processos. / Low technology adoption, with minimal process improvements. |
+| 3 | Uso moderado de tecnologias conhecidas; eficiência padrão. / Moderate use of known technologies; standard efficiency. |
+| 4 | Alta adoção de tecnologias, promovendo ganho de eficiência. / High adoption of technologies, promoting efficiency gains. |
+| 5 | Utilização de tecnologias de ponta e inovação contínua. / Use of cutting-edge technologies and continuous innovation. |
+""",
+
+    'C6 - Projeto verde / Green Design': """| Nota | Descrição (PT / EN) |
+|------|----------------------|
+| 1 | Nenhuma preocupação com sustentabilidade no projeto. / No concern with sustainability in the project. |
+| 2 | Ações sustentáveis mínimas e pontuais. / Minimal and occasional sustainable actions. |
+| 3 | Algumas iniciativas sustentáveis em práticas ou materiais. / Some sustainable initiatives in practices or materials. |
+| 4 | Projeto incorpora várias práticas sustentáveis relevantes. / Project incorporates various relevant sustainable practices. |
+| 5 | Projeto fortemente orientado à sustentabilidade em todas as etapas. / Project strongly oriented to sustainability in all stages. |
+""",
+
+    'C7 - Gestão ambiental / Environmental Management': """| Nota | Descrição (PT / EN) |
+|------|----------------------|
+| 1 | Sem sistema de gestão ambiental estruturado. / No structured environmental management system. |
+| 2 | Sistema informal e pouco eficaz. / Informal and ineffective system. |
+| 3 | Sistema básico implementado com limitações. / Basic system implemented with limitations. |
+| 4 | Sistema bem estruturado e em conformidade com normas. / Well-structured system in compliance with standards. |
+| 5 | Sistema robusto, certificado e com melhoria contínua. / Robust, certified system with continuous improvement. |
+""",
+
+    'C8 - Partes interessadas / Stakeholders': """| Nota | Descrição (PT / EN) |
+|------|----------------------|
+| 1 | Ignora interesses das partes envolvidas. / Ignores stakeholder interests. |
+| 2 | Responde de forma reativa e limitada. / Reactively and minimally responsive. |
+| 3 | Atendimento mínimo às partes interessadas. / Minimal stakeholder engagement. |
+| 4 | Compromisso com políticas de engajamento ativo. / Commitment to active engagement policies. |
+| 5 | Envolvimento transparente, ativo e responsável. / Transparent, active, and responsible stakeholder involvement. |
+""",
+
+    'C10 - Respeito pela política dos funcionários / Employee Policy Compliance': """| Nota | Descrição (PT / EN) |
+|------|----------------------|
+| 1 | Não respeita normas trabalhistas básicas. / Does not respect basic labor standards. |
+| 2 | Apresenta falhas frequentes no cumprimento das normas. / Frequent failures in policy compliance. |
+| 3 | Cumpre requisitos mínimos exigidos por lei. / Complies with minimum legal requirements. |
+| 4 | Cumpre e monitora práticas e direitos dos funcionários. / Complies with and monitors employee rights and practices. |
+| 5 | Promove ambiente justo, seguro e participativo. / Promotes a fair, safe, and participatory environment. |
+""",
+
+    'C11 - Gestão social / Social Management': """| Nota | Descrição (PT / EN) |
+|------|----------------------|
+| 1 | Nenhuma ação voltada ao bem-estar social. / No action focused on social well-being. |
+| 2 | Práticas sociais reativas e pouco estruturadas. / Reactive and poorly structured social practices. |
+| 3 | Algumas práticas sociais implementadas. / Some social practices implemented. |
+| 4 | Políticas sociais definidas e em operação. / Defined and operational social policies. |
+| 5 | Gestão social estratégica, com forte impacto positivo. / Strategic social management with strong positive impact. |
+""",
+
+    'C13 - Reputação / Reputation': """| Nota | Descrição (PT / EN) |
+|------|----------------------|
+| 1 | Reputação muito negativa ou desconhecida. / Very negative or unknown reputation. |
+| 2 | Imagem desfavorável ou instável no mercado. / Unfavorable or unstable market image. |
+| 3 | Reputação aceitável, sem grandes destaques. / Acceptable reputation, no major highlights. |
+| 4 | Boa reputação com avaliações positivas consistentes. / Good reputation with consistent positive evaluations. |
+| 5 | Reputação excelente, reconhecida amplamente no setor. / Excellent reputation, widely recognized in the industry. |
+"""
+}
+
+# Tela somente em português
+DESCRICAO_CRITERIOS_PT = {
+    'C1 - Preço': 'Valor monetário em reais. (↓)',
+    'C2 - Qualidade': 'Avaliação subjetiva da qualidade com base em padrões de referência. (↑)',
+    'C3 - Entrega': 'Prazo de entrega em dias. (↓)',
+    'C4 - Tecnologia': 'Nível de inovação e adoção de tecnologias avançadas. (↑)',
+    'C5 - Custos ambientais': 'Custos ambientais em reais, como multas ou tratamentos. (↓)',
+    'C6 - Projeto verde': 'Grau de adoção de práticas sustentáveis no projeto. (↑)',
+    'C7 - Gestão ambiental': 'Efetividade do sistema de gestão ambiental. (↑)',
+    'C8 - Partes interessadas': 'Comprometimento com direitos e atendimento das partes interessadas. (↑)',
+    'C9 - Segurança e saúde no trabalho': 'Taxa de acidentes ou incidentes ocupacionais. (↓)',
+    'C10 - Respeito pela política dos funcionários': 'Cumprimento das políticas e direitos dos funcionários. (↑)',
+    'C11 - Gestão social': 'Capacidade de implementar práticas de gestão social sustentável. (↑)',
+    'C12 - Histórico de desempenho': 'Número de anos em operação. (↑)',
+    'C13 - Reputação': 'Análise de mídia, avaliações e reconhecimentos. (↑)',
+    'C14 - Logística': 'Distância em quilômetros. (↓)'
+}
+
+ESCALA_QUALITATIVA_PT = {
+    'C2 - Qualidade': """| Nota | Descrição |
+|------|-----------|
+| 1 | Produtos/serviços não atendem aos padrões de qualidade, resultando em retrabalho frequente e feedback negativo. |
+| 2 | Produtos/serviços geralmente abaixo do padrão, com problemas ocasionais e feedback predominantemente negativo. |
+| 3 | Produtos/serviços atendem ao padrão mínimo, com problemas ocasionais e feedback variado. |
+| 4 | Produtos/serviços atendem ou excedem padrões de qualidade, com feedback positivo e poucas rejeições. |
+| 5 | Produtos/serviços excepcionais, superando consistentemente os padrões, com feedback altamente positivo e mínimas rejeições. |""",
+
+    'C4 - Tecnologia': """| Nota | Descrição |
+|------|-----------|
+| 1 | Práticas e tecnologias desatualizadas, sem inovação ou certificações. |
+| 2 | Investimento limitado em tecnologia, com melhorias inconsistentes e poucas certificações. |
+| 3 | Alguma inovação e tecnologias avançadas em áreas específicas, mas não abrangente. |
+| 4 | Alinhado com as melhores práticas, com certificações, prêmios e parcerias relevantes. |
+| 5 | Líder em inovação, com certificações ISO, prêmios e parcerias estratégicas. |""",
+
+    'C6 - Projeto verde': """| Nota | Descrição |
+|------|-----------|
+| 1 | Sem práticas sustentáveis, ecoeficiência, certificações ou uso de energias renováveis. |
+| 2 | Esforços limitados em sustentabilidade, poucas certificações, uso esporádico de energias renováveis. |
+| 3 | Algumas práticas sustentáveis e certificações, uso moderado de energias renováveis. |
+| 4 | Práticas ecoeficientes, certificações reconhecidas, uso consistente de energias renováveis e materiais sustentáveis. |
+| 5 | Líder em sustentabilidade, práticas altamente ecoeficientes, certificações destacadas, uso significativo de energias renováveis e materiais sustentáveis. |""",
+
+    'C7 - Gestão ambiental': """| Nota | Descrição |
+|------|-----------|
+| 1 | Sem sistema de gestão ambiental, não conformidade com regulamentações, nenhuma documentação ou programas de treinamento. |
+| 2 | Esforços limitados em gestão ambiental, conformidade parcial, pouca documentação e poucos programas de treinamento. |
+| 3 | Capacidade moderada em gestão ambiental, conformidade parcial, documentação adequada, programas de treinamento limitados. |
+| 4 | Sistema de gestão ambiental eficaz, conformidade com regulamentações, documentação abrangente, programas de treinamento disponíveis. |
+| 5 | Líder em gestão ambiental, total conformidade, excelente documentação, programas de treinamento exemplares. |""",
+
+    'C8 - Partes interessadas': """| Nota | Descrição |
+|------|-----------|
+| 1 | Sem comprometimento com direitos das partes interessadas, não conformidade com normas, condições de trabalho e atendimento deficientes. |
+| 2 | Comprometimento limitado, conformidade parcial com normas, condições de trabalho e atendimento inconsistentes. |
+| 3 | Cumprimento parcial das normas, condições de trabalho e atendimento aceitáveis, feedback misto. |
+| 4 | Comprometimento sólido, conformidade com normas, condições de trabalho e atendimento de alta qualidade, feedback positivo. |
+| 5 | Comprometimento exemplar, alinhamento com melhores práticas, excelentes condições de trabalho e atendimento, feedback extremamente positivo. |""",
+
+    'C10 - Respeito pela política dos funcionários': """| Nota | Descrição |
+|------|-----------|
+| 1 | Sem comprometimento com igualdade, diversidade e não discriminação; ausência de políticas e procedimentos. |
+| 2 | Comprometimento mínimo, políticas limitadas e ineficazes, promoção de diversidade e inclusão é insuficiente. |
+| 3 | Comprometimento parcial, políticas e procedimentos adequados, alguns esforços na promoção da diversidade e inclusão. |
+| 4 | Comprometimento sólido, políticas alinhadas com melhores práticas, promoção ativa da diversidade e inclusão, políticas e procedimentos eficazes. |
+| 5 | Comprometimento exemplar, políticas abrangentes, promoção fundamental da diversidade e inclusão, procedimentos robustos e igualdade de oportunidades clara. |""",
+
+    'C11 - Gestão social': """| Nota | Descrição |
+|------|-----------|
+| 1 | Ausência de políticas de responsabilidade social corporativa (RSC), nenhum apoio à comunidade ou desenvolvimento sustentável. |
+| 2 | Políticas de RSC limitadas, poucas ações concretas em apoio à comunidade e desenvolvimento sustentável, envolvimento mínimo com organizações sem fins lucrativos. |
+| 3 | Algumas políticas de RSC e ações em apoio à comunidade, parcialmente desenvolvidas, envolvimento moderado com organizações sem fins lucrativos. |
+| 4 | Políticas sólidas de RSC, envolvimento ativo em ações de apoio à comunidade e desenvolvimento sustentável, colaboração com organizações sem fins lucrativos. |
+| 5 | Excelência em RSC, políticas abrangentes e eficazes, significativo apoio à comunidade, desenvolvimento sustentável e filantropia, colaboração destacada com organizações sem fins lucrativos. |""",
+
+    'C13 - Reputação': """| Nota | Descrição |
+|------|-----------|
+| 1 | Reportagens negativas frequentes na mídia, avaliações online predominantemente negativas (1-2 estrelas), problemas recorrentes de conformidade. |
+| 2 | Reportagens negativas ocasionais, avaliações abaixo da média (2-3 estrelas), questões esporádicas de conformidade. |
+| 3 | Raramente em mídia, avaliações medianas (3 estrelas), conformidade com normas básicas sem grandes problemas. |
+| 4 | Reportagens positivas frequentes, avaliações acima da média (4 estrelas), conformidade com todas as normas relevantes, boas práticas reconhecidas. |
+| 5 | Destaque positivo constante na mídia, avaliações muito altas (4-5 estrelas), conformidade exemplar, líder em boas práticas. |"""
+}
+
+# Tela somente em inglês
+DESCRICAO_CRITERIOS_EN = {
+    'C1 - Cost': 'Monetary cost of the proposal.(↓)',
+    'C2 - Quality': 'Subjective quality assessment based on benchmark standards. (↑)',
+    'C3 - Delivery': 'Delivery time in days. (↓)',
+    'C4 - Technology': 'Level of innovation and adoption of advanced technologies. (↑)',
+    'C5 - Environmental Costs': 'Annual monetary value or percentage of revenue invested in environmental management (e.g., waste treatment, emissions control, certifications). (↓)',
+    'C6 - Green Design': 'Degree of integration of sustainable design practices in the supplier’s products, services, or processes, including choice of materials, production methods, packaging, and lifecycle considerations. (↑)',
+    'C7 - Environmental Management': 'Effectiveness of the environmental management system. (↑)',
+    'C8 - Stakeholders Management': 'Commitment to stakeholder rights and service. (↑)',
+    'C9 - Occupational Health and Safety': (
+        'TRIR calculated according to OSHA methodology (Total Recordable Incident Rate). '
+        'Value provided by the supplier or verified via audit/documentation. (↓)\n\n'
+        'TRIR = (Total number of recordable incidents × 200,000) / Total hours worked by all employees.'
+    ),
+    'C10 - Compliance with Labor Policies': 'Adherence to employee rights, labor laws, and ethical workplace standards, including diversity, inclusion, and non-discrimination measures. Evidence may include labor policy documents, compliance certificates (e.g., SA8000), diversity reports, and complaint-handling procedures. (↑)',
+    'C11 - Social Management': 'Capacity to develop and implement structured social responsibility policies and programs, including community engagement, partnerships with NGOs, and measurable contributions to social well-being. Evidence may include CSR reports, certifications (ISO 26000, SA8000), project portfolios, and investment data. (↑)',
+    'C12 - Performance History': 'Number of years of experience. (↑)',
+    'C13 - Reputation': 'Media analysis, reviews, and recognitions. (↑)',
+    'C14 - Logistics': 'Distance in kilometers. (↓)'
+}
+
+ESCALA_QUALITATIVA_EN = {
+    'C2 - Quality': """| Scale Level | Description |
+|------|-------------|
+| 1 | Products/services do not meet quality standards, leading to frequent rework and negative feedback. |
+| 2 | Products/services generally below standard, with occasional issues and mostly negative feedback. |
+| 3 | Products/services meet the minimum standard, with occasional problems and mixed feedback. |
+| 4 | Products/services meet or exceed quality standards, with positive feedback and few rejections. |
+| 5 | Exceptional products/services, consistently exceeding standards, with highly positive feedback and minimal rejections. |
+""",
+
+    'C4 - Technology': """| Scale Level | Description |
+|------|-------------|
+| 1 | No current technology used; manual processes dominate. |
+| 2 | Low technology adoption, with minimal process improvements. |
+| 3 | Moderate use of known technologies; standard efficiency. |
+| 4 | High adoption of technologies, promoting efficiency gains. |
+| 5 | Use of cutting-edge technologies and continuous innovation. |
+""",
+
+    'C6 - Green Design': """| Scale Level | Description |
+|------|-------------|
+| 1 | The supplier does not apply any sustainable design principles. Products/services are developed without consideration for environmental impacts, recyclability, or resource efficiency. |
+| 2 | Minimal and occasional sustainable actions in design. Examples: limited use of recyclable materials or occasional waste reduction initiatives. No systematic approach. |
+| 3 | Some sustainable design initiatives are present, such as partial use of eco-friendly materials, basic packaging reduction, or energy efficiency in certain processes. However, these are not applied consistently across all projects. |
+| 4 | Sustainable design principles are incorporated in several key aspects of the supplier’s operations: consistent use of recyclable or renewable materials, reduced energy consumption, optimized packaging, and partial application of lifecycle assessment. |
+| 5 | The supplier’s design approach is fully sustainability-oriented, integrating eco-design principles at every stage: product conception, material selection, manufacturing, packaging, and end-of-life. Includes full lifecycle assessment, zero-waste strategies, renewable energy use, and alignment with international eco-certifications. |
+""",
+
+    'C7 - Environmental Management': """| Scale Level | Description |
+|------|-------------|
+| 1 | No structured environmental management system. |
+| 2 | Informal and ineffective system. |
+| 3 | Basic system implemented with limitations. |
+| 4 | Well-structured system in compliance with standards. |
+| 5 | Robust, certified system with continuous improvement. |
+""",
+
+    'C8 - Stakeholders Management': """| Scale Level | Description |
+|------|-------------|
+| 1 | Ignores stakeholder interests. |
+| 2 | Reactively and minimally responsive. |
+| 3 | Minimal stakeholder engagement. |
+| 4 | Commitment to active engagement policies. |
+| 5 | Transparent, active, and responsible stakeholder involvement. |
+""",
+
+    'C10 - Compliance with Labor Policies': """| Scale Level | Description |
+|------|-------------|
+| 1 | No formal labor policies; repeated violations in last 3 years. |
+| 2 | Minimal/incomplete policies; limited diversity/inclusion; minor violations. |
+| 3 | Basic policies covering essential rights; some diversity efforts; no serious violations. |
+| 4 | Comprehensive policies aligned with law; active diversity programs; no violations. |
+| 5 | Exemplary policies exceeding legal requirements; diversity and inclusion embedded in culture; recognized certifications or awards. |
+""",
+
+    'C11 - Social Management': """| Scale Level | Description |
+|------|-------------|
+| 1 | No CSR policies or social initiatives. |
+| 2 | Limited or reactive initiatives with minimal documentation. |
+| 3 | Some structured social programs, but inconsistent execution or limited scope. |
+| 4 | Comprehensive CSR policies with consistent community engagement and documented results. |
+| 5 | Strategic, certified, and impactful CSR programs integrated into corporate culture. |
+""",
+
+    'C13 - Reputation': """| Scale Level | Description |
+|------|-------------|
+| 1 | Very negative or unknown reputation. |
+| 2 | Unfavorable or unstable market image. |
+| 3 | Acceptable reputation, no major highlights. |
+| 4 | Good reputation with consistent positive evaluations. |
+| 5 | Excellent reputation, widely recognized in the industry. |
+"""
+}
+
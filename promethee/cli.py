@@ -0,0 +1,219 @@
+# ===================================
+# Execução em lote de cenários PROMETHEE II (sem Streamlit)
+# ===================================
+# python -m promethee cenarios/ --saida resultados --formato csv --processos 4
+#
+# Cada cenário é um arquivo JSON ou TOML:
+#   {
+#     "fornecedores": {"Fornecedor A": {"C1": 10, "C2": 3}, ...},
+#     "criterios": {
+#       "C1": {"peso": 1, "objetivo": "Minimizado", "funcao": "Área de indiferença", "q": 1, "p": 5},
+#       "C2": {"peso": 2, "objetivo": "Maximizado", "funcao": "Usual"}
+#     }
+#   }
+# "objetivo" aceita os rótulos das telas (Maximizado/Minimizado, Maximize/Minimize,
+# Maximização/Minimização; padrão Maximizado); qualquer outro é recusado.
+# Em vez de "fornecedores" pode vir "arquivo" (CSV, XLSX ou Parquet, caminho
+# relativo ao cenário) e, opcionalmente, "filtros" ("Regiao == Sul; C1 <= 1000").
+# "motor" escolhe o cálculo: "completo" (padrão, mesmo da tela), "fluxos", "blocos",
+# "cache" (somas unicritério guardadas entre cenários do mesmo processo) ou
+# "duplicados" (fornecedores com o mesmo perfil calculados uma vez só).
+import argparse
+import json
+import os
+import sys
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import pandas as pd
+
+from .blocos import calcular_promethee_em_blocos
+from .cache import calcular_promethee_com_cache
+from .duplicados import calcular_promethee_sem_duplicados
+from .erros import ErroEntrada
+from .fluxos import calcular_promethee_somente_fluxos
+from .importacao import importar_matriz_desempenho
+from .ingestao import interpretar_filtros
+from .motor import OBJETIVOS_MAXIMIZACAO, OBJETIVOS_MINIMIZACAO, calcular_promethee_sem_normalizar
+from .preferencias import resolver_funcao_preferencia
+
+FORMATOS_SAIDA = ('csv', 'json', 'parquet')
+EXTENSOES_CENARIO = ('.json', '.toml')
+
+
+def _motor_completo(df, criterios, objetivo, pesos, funcoes, parametros):
+    return calcular_promethee_sem_normalizar(df, criterios, objetivo, pesos, funcoes, parametros)[0]
+
+
+MOTORES = {
+    'completo': _motor_completo,
+    'fluxos': calcular_promethee_somente_fluxos,
+    'blocos': calcular_promethee_em_blocos,
+    'cache': calcular_promethee_com_cache,
+    'duplicados': calcular_promethee_sem_duplicados,
+}
+
+
+def carregar_cenario(caminho):
+    # Retorna (motor, df, criterios, objetivo, pesos, funcoes, parametros)
+    caminho = Path(caminho)
+    with open(caminho, 'rb') as arquivo:
+        cenario = tomllib.load(arquivo) if caminho.suffix.lower() == '.toml' else json.load(arquivo)
+    return interpretar_cenario(cenario, caminho.parent)
+
+
+def _numero(valor):
+    # bool é int no Python, mas não vale como peso ou parâmetro
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+
+def interpretar_cenario(cenario, pasta=None, motor_padrao='completo'):
+    # `pasta` resolve o caminho de "arquivo"; sem ela só vale "fornecedores".
+    # Qualquer problema no conteúdo do cenário sai como ErroEntrada, antes do cálculo
+    config = cenario.get('criterios')
+    if not config:
+        raise ErroEntrada("o cenário não define 'criterios'")
+    if not isinstance(config, dict) or not all(isinstance(item, dict) for item in config.values()):
+        raise ErroEntrada("'criterios' deve associar cada critério a um objeto com peso, objetivo, funcao e q/p/s")
+    criterios = list(config)
+    for crit in criterios:
+        invalidos = [k for k in ('peso', 'q', 'p', 'r', 's') if k in config[crit] and not _numero(config[crit][k])]
+        if invalidos:
+            raise ErroEntrada(f"critério {crit!r}: {', '.join(invalidos)} deve ser numérico")
+    pesos = {crit: float(config[crit].get('peso', 1.0)) for crit in criterios}
+    objetivo = {crit: config[crit].get('objetivo', 'Maximizado') for crit in criterios}
+    for crit in criterios:
+        # Um rótulo desconhecido seria tratado como maximização e inverteria o ranking
+        if objetivo[crit] not in OBJETIVOS_MAXIMIZACAO + OBJETIVOS_MINIMIZACAO:
+            raise ErroEntrada(f"critério {crit!r}: objetivo desconhecido {objetivo[crit]!r} "
+                              f"(use {', '.join(OBJETIVOS_MAXIMIZACAO + OBJETIVOS_MINIMIZACAO)})")
+    funcoes = {crit: config[crit].get('funcao', 'Usual') for crit in criterios}
+    parametros = {crit: {k: config[crit][k] for k in ('q', 'p', 'r', 's') if k in config[crit]}
+                  for crit in criterios}
+    for crit in criterios:
+        # Nome e parâmetros da função validados aqui, e não no meio do cálculo
+        try:
+            resolver_funcao_preferencia(funcoes[crit], parametros[crit])
+        except ErroEntrada as erro:
+            raise ErroEntrada(f"critério {crit!r}: {erro}") from None
+
+    if 'fornecedores' in cenario:
+        fornecedores = cenario['fornecedores']
+        if not isinstance(fornecedores, dict) or not all(isinstance(valores, dict) for valores in fornecedores.values()):
+            raise ErroEntrada("'fornecedores' deve associar cada fornecedor aos seus valores por critério")
+        df = pd.DataFrame.from_dict(fornecedores, orient='index')
+        faltantes = [crit for crit in criterios if crit not in df.columns]
+        if faltantes:
+            raise ErroEntrada(f"critérios sem valores em 'fornecedores': {', '.join(faltantes)}")
+        df = df[criterios].copy()
+        for crit in criterios:
+            if not pd.api.types.is_numeric_dtype(df[crit]) or pd.api.types.is_bool_dtype(df[crit]):
+                invalidos = [nome for nome, valor in df[crit].items() if not (_numero(valor) or pd.isna(valor))]
+                if invalidos:
+                    raise ErroEntrada(f"valor não numérico no critério {crit!r} para: {', '.join(map(str, invalidos[:5]))}")
+                df[crit] = pd.to_numeric(df[crit])
+        ausentes = df.index[df.isna().any(axis=1)]
+        if len(ausentes):
+            raise ErroEntrada(f"valores ausentes para: {', '.join(map(str, ausentes[:5]))}")
+    elif 'arquivo' in cenario and pasta is not None:
+        dados = Path(pasta) / cenario['arquivo']
+        df, _ = importar_matriz_desempenho(
+            dados.read_bytes(), dados.name, criterios, interpretar_filtros(cenario.get('filtros', ''))
+        )
+        faltantes = [crit for crit in criterios if crit not in df.columns]
+        if faltantes:
+            raise ErroEntrada(f"critérios ausentes em {dados.name}: {', '.join(faltantes)}")
+    elif 'arquivo' in cenario:
+        raise ErroEntrada("'arquivo' só vale em cenários lidos do disco; envie os dados em 'fornecedores'")
+    else:
+        raise ErroEntrada("o cenário precisa de 'fornecedores' ou 'arquivo'")
+
+    if len(df) < 2:
+        raise ErroEntrada("são necessários pelo menos dois fornecedores")
+
+    motor = cenario.get('motor', motor_padrao)
+    if not isinstance(motor, str) or motor not in MOTORES:
+        raise ErroEntrada(f"motor desconhecido: {motor!r} (use {', '.join(MOTORES)})")
+    return motor, df, criterios, objetivo, pesos, funcoes, parametros
+
+
+def salvar_resultado(resultado, destino, formato):
+    if formato == 'csv':
+        resultado.to_csv(destino, index=False)
+    elif formato == 'json':
+        resultado.to_json(destino, orient='records', force_ascii=False, indent=2)
+    else:
+        resultado.to_parquet(destino, index=False)
+
+
+def processar_cenario(caminho, pasta_saida, formato):
+    # (caminho, fornecedores, segundos, erro); erros não interrompem o lote
+    inicio = time.perf_counter()
+    try:
+        motor, *argumentos = carregar_cenario(caminho)
+        resultado = MOTORES[motor](*argumentos)
+        salvar_resultado(resultado, Path(pasta_saida) / f"{Path(caminho).stem}.{formato}", formato)
+        return str(caminho), len(resultado), time.perf_counter() - inicio, None
+    except Exception as erro:
+        return str(caminho), 0, time.perf_counter() - inicio, f"{type(erro).__name__}: {erro}"
+
+
+def _listar_cenarios(entradas):
+    caminhos = []
+    for entrada in map(Path, entradas):
+        if entrada.is_dir():
+            caminhos.extend(sorted(p for p in entrada.iterdir() if p.suffix.lower() in EXTENSOES_CENARIO))
+        else:
+            caminhos.append(entrada)
+    return caminhos
+
+
+def executar_lote(caminhos, pasta_saida, formato='csv', processos=None):
+    # Cenários são independentes: um processo por cenário, sem estado compartilhado
+    Path(pasta_saida).mkdir(parents=True, exist_ok=True)
+    if processos is None:
+        processos = os.cpu_count() or 1
+    processos = max(1, min(processos, len(caminhos)))
+
+    if processos == 1:
+        return [processar_cenario(caminho, pasta_saida, formato) for caminho in caminhos]
+
+    # Lotes de cenários por tarefa diluem o custo de comunicação entre processos
+    tamanho_lote = max(1, len(caminhos) // (4 * processos))
+    with ProcessPoolExecutor(max_workers=processos, mp_context=get_context('spawn')) as pool:
+        return list(pool.map(processar_cenario, caminhos, [pasta_saida] * len(caminhos),
+                             [formato] * len(caminhos), chunksize=tamanho_lote))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m promethee',
+        description="Calcula o ranking PROMETHEE II de arquivos de cenário (JSON ou TOML).",
+    )
+    parser.add_argument('cenarios', nargs='+', help="arquivos de cenário ou pastas que os contêm")
+    parser.add_argument('--saida', default='resultados', help="pasta de saída (padrão: resultados)")
+    parser.add_argument('--formato', choices=FORMATOS_SAIDA, default='csv', help="formato dos rankings")
+    parser.add_argument('--processos', type=int, default=None,
+                        help="processos em paralelo (padrão: número de CPUs)")
+    args = parser.parse_args(argv)
+
+    caminhos = _listar_cenarios(args.cenarios)
+    if not caminhos:
+        parser.error("nenhum arquivo de cenário encontrado")
+
+    inicio = time.perf_counter()
+    resultados = executar_lote(caminhos, args.saida, args.formato, args.processos)
+    falhas = 0
+    for caminho, n, segundos, erro in resultados:
+        if erro is None:
+            print(f"{caminho}: {n} fornecedores em {segundos:.3f} s")
+        else:
+            falhas += 1
+            print(f"{caminho}: ERRO {erro}", file=sys.stderr)
+
+    total = time.perf_counter() - inicio
+    print(f"{len(caminhos) - falhas}/{len(caminhos)} cenários em {total:.2f} s → {args.saida}")
+    return 1 if falhas else 0
@@ -0,0 +1,68 @@
+# ===================================
+# Associação das colunas de arquivos aos critérios
+# ===================================
+# Usado pela importação interativa e pela ingestão em blocos: a coluna é
+# reconhecida pela chave completa, pelo nome em PT/EN ou pelo código Cn.
+import re
+import unicodedata
+
+import pandas as pd
+
+from .erros import ErroEntrada
+
+
+def _normalizar(texto):
+    texto = unicodedata.normalize('NFKD', str(texto))
+    return ''.join(c for c in texto if not unicodedata.combining(c)).strip().lower()
+
+
+def mapear_colunas(colunas, criterios_conhecidos=None):
+    # {coluna do arquivo: critério}; sem critérios conhecidos a coluna mantém o nome
+    if criterios_conhecidos is None:
+        return {}
+
+    por_codigo = {}
+    por_nome = {}
+    for crit in criterios_conhecidos:
+        codigo, _, nomes = crit.partition(' - ')
+        por_codigo[codigo.strip().upper()] = crit
+        por_nome[_normalizar(crit)] = crit
+        for nome in nomes.split(' / '):
+            por_nome[_normalizar(nome)] = crit
+
+    mapeamento = {}
+    for coluna in colunas:
+        if coluna in criterios_conhecidos:
+            crit = coluna
+        elif _normalizar(coluna) in por_nome:
+            crit = por_nome[_normalizar(coluna)]
+        else:
+            codigo = re.search(r'\bC\s*(\d+)\b', str(coluna), flags=re.IGNORECASE)
+            crit = por_codigo.get(f"C{codigo.group(1)}") if codigo else None
+        if crit is not None and crit not in mapeamento.values():
+            mapeamento[coluna] = crit
+    return mapeamento
+
+
+def colunas_criterios(colunas, criterios_conhecidos=None):
+    # (coluna de rótulos ou None, {coluna: critério})
+    # Sem catálogo: a primeira coluna são os fornecedores e as demais, critérios
+    colunas = list(colunas)
+    if criterios_conhecidos is None:
+        return colunas[0], {c: str(c) for c in colunas[1:]}
+    mapeamento = mapear_colunas(colunas, criterios_conhecidos)
+    rotulos = [c for c in colunas if c not in mapeamento]
+    return (rotulos[0] if rotulos else None), mapeamento
+
+
+def converter_float(df, colunas, tipo='float64', deslocamento=0):
+    # Converte e valida em uma passada; aponta a primeira célula não numérica
+    for coluna in colunas:
+        convertida = pd.to_numeric(df[coluna], errors='coerce').astype(tipo)
+        invalidas = convertida.isna() & df[coluna].notna()
+        if invalidas.any():
+            linha = int(invalidas.to_numpy().argmax())
+            raise ErroEntrada(f"valor não numérico {df[coluna].iloc[linha]!r} na coluna {coluna!r} "
+                             f"(linha {deslocamento + linha})")
+        df[coluna] = convertida
+    return df
@@ -0,0 +1,138 @@
+# ===================================
+# Matrizes π_j(a,b) compactas
+# ===================================
+# Nas funções Usual e Quase-critério π_j(a,b) só vale 0 ou 1, e no
+# Pseudo-critério só 0, 0,5 ou 1; em float64 cada par custa 8 bytes. O motor
+# completo guarda essas matrizes compactadas:
+#   MatrizBinaria: 1 bit por par (np.packbits), 64× menor que float64
+#   MatrizNivel:   int8 com 2·π (0, 1 ou 2), 8× menor
+# Somas por linha e por coluna (ϕ+ e ϕ- do critério) saem direto do formato
+# compacto, por popcount nos bits. Para as telas e a exportação elas se
+# comportam como o array denso: np.asarray e pd.DataFrame (via __array__),
+# shape, indexação [i, j] (fatias, listas e np.ix_, com a semântica do
+# ndarray) e sum(axis=...) devolvem float64 com os mesmos valores.
+import numpy as np
+
+from .preferencias import PseudoCriterio, QuaseCriterio, Usual
+
+# np.bitwise_count só existe a partir do numpy 2; antes, tabela de 256 contagens
+if hasattr(np, 'bitwise_count'):
+    _popcount = np.bitwise_count
+else:
+    _BITS_POR_BYTE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1).sum(axis=1, dtype=np.uint8)
+
+    def _popcount(dados):
+        return _BITS_POR_BYTE[dados]
+
+
+def _avancado(indice):
+    # Lista ou array de posições (indexação avançada do numpy)
+    return not isinstance(indice, slice) and indice is not Ellipsis and np.ndim(indice) > 0
+
+
+def _posicoes(indice):
+    indice = np.asarray(indice)
+    return np.flatnonzero(indice) if indice.dtype == bool else indice
+
+
+class _MatrizCompacta:
+    ndim = 2
+    dtype = np.dtype(float)
+
+    def __init__(self, shape, dados):
+        self.shape = shape
+        self._dados = dados
+
+    @property
+    def nbytes(self):
+        return self._dados.nbytes
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        for i in range(self.shape[0]):
+            yield self[i]
+
+    def __getitem__(self, indice):
+        # Só as linhas pedidas são decodificadas
+        if not isinstance(indice, tuple):
+            indice = (indice,)
+        if len(indice) > 2:
+            raise IndexError(f"muitos índices para uma matriz 2D: {len(indice)}")
+        linhas, colunas = indice if len(indice) == 2 else (indice[0], slice(None))
+        if _avancado(linhas) and _avancado(colunas):
+            # Como no ndarray: os dois arrays são pareados por broadcast (m[[0, 1], [2, 3]]
+            # são os elementos (0, 2) e (1, 3); o produto cartesiano é m[np.ix_(...)])
+            try:
+                linhas, colunas = np.broadcast_arrays(_posicoes(linhas), _posicoes(colunas))
+            except ValueError as erro:
+                raise IndexError(str(erro)) from None
+            unicas, posicao = np.unique(linhas, return_inverse=True)
+            denso = self._decodificar(self._dados[unicas])
+            return denso[posicao.reshape(linhas.shape), colunas]
+        dados = self._dados[linhas]
+        denso = self._decodificar(dados.reshape(-1, dados.shape[-1]))
+        return denso.reshape(dados.shape[:-1] + (self.shape[1],))[..., colunas]
+
+    def __array__(self, dtype=None, copy=None):
+        denso = self._decodificar(self._dados)
+        return denso if dtype is None else denso.astype(dtype, copy=False)
+
+    def sum(self, axis=None):
+        if axis == 1:
+            return self.somas_linhas()
+        if axis == 0:
+            return self.somas_colunas()
+        return float(self.somas_linhas().sum())
+
+    def __repr__(self):
+        return f"{type(self).__name__}(shape={self.shape}, nbytes={self.nbytes})"
+
+
+class MatrizBinaria(_MatrizCompacta):
+    def __init__(self, pref):
+        pref = np.asarray(pref)
+        super().__init__(pref.shape, np.packbits(pref != 0, axis=1))
+
+    def _decodificar(self, dados):
+        return np.unpackbits(dados, axis=1, count=self.shape[1]).astype(float)
+
+    def somas_linhas(self):
+        # Os bits de preenchimento do último byte são zero
+        return _popcount(self._dados).sum(axis=1, dtype=np.int64).astype(float)
+
+    def somas_colunas(self):
+        # A coluna 8c+k é o bit k (a partir do mais significativo) do byte c
+        # de cada linha: oito passadas sobre os bytes, sem desempacotar
+        somas = np.empty((self._dados.shape[1], 8))
+        for k in range(8):
+            somas[:, k] = ((self._dados >> (7 - k)) & 1).sum(axis=0, dtype=np.int64)
+        return somas.ravel()[:self.shape[1]]
+
+
+class MatrizNivel(_MatrizCompacta):
+    def __init__(self, pref):
+        pref = np.asarray(pref)
+        # 2·π montado com comparações (1 byte por par), sem temporário float64
+        dados = (pref > 0).view(np.int8)
+        dados += pref >= 1
+        super().__init__(pref.shape, dados)
+
+    def _decodificar(self, dados):
+        return dados / 2
+
+    def somas_linhas(self):
+        return self._dados.sum(axis=1, dtype=np.int64) / 2
+
+    def somas_colunas(self):
+        return self._dados.sum(axis=0, dtype=np.int64) / 2
+
+
+def compactar(pref, funcao):
+    # π_j no formato mais compacto que guarda exatamente os valores de `funcao`
+    if isinstance(funcao, (Usual, QuaseCriterio)):
+        return MatrizBinaria(pref)
+    if isinstance(funcao, PseudoCriterio):
+        return MatrizNivel(pref)
+    return pref
@@ -0,0 +1,71 @@
+# ===================================
+# Blocos das matrizes de detalhe sob demanda
+# ===================================
+# As telas mostram d(a,b), π_j(a,b), π(a,b) e π(a,b) - π(b,a) só para o
+# recorte visível (linhas × colunas), em vez de montar as matrizes n×n de
+# todos os critérios antes de exibir o ranking. Os valores são os mesmos do
+# motor completo (calcular_promethee_sem_normalizar).
+import numpy as np
+import pandas as pd
+
+from .motor import OBJETIVOS_MINIMIZACAO
+from .preferencias import resolver_funcao_preferencia
+
+MATRIZES_DETALHE = (
+    'Diferenças d(a,b)',
+    'Preferência por critério π_j(a,b)',
+    'Preferência agregada π(a,b)',
+    'Fluxo líquido π(a,b) - π(b,a)',
+)
+
+
+def _posicoes(df, nomes):
+    return df.index.get_indexer(pd.Index(nomes))
+
+
+def _diferencas(df, crit, objetivo, linhas, colunas):
+    # Mesma aritmética do motor: colunas inteiras são subtraídas como inteiros
+    valores = df[crit].to_numpy()
+    if valores.dtype.kind not in 'iu':
+        valores = valores.astype(float)
+    d = valores[linhas][:, np.newaxis] - valores[colunas][np.newaxis, :]
+    if objetivo[crit] in OBJETIVOS_MINIMIZACAO:
+        d = -d
+    d = d.astype(float)
+    d[linhas[:, np.newaxis] == colunas[np.newaxis, :]] = 0
+    return d
+
+
+def _preferencia(df, crit, objetivo, funcoes, parametros, linhas, colunas):
+    pref = resolver_funcao_preferencia(funcoes[crit], parametros[crit])(
+        _diferencas(df, crit, objetivo, linhas, colunas))
+    pref[linhas[:, np.newaxis] == colunas[np.newaxis, :]] = 0
+    return pref
+
+
+def _agregada(df, criterios, objetivo, pesos, funcoes, parametros, linhas, colunas):
+    agregada = np.zeros((len(linhas), len(colunas)))
+    for crit in criterios:
+        agregada += pesos[crit] * _preferencia(df, crit, objetivo, funcoes, parametros, linhas, colunas)
+    return agregada / sum(pesos.values())
+
+
+def bloco_detalhe(df, criterios, objetivo, pesos, funcoes, parametros, tipo,
+                  nomes_linhas, nomes_colunas, criterio=None):
+    # Recorte linhas × colunas da matriz `tipo` (um dos MATRIZES_DETALHE)
+    linhas = _posicoes(df, nomes_linhas)
+    colunas = _posicoes(df, nomes_colunas)
+
+    if tipo == MATRIZES_DETALHE[0]:
+        valores = _diferencas(df, criterio, objetivo, linhas, colunas)
+    elif tipo == MATRIZES_DETALHE[1]:
+        valores = _preferencia(df, criterio, objetivo, funcoes, parametros, linhas, colunas)
+    elif tipo == MATRIZES_DETALHE[2]:
+        valores = _agregada(df, criterios, objetivo, pesos, funcoes, parametros, linhas, colunas)
+    elif tipo == MATRIZES_DETALHE[3]:
+        valores = (_agregada(df, criterios, objetivo, pesos, funcoes, parametros, linhas, colunas)
+                   - _agregada(df, criterios, objetivo, pesos, funcoes, parametros, colunas, linhas).T)
+    else:
+        raise ValueError(f"matriz de detalhe desconhecida: {tipo!r}")
+
+    return pd.DataFrame(valores, index=list(nomes_linhas), columns=list(nomes_colunas))
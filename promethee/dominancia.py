@@ -0,0 +1,119 @@
+# ===================================
+# Top-k com pré-filtro de dominância de Pareto
+# ===================================
+# Se a domina b (melhor ou igual em todos os critérios, estritamente melhor
+# em algum, já orientados pelo objetivo), então P_j(a,c) >= P_j(b,c) e
+# P_j(c,a) <= P_j(c,b) para todo c, porque toda F_j é não decrescente em d,
+# e P_j(b,a) = 0. Logo ϕ(a) >= ϕ(b). Um fornecedor dominado por k ou mais
+# outros tem ao menos k fornecedores com fluxo maior ou igual ao seu e não
+# muda o k-ésimo fluxo do ranking: só os demais (a "banda" de dominância de
+# ordem k; com k = 1, o skyline) precisam dos fluxos, que continuam exatos,
+# calculados contra todos os fornecedores.
+#
+# Empates exatos de ϕ na k-ésima posição podem trazer um fornecedor podado
+# com o mesmo fluxo do último listado; a ordenação completa também resolve
+# esses empates arbitrariamente.
+import numpy as np
+
+from .fluxos import somas_unicriterio
+from .erros import ErroEntrada
+from .instrumentacao import fase
+from .motor import montar_top_k, valores_orientados
+from .preferencias import resolver_funcao_preferencia
+
+# Pares (linhas × candidatos) comparados por bloco
+COMPARACOES_POR_BLOCO = 2 ** 22
+LINHAS_MAX_POR_BLOCO = 1024
+# Candidatos de maior soma, comparados primeiro: eles podam a maior parte das linhas
+CANDIDATOS_TRIAGEM = 256
+# Com muitos critérios quase ninguém é dominado; passando desta fração de
+# candidatos (ou deste total) o filtro desiste e as linhas restantes ficam
+# todas como candidatas (sempre correto, só poda menos)
+FRACAO_MAX_CANDIDATOS = 0.1
+MAX_CANDIDATOS = 4096
+
+
+def _dominadores(bloco, outros):
+    # Matriz linhas do bloco × `outros`: True onde a linha de `outros` domina
+    # a do bloco. Um critério por vez (2D), mais rápido que all/any num eixo curto
+    maior_igual = np.ones((len(bloco), len(outros)), dtype=bool)
+    maior = np.zeros((len(bloco), len(outros)), dtype=bool)
+    for j in range(bloco.shape[1]):
+        coluna, referencia = outros[np.newaxis, :, j], bloco[:, j, np.newaxis]
+        maior_igual &= coluna >= referencia
+        maior |= coluna > referencia
+    return maior_igual & maior
+
+
+def banda_dominancia(valores, k):
+    # Máscara dos fornecedores dominados por menos de k outros, com `valores`
+    # n×m já orientados (maior é melhor). Ordenação por soma decrescente: quem
+    # domina b tem soma maior e vem antes, então cada linha só é comparada com
+    # os candidatos já aceitos e com as linhas anteriores do próprio bloco.
+    # Basta contar dominadores entre os candidatos: se b tem k dominadores,
+    # tem k dominadores que também são candidatos.
+    n, m = valores.shape
+    ordem = np.argsort(-valores.sum(axis=1), kind='stable')
+    ordenados = valores[ordem]
+    candidato = np.zeros(n, dtype=bool)
+    aceitos = np.empty((0, m))
+    limite = max(CANDIDATOS_TRIAGEM, min(int(FRACAO_MAX_CANDIDATOS * n), MAX_CANDIDATOS))
+
+    inicio = 0
+    while inicio < n:
+        linhas = COMPARACOES_POR_BLOCO // max(len(aceitos), 1)
+        fim = min(n, inicio + max(1, min(LINHAS_MAX_POR_BLOCO, linhas)))
+        bloco = ordenados[inicio:fim]
+
+        contagem = _dominadores(bloco, aceitos[:CANDIDATOS_TRIAGEM]).sum(axis=1)
+        vivas = np.flatnonzero(contagem < k)
+        contagem[vivas] += _dominadores(bloco[vivas], aceitos[CANDIDATOS_TRIAGEM:]).sum(axis=1)
+        vivas = vivas[contagem[vivas] < k]
+        # Linhas anteriores do bloco contam mesmo sem saber se são candidatas:
+        # qualquer dominador vale para a poda
+        anteriores = np.arange(len(bloco))[np.newaxis, :] < vivas[:, np.newaxis]
+        contagem[vivas] += (_dominadores(bloco[vivas], bloco) & anteriores).sum(axis=1)
+
+        aceito = contagem < k
+        candidato[ordem[inicio:fim]] = aceito
+        aceitos = np.concatenate((aceitos, bloco[aceito]))
+        inicio = fim
+        if len(aceitos) > limite:
+            candidato[ordem[inicio:]] = True
+            break
+    return candidato
+
+
+def calcular_top_k_por_dominancia(df, criterios, objetivo, pesos, funcoes, parametros, k=10):
+    # (ranking dos k primeiros, relatório da poda); mesmos fluxos de
+    # calcular_promethee_sem_normalizar para os fornecedores listados
+    if k < 1:
+        raise ErroEntrada("k deve ser pelo menos 1")
+    alternativas = df.index.tolist()
+    n = len(alternativas)
+    peso_total = sum(pesos.values())
+    x = {crit: valores_orientados(df, crit, objetivo) for crit in criterios}
+
+    with fase('dominância'):
+        # Critérios de peso zero não entram no fluxo nem na dominância
+        ativos = [crit for crit in criterios if pesos[crit] > 0]
+        valores = np.column_stack([x[crit] for crit in ativos]) if ativos else np.zeros((n, 0))
+        candidatos = np.flatnonzero(banda_dominancia(valores, k))
+
+    fluxo_positivo = np.zeros(len(candidatos))
+    fluxo_negativo = np.zeros(len(candidatos))
+
+    with fase('d(a,b) e π(a,b): somas unicritério'):
+        for crit in criterios:
+            funcao = resolver_funcao_preferencia(funcoes[crit], parametros[crit])
+            soma_pos, soma_neg = somas_unicriterio(x[crit], funcao, consulta=candidatos)
+            fluxo_positivo += pesos[crit] * soma_pos
+            fluxo_negativo += pesos[crit] * soma_neg
+
+    with fase('fluxos'):
+        fluxo_positivo /= peso_total * (n - 1)
+        fluxo_negativo /= peso_total * (n - 1)
+
+    resultado = montar_top_k([alternativas[i] for i in candidatos], fluxo_positivo, fluxo_negativo, k)
+    relatorio = {'fornecedores': n, 'candidatos': len(candidatos), 'podados': n - len(candidatos)}
+    return resultado, relatorio
@@ -0,0 +1,53 @@
+# ===================================
+# Perfis duplicados agrupados (multiplicidade)
+# ===================================
+# Catálogos importados repetem o mesmo vetor de critérios em muitos
+# fornecedores. Dois fornecedores com o mesmo perfil têm π(a,b) = 0 entre si
+# e o mesmo π contra qualquer terceiro, logo os mesmos fluxos. Os perfis são
+# agrupados por hash das linhas; cada perfil distinto entra uma vez, valendo
+# pela quantidade c_v de fornecedores que representa:
+#   S+_j(u) = Σ_v c_v · P_j(u,v),   ϕ+(u) = Σ_j w_j · S+_j(u) / (W·(n-1))
+# com n o total de fornecedores, e os fluxos voltam para todos eles. O custo
+# passa a depender do número de perfis distintos, não de fornecedores.
+import numpy as np
+
+from .fluxos import somas_unicriterio
+from .instrumentacao import fase
+from .motor import montar_resultado, valores_orientados
+from .preferencias import resolver_funcao_preferencia
+
+
+def agrupar_perfis(df, criterios):
+    # (posição do representante de cada perfil, perfil de cada fornecedor, multiplicidade de cada perfil)
+    perfil = df.groupby(criterios, sort=False, dropna=False).ngroup().to_numpy()
+    _, representantes, multiplicidade = np.unique(perfil, return_index=True, return_counts=True)
+    return representantes, perfil, multiplicidade
+
+
+def calcular_promethee_sem_duplicados(df, criterios, objetivo, pesos, funcoes, parametros):
+    # Mesmo ranking de calcular_promethee_sem_normalizar, com cada perfil distinto calculado uma vez
+    alternativas = df.index.tolist()
+    n = len(alternativas)
+    peso_total = sum(pesos.values())
+
+    with fase('agrupar perfis'):
+        representantes, perfil, multiplicidade = agrupar_perfis(df, criterios)
+        perfis = df.iloc[representantes]
+
+    fluxo_positivo = np.zeros(len(perfis))
+    fluxo_negativo = np.zeros(len(perfis))
+
+    with fase('d(a,b) e π(a,b): somas unicritério'):
+        for crit in criterios:
+            x = valores_orientados(perfis, crit, objetivo)
+            funcao = resolver_funcao_preferencia(funcoes[crit], parametros[crit])
+            soma_pos, soma_neg = somas_unicriterio(x, funcao, multiplicidade)
+            fluxo_positivo += pesos[crit] * soma_pos
+            fluxo_negativo += pesos[crit] * soma_neg
+
+    with fase('fluxos'):
+        fluxo_positivo /= peso_total * (n - 1)
+        fluxo_negativo /= peso_total * (n - 1)
+
+    # Cada fornecedor recebe os fluxos do seu perfil
+    return montar_resultado(alternativas, fluxo_positivo[perfil], fluxo_negativo[perfil])
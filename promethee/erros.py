@@ -0,0 +1,11 @@
+# ===================================
+# Erro de entrada
+# ===================================
+# Dados ou parâmetros inválidos vindos de fora do pacote: cenário, arquivo
+# importado, parâmetros das funções de preferência. Herda de ValueError, então
+# quem já trata ValueError continua funcionando; o serviço HTTP responde 400
+# só a este tipo, e qualquer outra exceção é falha interna (500).
+
+
+class ErroEntrada(ValueError):
+    pass
@@ -0,0 +1,198 @@
+# ===================================
+# Fluxos PROMETHEE II sem matriz n×n (ordenação + somas de prefixo)
+# ===================================
+# Com a coluna do critério ordenada, os pares com d(a,b) acima de um limiar
+# (0, q ou p) formam um prefixo (para ϕ+) ou um sufixo (para ϕ-) do vetor
+# ordenado. Contagens saem por busca binária e as somas de d(a,b) nas faixas
+# lineares saem das somas de prefixo: O(n log n) de tempo e O(n) de memória
+# por critério, em vez de O(n²).
+#
+# Colunas com poucos valores distintos (as notas 1-5 dos critérios
+# qualitativos) vão por histograma: F_j é avaliada só entre os k valores
+# distintos (k×k) e ponderada pela quantidade de fornecedores em cada um,
+# O(n log n + k²) para qualquer função, inclusive a Gaussiana.
+import numpy as np
+
+from .motor import montar_resultado, valores_orientados
+from .preferencias import resolver_funcao_preferencia
+
+# Quantidade de pares avaliados por bloco na função Gaussiana (≈ 32 MB por matriz temporária)
+PARES_POR_BLOCO = 2 ** 22
+
+# Até quantos valores distintos uma coluna é calculada por histograma
+VALORES_DISTINTOS_HISTOGRAMA = 64
+
+def _fronteira_positiva(x, ordenados, limiar):
+    # Para cada a, quantos b (a partir do menor valor) têm x_a - x_b > limiar.
+    # A diferença em ponto flutuante é monótona em x_b, então a busca binária
+    # reproduz exatamente a comparação feita par a par.
+    n = ordenados.size
+    lo = np.zeros(x.size, dtype=np.intp)
+    hi = np.full(x.size, n, dtype=np.intp)
+    ativo = lo < hi
+    while ativo.any():
+        meio = (lo + hi) // 2
+        ok = (x - ordenados[np.minimum(meio, n - 1)]) > limiar
+        lo = np.where(ativo & ok, meio + 1, lo)
+        hi = np.where(ativo & ~ok, meio, hi)
+        ativo = lo < hi
+    return lo
+
+
+def _fronteira_negativa(x, ordenados, limiar):
+    # Para cada a, primeiro índice k com x_b - x_a > limiar; os pares ficam em [k, n)
+    n = ordenados.size
+    lo = np.zeros(x.size, dtype=np.intp)
+    hi = np.full(x.size, n, dtype=np.intp)
+    ativo = lo < hi
+    while ativo.any():
+        meio = (lo + hi) // 2
+        ok = (ordenados[np.minimum(meio, n - 1)] - x) > limiar
+        hi = np.where(ativo & ok, meio, hi)
+        lo = np.where(ativo & ~ok, meio + 1, lo)
+        ativo = lo < hi
+    return lo
+
+
+def _somas_ordenadas(x, funcao, ordenados=None, pesos_ordenados=None):
+    # `x` são as alternativas a somar e `ordenados` todas as alternativas b
+    # (as mesmas, salvo quando só parte delas é consultada)
+    n = x.size
+    if ordenados is None:
+        ordenados = np.sort(x)
+    # Quantos b há nas k primeiras posições do vetor ordenado (com multiplicidade,
+    # a soma dos pesos dessas posições)
+    if pesos_ordenados is None:
+        acumulado = np.arange(ordenados.size + 1, dtype=float)
+    else:
+        acumulado = np.concatenate(([0.0], np.cumsum(pesos_ordenados)))
+    total = acumulado[-1]
+
+    # ϕ+: pares b em [0, k) do vetor ordenado; ϕ-: pares b em [k, n)
+    soma_pos = np.zeros(n)
+    soma_neg = np.zeros(n)
+    for limiar, altura in funcao.degraus:
+        soma_pos += altura * acumulado[_fronteira_positiva(x, ordenados, limiar)]
+        soma_neg += altura * (total - acumulado[_fronteira_negativa(x, ordenados, limiar)])
+
+    if funcao.rampa is not None:
+        a, b = funcao.rampa
+        ka, kb = _fronteira_positiva(x, ordenados, a), _fronteira_positiva(x, ordenados, b)
+        ma, mb = _fronteira_negativa(x, ordenados, a), _fronteira_negativa(x, ordenados, b)
+        soma_pos += acumulado[kb]
+        soma_neg += total - acumulado[mb]
+        if b > a:
+            # Somas de prefixo sobre valores centralizados, para conter o erro de cancelamento
+            centro = ordenados[ordenados.size // 2]
+            desvios = ordenados - centro
+            if pesos_ordenados is not None:
+                desvios *= pesos_ordenados
+            prefixo = np.concatenate(([0.0], np.cumsum(desvios)))
+            xc = x - centro
+            # Trecho linear (d - a) / (b - a): pares em [kb, ka) para ϕ+ e em [ma, mb) para ϕ-
+            soma_pos += ((acumulado[ka] - acumulado[kb]) * (xc - a) - (prefixo[ka] - prefixo[kb])) / (b - a)
+            soma_neg += ((prefixo[mb] - prefixo[ma]) - (acumulado[mb] - acumulado[ma]) * (xc + a)) / (b - a)
+
+    return soma_pos, soma_neg
+
+
+def _somas_em_blocos(x, funcao, pares_por_bloco=PARES_POR_BLOCO, multiplicidade=None):
+    # Funções sem forma fechada em somas de prefixo (Gaussiana): blocos de linhas
+    n = x.size
+    linhas = max(1, pares_por_bloco // n)
+    soma_pos = np.empty(n)
+    soma_neg = np.zeros(n)
+    for inicio in range(0, n, linhas):
+        fim = min(inicio + linhas, n)
+        d = x[inicio:fim, np.newaxis] - x[np.newaxis, :]
+        pref = funcao(d)
+        pref[np.arange(fim - inicio), np.arange(inicio, fim)] = 0
+        if multiplicidade is None:
+            soma_pos[inicio:fim] = pref.sum(axis=1)
+            soma_neg += pref.sum(axis=0)
+        else:
+            soma_pos[inicio:fim] = pref @ multiplicidade
+            soma_neg += multiplicidade[inicio:fim] @ pref
+    return soma_pos, soma_neg
+
+
+def _somas_contra_em_blocos(consulta, x, funcao, multiplicidade=None, pares_por_bloco=PARES_POR_BLOCO):
+    # Como _somas_em_blocos, mas só para as alternativas `consulta` contra todas
+    # as de x; sem a simetria do caso completo, P(b,a) é avaliada à parte
+    linhas = max(1, pares_por_bloco // max(x.size, 1))
+    pesos = np.ones(x.size) if multiplicidade is None else multiplicidade
+    soma_pos = np.empty(consulta.size)
+    soma_neg = np.empty(consulta.size)
+    for inicio in range(0, consulta.size, linhas):
+        fim = min(inicio + linhas, consulta.size)
+        d = consulta[inicio:fim, np.newaxis] - x[np.newaxis, :]
+        # d = 0 consigo mesma e P(0) = 0: nada a descontar
+        soma_pos[inicio:fim] = funcao(d) @ pesos
+        soma_neg[inicio:fim] = funcao(-d) @ pesos
+    return soma_pos, soma_neg
+
+
+def _somas_por_histograma(valores, contagens, funcao):
+    # Somas por valor distinto. Pares com o mesmo valor têm d = 0 e P = 0,
+    # então o próprio a (e seus empatados) não precisam ser descontados
+    pref = funcao(valores[:, np.newaxis] - valores[np.newaxis, :])
+    return pref @ contagens, contagens @ pref
+
+
+def somas_unicriterio(x, funcao, multiplicidade=None, consulta=None):
+    # Σ_b P_j(a,b) e Σ_b P_j(b,a) para cada alternativa a, com x já orientado
+    # e funcao já resolvida (ver preferencias.resolver_funcao_preferencia).
+    # Com `multiplicidade`, cada alternativa b conta como tantas cópias iguais
+    # a ela (perfis duplicados agrupados, ver duplicados.py). Com `consulta`
+    # (posições em x), só as somas dessas alternativas a são calculadas, ainda
+    # contra todas as b (candidatos do top-k, ver dominancia.py)
+    if multiplicidade is None:
+        ordenados = np.sort(x)
+        pesos_ordenados = None
+    else:
+        multiplicidade = np.asarray(multiplicidade, dtype=float)
+        ordem = np.argsort(x, kind='stable')
+        ordenados = x[ordem]
+        pesos_ordenados = multiplicidade[ordem]
+
+    if x.size:
+        # Início de cada valor distinto no vetor ordenado
+        inicios = np.concatenate(([0], np.flatnonzero(ordenados[1:] != ordenados[:-1]) + 1))
+        if inicios.size <= VALORES_DISTINTOS_HISTOGRAMA and inicios.size < x.size:
+            valores = ordenados[inicios]
+            if pesos_ordenados is None:
+                contagens = np.diff(np.append(inicios, x.size)).astype(float)
+            else:
+                contagens = np.add.reduceat(pesos_ordenados, inicios)
+            soma_pos, soma_neg = _somas_por_histograma(valores, contagens, funcao)
+            posicao = np.searchsorted(valores, x if consulta is None else x[consulta])
+            return soma_pos[posicao], soma_neg[posicao]
+
+    if funcao.ordenavel:
+        return _somas_ordenadas(x if consulta is None else x[consulta], funcao, ordenados, pesos_ordenados)
+    if consulta is None:
+        return _somas_em_blocos(x, funcao, multiplicidade=multiplicidade)
+    return _somas_contra_em_blocos(x[consulta], x, funcao, multiplicidade)
+
+
+def calcular_promethee_somente_fluxos(df, criterios, objetivo, pesos, funcoes, parametros):
+    # Mesmo ranking de calcular_promethee_sem_normalizar, sem montar nenhuma matriz n×n
+    alternativas = df.index.tolist()
+    n = len(alternativas)
+    peso_total = sum(pesos.values())
+
+    fluxo_positivo = np.zeros(n)
+    fluxo_negativo = np.zeros(n)
+
+    for crit in criterios:
+        x = valores_orientados(df, crit, objetivo)
+
+        funcao = resolver_funcao_preferencia(funcoes[crit], parametros[crit])
+        soma_pos, soma_neg = somas_unicriterio(x, funcao)
+        fluxo_positivo += pesos[crit] * soma_pos
+        fluxo_negativo += pesos[crit] * soma_neg
+
+    fluxo_positivo /= peso_total * (n - 1)
+    fluxo_negativo /= peso_total * (n - 1)
+
+    return montar_resultado(alternativas, fluxo_positivo, fluxo_negativo)
@@ -0,0 +1,97 @@
+# ===================================
+# Importação da matriz de desempenho (CSV, XLSX, Parquet)
+# ===================================
+# Lê o arquivo enviado, associa as colunas aos critérios conhecidos (pela
+# chave completa, pelo código Cn ou pelo nome em PT/EN) e devolve uma matriz
+# float64 com os fornecedores no índice. O resultado fica em cache pelo hash
+# do conteúdo: as reexecuções do Streamlit não voltam a ler o arquivo.
+import hashlib
+import io
+from collections import OrderedDict
+
+import pandas as pd
+
+from .colunas import colunas_criterios, converter_float
+from .erros import ErroEntrada
+from .ingestao import resolver_filtros, ingerir_em_blocos, mascara_filtros
+
+EXTENSOES_SUPORTADAS = ('csv', 'xlsx', 'parquet')
+MAX_ARQUIVOS_CACHE = 16
+
+_CACHE_IMPORTACAO = OrderedDict()
+
+
+def _montar_matriz(df, criterios_conhecidos, filtros):
+    # Tabelas já em memória (planilhas): mesma validação da ingestão em blocos
+    rotulo, mapeamento = colunas_criterios(df.columns, criterios_conhecidos)
+    if not mapeamento:
+        raise ErroEntrada("nenhuma coluna do arquivo corresponde a um critério conhecido")
+
+    df = converter_float(df, list(mapeamento))
+    df = df[mascara_filtros(df, resolver_filtros(filtros, df.columns.tolist(), criterios_conhecidos))]
+
+    # Rótulos: primeira coluna que não é critério; sem ela, numeração sequencial
+    if rotulo is not None:
+        nomes = df[rotulo].astype(str).str.strip()
+    else:
+        nomes = pd.Series([f"Fornecedor {i + 1}" for i in df.index], index=df.index)
+    if nomes.duplicated().any():
+        raise ErroEntrada(f"fornecedores repetidos: {', '.join(nomes[nomes.duplicated()].unique())}")
+
+    matriz = pd.DataFrame({crit: df[coluna].to_numpy() for coluna, crit in mapeamento.items()})
+    matriz.index = pd.Index(nomes.to_numpy(), name='Fornecedor')
+
+    faltantes = matriz.isna().any(axis=1)
+    if faltantes.any():
+        raise ErroEntrada(f"valores ausentes para: {', '.join(map(str, matriz.index[faltantes][:5]))}")
+    return matriz, mapeamento
+
+
+def _localizar_tabela(bruto):
+    # Planilhas costumam ter título e células soltas: o cabeçalho é a primeira
+    # linha com dois ou mais valores seguida de uma linha com números
+    bruto = bruto.dropna(how='all').dropna(axis=1, how='all')
+    linhas = bruto.index.tolist()
+    for k, linha in enumerate(linhas[:-1]):
+        abaixo = pd.to_numeric(bruto.loc[linhas[k + 1]], errors='coerce')
+        if bruto.loc[linha].notna().sum() >= 2 and abaixo.notna().any():
+            # Tabela contínua até a primeira linha vazia da planilha original
+            fim = k + 1
+            while fim < len(linhas) and linhas[fim] == linhas[fim - 1] + 1:
+                fim += 1
+            tabela = bruto.loc[linhas[k + 1:fim]]
+            cabecalho = [c if pd.notna(c) else f"coluna_{i}" for i, c in enumerate(bruto.loc[linha])]
+            tabela.columns = cabecalho
+            return tabela.dropna(axis=1, how='all').reset_index(drop=True)
+    raise ErroEntrada("não foi encontrada uma tabela de desempenho na planilha")
+
+
+def _ler_xlsx(conteudo):
+    # Requer openpyxl (dependência opcional do pandas para .xlsx)
+    return _localizar_tabela(pd.read_excel(io.BytesIO(conteudo), header=None))
+
+
+def importar_matriz_desempenho(conteudo, nome_arquivo, criterios_conhecidos=None, filtros=()):
+    # Retorna (matriz float64 fornecedores × critérios, {coluna do arquivo: critério});
+    # CSV e Parquet passam pela ingestão em blocos, com os filtros aplicados bloco a bloco
+    extensao = nome_arquivo.rsplit('.', 1)[-1].lower()
+    if extensao not in EXTENSOES_SUPORTADAS:
+        raise ErroEntrada(f"formato não suportado: .{extensao} (use {', '.join(EXTENSOES_SUPORTADAS)})")
+
+    conhecidos = None if criterios_conhecidos is None else tuple(criterios_conhecidos)
+    filtros = tuple(filtros)
+    chave = (hashlib.blake2b(conteudo, digest_size=16).hexdigest(), extensao, conhecidos, filtros)
+    if chave in _CACHE_IMPORTACAO:
+        _CACHE_IMPORTACAO.move_to_end(chave)
+        matriz, mapeamento = _CACHE_IMPORTACAO[chave]
+        return matriz.copy(), dict(mapeamento)
+
+    if extensao == 'xlsx':
+        matriz, mapeamento = _montar_matriz(_ler_xlsx(conteudo), conhecidos, filtros)
+    else:
+        matriz, mapeamento = ingerir_em_blocos(conteudo, extensao, conhecidos, filtros)
+
+    _CACHE_IMPORTACAO[chave] = (matriz, mapeamento)
+    if len(_CACHE_IMPORTACAO) > MAX_ARQUIVOS_CACHE:
+        _CACHE_IMPORTACAO.popitem(last=False)
+    return matriz.copy(), dict(mapeamento)
@@ -0,0 +1,162 @@
+# ===================================
+# PROMETHEE II incremental (inclusão/exclusão de fornecedores)
+# ===================================
+# Os fluxos só dependem das somas de linha e de coluna da matriz agregada:
+#   R(a) = Σ_b Σ_j w_j P_j(a,b)     C(a) = Σ_b Σ_j w_j P_j(b,a)
+# Ao incluir ou excluir um fornecedor z basta calcular a linha Π(z,·) e a
+# coluna Π(·,z) contra o conjunto atual: O(n·m) por evento, em vez de
+# refazer os O(n²·m) pares. Nenhuma matriz n×n é mantida.
+#
+# O app_up_final.py guarda um motor por sessão e, a cada cálculo, o
+# sincroniza com os fornecedores selecionados (sincronizar).
+import numpy as np
+
+from .cache import somas_por_criterio
+from .fluxos import somas_unicriterio
+from .motor import OBJETIVOS_MINIMIZACAO, montar_resultado, montar_top_k
+from .preferencias import resolver_funcao_preferencia
+
+
+class PrometheeIncremental:
+    def __init__(self, criterios, objetivo, pesos, funcoes, parametros, capacidade=64):
+        self.criterios = list(criterios)
+        self.sinais = np.array([-1.0 if objetivo[crit] in OBJETIVOS_MINIMIZACAO else 1.0
+                                for crit in self.criterios])
+        self.pesos = np.array([pesos[crit] for crit in self.criterios], dtype=float)
+        self.peso_total = sum(pesos.values())
+        self.funcoes = [resolver_funcao_preferencia(funcoes[crit], parametros[crit])
+                        for crit in self.criterios]
+
+        self.nomes = []
+        self._posicao = {}
+        self._x = np.empty((capacidade, len(self.criterios)))
+        self._linha = np.zeros(capacidade)
+        self._coluna = np.zeros(capacidade)
+        # Eventos desde o último recálculo completo (arredondamento acumulado)
+        self.eventos = 0
+
+    @classmethod
+    def a_partir_de(cls, df, criterios, objetivo, pesos, funcoes, parametros):
+        # Carga inicial pelo cálculo ordenado (O(m·n log n)), sem percorrer os pares
+        motor = cls(criterios, objetivo, pesos, funcoes, parametros, capacidade=max(64, 2 * len(df)))
+        n = len(df)
+        motor.nomes = df.index.tolist()
+        motor._posicao = {nome: i for i, nome in enumerate(motor.nomes)}
+        motor._x[:n] = df[motor.criterios].to_numpy(dtype=float) * motor.sinais
+        somas_pos, somas_neg = somas_por_criterio(df, criterios, objetivo, funcoes, parametros)
+        motor._linha[:n] = motor.pesos @ somas_pos
+        motor._coluna[:n] = motor.pesos @ somas_neg
+        return motor
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def __contains__(self, nome):
+        return nome in self._posicao
+
+    def _vetor(self, desempenho):
+        # Aceita dict/Series {critério: valor} ou sequência na ordem dos critérios
+        if hasattr(desempenho, 'keys'):
+            desempenho = [desempenho[crit] for crit in self.criterios]
+        return np.asarray(desempenho, dtype=float) * self.sinais
+
+    def _contra_todos(self, x_z):
+        # Π(z,b) e Π(b,z) (sem dividir por W) para todos os b atuais
+        n = len(self.nomes)
+        x = self._x[:n]
+        sai = np.zeros(n)
+        entra = np.zeros(n)
+        for j, funcao in enumerate(self.funcoes):
+            d = x_z[j] - x[:, j]
+            sai += self.pesos[j] * funcao(d)
+            entra += self.pesos[j] * funcao(-d)
+        return sai, entra
+
+    def adicionar(self, nome, desempenho):
+        if nome in self._posicao:
+            raise ValueError(f"fornecedor já incluído: {nome!r}")
+        x_z = self._vetor(desempenho)
+        sai, entra = self._contra_todos(x_z)
+
+        n = len(self.nomes)
+        if n == self._x.shape[0]:
+            self._x = np.concatenate([self._x, np.empty_like(self._x)])
+            self._linha = np.concatenate([self._linha, np.zeros_like(self._linha)])
+            self._coluna = np.concatenate([self._coluna, np.zeros_like(self._coluna)])
+
+        self._linha[:n] += entra
+        self._coluna[:n] += sai
+        self._x[n] = x_z
+        self._linha[n] = sai.sum()
+        self._coluna[n] = entra.sum()
+        self.nomes.append(nome)
+        self._posicao[nome] = n
+        self.eventos += 1
+
+    def remover(self, nome):
+        if nome not in self._posicao:
+            raise KeyError(nome)
+        i = self._posicao.pop(nome)
+        x_z = self._x[i].copy()
+        ultimo = len(self.nomes) - 1
+
+        # Move o último fornecedor para a vaga (O(m)) em vez de deslocar o array
+        if i != ultimo:
+            self._x[i] = self._x[ultimo]
+            self._linha[i] = self._linha[ultimo]
+            self._coluna[i] = self._coluna[ultimo]
+            self.nomes[i] = self.nomes[ultimo]
+            self._posicao[self.nomes[i]] = i
+        self.nomes.pop()
+
+        # Desconta os pares (b, z) e (z, b) dos fornecedores que ficaram
+        sai, entra = self._contra_todos(x_z)
+        n = len(self.nomes)
+        self._linha[:n] -= entra
+        self._coluna[:n] -= sai
+        self.eventos += 1
+
+    def sincronizar(self, df):
+        # Leva o motor às linhas de df: sai quem saiu da seleção ou teve a linha
+        # editada, entra quem é novo (ou editado). Devolve os eventos aplicados
+        linhas = dict(zip(df.index, df[self.criterios].to_numpy(dtype=float) * self.sinais))
+        saem = [nome for nome in self.nomes
+                if nome not in linhas or not np.array_equal(self._x[self._posicao[nome]], linhas[nome])]
+        for nome in saem:
+            self.remover(nome)
+        entram = [nome for nome in linhas if nome not in self._posicao]
+        for nome in entram:
+            self.adicionar(nome, df.loc[nome, self.criterios])
+        # Com mais eventos que fornecedores, o recálculo ordenado sai mais barato
+        # que carregar o arredondamento acumulado
+        if self.eventos > len(self.nomes):
+            self.recalcular()
+        return len(saem) + len(entram)
+
+    def recalcular(self):
+        # Refaz R e C pelo cálculo ordenado para eliminar o arredondamento acumulado
+        n = len(self.nomes)
+        self._linha[:n] = 0
+        self._coluna[:n] = 0
+        for j, funcao in enumerate(self.funcoes):
+            soma_pos, soma_neg = somas_unicriterio(self._x[:n, j].copy(), funcao)
+            self._linha[:n] += self.pesos[j] * soma_pos
+            self._coluna[:n] += self.pesos[j] * soma_neg
+        self.eventos = 0
+
+    def fluxos(self, nomes=None):
+        # Na ordem de `nomes` (padrão: a ordem interna, que muda com as exclusões)
+        n = len(self.nomes)
+        posicoes = slice(0, n) if nomes is None else [self._posicao[nome] for nome in nomes]
+        if n < 2:
+            return np.zeros(n)[posicoes], np.zeros(n)[posicoes]
+        escala = self.peso_total * (n - 1)
+        return self._linha[posicoes] / escala, self._coluna[posicoes] / escala
+
+    def resultado(self, nomes=None, top_k=None, ultimos=0):
+        # Mesma tabela de calcular_promethee_com_cache; `nomes` fixa a ordem de entrada
+        nomes = list(self.nomes) if nomes is None else list(nomes)
+        fluxo_positivo, fluxo_negativo = self.fluxos(nomes)
+        if top_k is not None:
+            return montar_top_k(nomes, fluxo_positivo, fluxo_negativo, top_k, ultimos)
+        return montar_resultado(nomes, fluxo_positivo, fluxo_negativo)
@@ -0,0 +1,202 @@
+# ===================================
+# Ingestão em blocos de catálogos de fornecedores
+# ===================================
+# Catálogos com milhões de linhas não cabem em um read_csv completo. O
+# arquivo é lido em blocos de `linhas_por_bloco` linhas, só com a coluna de
+# rótulos, as colunas de critério e as usadas nos filtros. Cada bloco é
+# filtrado antes de ser guardado, e só os critérios seguem como arrays
+# float64 (ou float32). Texto das demais colunas nunca chega à memória.
+import csv
+import io
+import operator
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from .colunas import colunas_criterios, converter_float, mapear_colunas
+from .erros import ErroEntrada
+
+LINHAS_POR_BLOCO = 200_000
+
+OPERADORES = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<=': operator.le,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '>': operator.gt,
+}
+
+
+def opcoes_csv(amostra):
+    # Separador detectado na amostra; ';' vem de planilhas em português, com vírgula decimal
+    texto = amostra.decode('utf-8-sig', errors='ignore')
+    try:
+        separador = csv.Sniffer().sniff(texto, delimiters=',;\t').delimiter
+    except csv.Error:
+        separador = ','
+    return dict(sep=separador, decimal=',' if separador == ';' else '.', encoding='utf-8-sig')
+
+
+def interpretar_filtros(texto):
+    # "Regiao == Sul; C1 <= 1000" -> [('Regiao', '==', 'Sul'), ('C1', '<=', 1000.0)]
+    filtros = []
+    for trecho in texto.split(';'):
+        if not trecho.strip():
+            continue
+        partes = re.fullmatch(r'\s*(.+?)\s*(==|!=|<=|>=|<|>)\s*(.+?)\s*', trecho)
+        if partes is None:
+            raise ErroEntrada(f"filtro inválido: {trecho.strip()!r} (use coluna operador valor, ex.: C1 <= 1000)")
+        coluna, operador, valor = partes.groups()
+        valor = valor.strip('\'"')
+        try:
+            valor = float(valor.replace(',', '.'))
+        except ValueError:
+            pass
+        filtros.append((coluna, operador, valor))
+    return filtros
+
+
+def resolver_filtros(filtros, colunas, criterios_conhecidos):
+    # Filtros podem citar a coluna do arquivo ou o critério (chave, nome ou código)
+    resolvidos = []
+    for coluna, operador, valor in filtros:
+        if coluna not in colunas:
+            criterio = mapear_colunas([coluna], criterios_conhecidos).get(coluna)
+            do_arquivo = mapear_colunas(colunas, criterios_conhecidos)
+            coluna = next((c for c, crit in do_arquivo.items() if crit == criterio), None)
+            if coluna is None:
+                raise ErroEntrada(f"coluna do filtro não encontrada no arquivo: {filtros[len(resolvidos)][0]!r}")
+        if operador not in OPERADORES:
+            raise ErroEntrada(f"operador desconhecido: {operador!r}")
+        resolvidos.append((coluna, operador, valor))
+    return resolvidos
+
+
+def mascara_filtros(df, filtros):
+    mascara = np.ones(len(df), dtype=bool)
+    for coluna, operador, valor in filtros:
+        serie = df[coluna]
+        if pd.api.types.is_numeric_dtype(serie) and isinstance(valor, float):
+            mascara &= OPERADORES[operador](serie, valor).to_numpy()
+        else:
+            texto = valor if isinstance(valor, str) else f"{valor:g}"
+            mascara &= OPERADORES[operador](serie.astype(str).str.strip(), texto).to_numpy()
+    return mascara
+
+
+def _abrir(fonte):
+    if isinstance(fonte, (bytes, bytearray, memoryview)):
+        return io.BytesIO(fonte)
+    if isinstance(fonte, str):
+        return open(fonte, 'rb')
+    return fonte
+
+
+def _blocos_csv(arquivo, usadas, numericas, linhas_por_bloco, tipo):
+    inicio = arquivo.tell()
+    opcoes = opcoes_csv(arquivo.read(65536))
+    arquivo.seek(inicio)
+    emitidos = 0
+    try:
+        # Critérios já tipados pelo leitor em C
+        for bloco in pd.read_csv(arquivo, usecols=usadas, dtype={c: tipo for c in numericas},
+                                 chunksize=linhas_por_bloco, **opcoes):
+            yield bloco
+            emitidos += 1
+    except ValueError:
+        # Há texto em alguma coluna de critério: relê sem tipo a partir do bloco
+        # que falhou (os anteriores já foram entregues) para apontar a célula
+        arquivo.seek(inicio)
+        lidas = 0
+        for k, bloco in enumerate(pd.read_csv(arquivo, usecols=usadas, chunksize=linhas_por_bloco, **opcoes)):
+            if k >= emitidos:
+                yield converter_float(bloco, numericas, tipo, deslocamento=lidas)
+            lidas += len(bloco)
+
+
+def _blocos_parquet(arquivo, usadas, numericas, linhas_por_bloco, tipo):
+    import pyarrow.parquet as pq
+
+    lidas = 0
+    for lote in pq.ParquetFile(arquivo).iter_batches(batch_size=linhas_por_bloco, columns=usadas):
+        bloco = lote.to_pandas()
+        yield converter_float(bloco, numericas, tipo, deslocamento=lidas)
+        lidas += len(bloco)
+
+
+def _cabecalho(arquivo, formato):
+    inicio = arquivo.tell()
+    if formato == 'csv':
+        opcoes = opcoes_csv(arquivo.read(65536))
+        arquivo.seek(inicio)
+        colunas = pd.read_csv(arquivo, nrows=0, **opcoes).columns.tolist()
+    else:
+        import pyarrow.parquet as pq
+
+        colunas = pq.read_schema(arquivo).names
+    arquivo.seek(inicio)
+    return colunas
+
+
+def ingerir_em_blocos(fonte, formato, criterios_conhecidos=None, filtros=(),
+                      linhas_por_bloco=LINHAS_POR_BLOCO, tipo='float64', ao_progredir=None):
+    # fonte: caminho, bytes ou arquivo binário; formato: 'csv' ou 'parquet'
+    # Retorna (matriz fornecedores × critérios, {coluna do arquivo: critério});
+    # matriz.attrs['ingestao'] traz linhas lidas/mantidas e a vazão em linhas/s
+    if formato not in ('csv', 'parquet'):
+        raise ErroEntrada(f"ingestão em blocos só lê csv ou parquet, não {formato!r}")
+
+    arquivo = _abrir(fonte)
+    try:
+        colunas = _cabecalho(arquivo, formato)
+        rotulo, mapeamento = colunas_criterios(colunas, criterios_conhecidos)
+        if not mapeamento:
+            raise ErroEntrada("nenhuma coluna do arquivo corresponde a um critério conhecido")
+        filtros = resolver_filtros(filtros, colunas, criterios_conhecidos)
+
+        numericas = list(mapeamento)
+        usadas = list(dict.fromkeys(([rotulo] if rotulo is not None else []) + numericas
+                                    + [coluna for coluna, _, _ in filtros]))
+        leitor = _blocos_csv if formato == 'csv' else _blocos_parquet
+
+        valores, nomes = [], []
+        lidas = mantidas = 0
+        inicio = time.perf_counter()
+        for bloco in leitor(arquivo, usadas, numericas, linhas_por_bloco, tipo):
+            mascara = mascara_filtros(bloco, filtros)
+            valores.append(bloco[numericas].to_numpy(dtype=tipo)[mascara])
+            if rotulo is not None:
+                nomes.append(bloco[rotulo].astype(str).str.strip().to_numpy()[mascara])
+            else:
+                nomes.append(np.array([f"Fornecedor {lidas + i + 1}" for i in np.flatnonzero(mascara)]))
+            lidas += len(bloco)
+            mantidas += int(mascara.sum())
+            if ao_progredir is not None:
+                ao_progredir(lidas, mantidas)
+        segundos = time.perf_counter() - inicio
+    finally:
+        if arquivo is not fonte:
+            arquivo.close()
+
+    matriz = pd.DataFrame(
+        np.concatenate(valores) if valores else np.empty((0, len(numericas)), dtype=tipo),
+        columns=[mapeamento[c] for c in numericas],
+        index=pd.Index(np.concatenate(nomes) if nomes else [], name='Fornecedor'),
+    )
+    if matriz.index.duplicated().any():
+        repetidos = matriz.index[matriz.index.duplicated()].unique()[:5]
+        raise ErroEntrada(f"fornecedores repetidos: {', '.join(map(str, repetidos))}")
+    faltantes = matriz.isna().any(axis=1)
+    if faltantes.any():
+        raise ErroEntrada(f"valores ausentes para: {', '.join(map(str, matriz.index[faltantes][:5]))}")
+
+    matriz.attrs['ingestao'] = {
+        'linhas_lidas': lidas,
+        'linhas_mantidas': mantidas,
+        'segundos': segundos,
+        'linhas_por_segundo': lidas / segundos if segundos > 0 else float('inf'),
+    }
+    return matriz, mapeamento
@@ -0,0 +1,119 @@
+# ===================================
+# Tempo e memória por fase do cálculo do ranking
+# ===================================
+#   with Medicao('ranking', memoria=True) as medicao:
+#       with fase('entrada'):
+#           ...
+#   medicao.fases -> [{'fase', 'nivel', 'chamadas', 'segundos', 'pico_mb'}, ...]
+#
+# O motor marca as próprias fases (d(a,b), π(a,b), fluxos, ranking) com
+# `fase`; sem medição ativa no contexto isso não faz nada. Fases com o mesmo
+# nome no mesmo nível (uma por critério, por exemplo) são somadas. O pico de
+# memória vem do tracemalloc, que só é ligado quando `memoria=True` porque
+# deixa as alocações mais lentas. Ao fechar, cada fase vira um registro de
+# log estruturado em 'promethee.desempenho' (JSON na mensagem e os campos em
+# `record.promethee`).
+import contextvars
+import json
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+LOGGER = logging.getLogger('promethee.desempenho')
+
+_MEDICAO_ATUAL = contextvars.ContextVar('promethee_medicao', default=None)
+
+
+class Medicao:
+    def __init__(self, nome, memoria=False):
+        self.nome = nome
+        self.memoria = memoria
+        self._fases = {}
+        self._pilha = []
+        self._ligou_tracemalloc = False
+        self._token = None
+        self._pico = 0
+        self.segundos = 0.0
+        self.pico_mb = None
+
+    def __enter__(self):
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._ligou_tracemalloc = True
+        self._token = _MEDICAO_ATUAL.set(self)
+        self._inicio = time.perf_counter()
+        self._memoria_inicial = self._memoria_atual()
+        if self.memoria:
+            tracemalloc.reset_peak()
+        return self
+
+    def __exit__(self, *erro):
+        self.segundos = time.perf_counter() - self._inicio
+        if self.memoria:
+            pico = max(self._pico, tracemalloc.get_traced_memory()[1])
+            self.pico_mb = (pico - self._memoria_inicial) / 1024 ** 2
+        _MEDICAO_ATUAL.reset(self._token)
+        if self._ligou_tracemalloc:
+            tracemalloc.stop()
+        self.registrar()
+        return False
+
+    @staticmethod
+    def _memoria_atual():
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+    @contextmanager
+    def fase(self, nome):
+        caminho = tuple(f['nome'] for f in self._pilha) + (nome,)
+        # Registro criado na abertura: a lista sai na ordem em que as fases começam
+        registro = self._fases.setdefault(caminho, {
+            'fase': nome, 'nivel': len(caminho) - 1, 'chamadas': 0, 'segundos': 0.0, 'pico_mb': None,
+        })
+        if self.memoria:
+            # O pico acumulado até aqui pertence às fases abertas, antes do reset
+            pico = tracemalloc.get_traced_memory()[1]
+            self._pico = max(self._pico, pico)
+            for aberta in self._pilha:
+                aberta['pico'] = max(aberta['pico'], pico)
+        aberta = {'nome': nome, 'inicio': time.perf_counter(), 'memoria': self._memoria_atual(), 'pico': 0}
+        if self.memoria:
+            tracemalloc.reset_peak()
+        self._pilha.append(aberta)
+        try:
+            yield
+        finally:
+            self._pilha.pop()
+            segundos = time.perf_counter() - aberta['inicio']
+            pico_mb = None
+            if self.memoria:
+                pico = max(aberta['pico'], tracemalloc.get_traced_memory()[1])
+                pico_mb = (pico - aberta['memoria']) / 1024 ** 2
+                self._pico = max(self._pico, pico)
+                for externa in self._pilha:
+                    externa['pico'] = max(externa['pico'], pico)
+
+            registro['chamadas'] += 1
+            registro['segundos'] += segundos
+            if pico_mb is not None:
+                registro['pico_mb'] = max(registro['pico_mb'] or 0.0, pico_mb)
+
+    @property
+    def fases(self):
+        return list(self._fases.values())
+
+    def registrar(self):
+        for registro in self.fases + [{'fase': 'total', 'nivel': 0, 'chamadas': 1,
+                                        'segundos': self.segundos, 'pico_mb': self.pico_mb}]:
+            campos = {'medicao': self.nome, **registro}
+            LOGGER.info(json.dumps(campos, ensure_ascii=False), extra={'promethee': campos})
+
+
+@contextmanager
+def fase(nome):
+    medicao = _MEDICAO_ATUAL.get()
+    if medicao is None:
+        yield
+        return
+    with medicao.fase(nome):
+        yield
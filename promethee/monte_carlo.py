@@ -0,0 +1,95 @@
+# ===================================
+# Robustez dos pesos por Monte Carlo (estilo SMAA)
+# ===================================
+# Para uma matriz de pesos W (amostras × m), os fluxos líquidos de todas as
+# amostras saem de um único produto W · Φ, com Φ (m×n) os fluxos unicritério.
+# O ranking de cada amostra vem de um argsort por linha. As amostras são
+# processadas em lotes para que a memória não dependa do total sorteado.
+import numpy as np
+import pandas as pd
+
+from .cache import fluxos_liquidos_unicriterio, somas_por_criterio
+from .erros import ErroEntrada
+
+MODOS_AMOSTRAGEM = ('simplex', 'perturbacao')
+MEMORIA_PADRAO_MB = 64
+
+
+def _sortear_pesos(rng, tamanho, vetor_pesos, modo, variacao):
+    m = vetor_pesos.size
+    if modo == 'simplex':
+        # Uniforme no simplex (Dirichlet(1, ..., 1))
+        pesos = rng.dirichlet(np.ones(m), size=tamanho)
+    elif modo == 'perturbacao':
+        # Cada peso varia uniformemente em ±variacao (relativo) em torno do atual
+        ruido = rng.uniform(1 - variacao, 1 + variacao, size=(tamanho, m))
+        pesos = np.clip(vetor_pesos * ruido, 0, None)
+    else:
+        raise ErroEntrada(f"modo de amostragem desconhecido: {modo!r} (use {', '.join(MODOS_AMOSTRAGEM)})")
+    soma = pesos.sum(axis=1, keepdims=True)
+    soma[soma == 0] = 1
+    return pesos / soma
+
+
+def analise_monte_carlo(fluxos_unicriterio, vetor_pesos, nomes, criterios, amostras=10000,
+                        modo='perturbacao', variacao=0.2, semente=None,
+                        memoria_mb=MEMORIA_PADRAO_MB, posicoes=None):
+    # Retorna (aceitabilidade, pesos_centrais):
+    #   aceitabilidade[a, k] = fração das amostras em que a fica na posição k+1
+    #   pesos_centrais[a]    = média dos pesos das amostras em que a fica em 1º
+    m, n = fluxos_unicriterio.shape
+    vetor_pesos = np.asarray(vetor_pesos, dtype=float)
+    posicoes = n if posicoes is None else min(posicoes, n)
+    rng = np.random.default_rng(semente)
+
+    # Lote: ~7 arrays lote×n (fluxos, ordem, posições e temporários) e 2 lote×m
+    lote = max(1, int(memoria_mb * 1024 ** 2 // (8 * (7 * n + 2 * m))))
+
+    contagem = np.zeros(n * posicoes, dtype=np.int64)
+    soma_central = np.zeros((n, m))
+    vezes_primeiro = np.zeros(n, dtype=np.int64)
+    colunas = np.arange(n)
+
+    restantes = amostras
+    while restantes > 0:
+        tamanho = min(lote, restantes)
+        restantes -= tamanho
+
+        pesos = _sortear_pesos(rng, tamanho, vetor_pesos, modo, variacao)
+        fluxos = pesos @ fluxos_unicriterio
+        ordem = np.argsort(-fluxos, axis=1, kind='stable')
+
+        # posicao[s, a] = posição (0 = melhor) de a na amostra s
+        posicao = np.empty_like(ordem)
+        np.put_along_axis(posicao, ordem, colunas[np.newaxis, :], axis=1)
+
+        dentro = posicao < posicoes
+        indices = (colunas[np.newaxis, :] * posicoes + posicao)[dentro]
+        contagem += np.bincount(indices, minlength=n * posicoes)
+
+        primeiro = ordem[:, 0]
+        np.add.at(soma_central, primeiro, pesos)
+        vezes_primeiro += np.bincount(primeiro, minlength=n)
+
+    aceitabilidade = pd.DataFrame(
+        contagem.reshape(n, posicoes) / amostras,
+        index=pd.Index(list(nomes), name='Fornecedor'),
+        columns=[f'Posição {k + 1}' for k in range(posicoes)],
+    )
+    with np.errstate(invalid='ignore', divide='ignore'):
+        centrais = soma_central / vezes_primeiro[:, np.newaxis]
+    pesos_centrais = pd.DataFrame(centrais, index=aceitabilidade.index, columns=list(criterios))
+    pesos_centrais.insert(0, 'Aceitabilidade 1ª posição', vezes_primeiro / amostras)
+
+    return aceitabilidade, pesos_centrais
+
+
+def calcular_aceitabilidade(df, criterios, objetivo, pesos, funcoes, parametros, cache=None, **opcoes):
+    somas_pos, somas_neg = somas_por_criterio(df, criterios, objetivo, funcoes, parametros, cache)
+    return analise_monte_carlo(
+        fluxos_liquidos_unicriterio(somas_pos, somas_neg),
+        [pesos[crit] for crit in criterios],
+        df.index,
+        criterios,
+        **opcoes,
+    )
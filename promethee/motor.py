@@ -0,0 +1,131 @@
+# ===================================
+# Motor PROMETHEE II (matrizes completas)
+# ===================================
+import numpy as np
+
+from .compactas import compactar
+from .instrumentacao import fase
+from .preferencias import resolver_funcao_preferencia
+
+# Rótulos de objetivo usados pelas telas em PT e EN
+OBJETIVOS_MINIMIZACAO = ('Minimizado', 'Minimize', 'Minimização')
+OBJETIVOS_MAXIMIZACAO = ('Maximizado', 'Maximize', 'Maximização')
+
+
+def valores_orientados(df, crit, objetivo):
+    # Coluna do critério em float64, com sinal invertido se for de minimização,
+    # de modo que d(a,b) = x_a - x_b em todos os critérios
+    valores = df[crit].to_numpy(dtype=float)
+    if objetivo[crit] in OBJETIVOS_MINIMIZACAO:
+        valores = -valores
+    return valores
+
+
+def montar_resultado(alternativas, fluxo_positivo, fluxo_negativo):
+    # Tabela de ranking comum a todos os modos de cálculo; pandas só é
+    # carregado aqui, para que os fluxos possam ser usados sem ele
+    import pandas as pd
+
+    with fase('ranking'):
+        resultado = pd.DataFrame({
+            'Fornecedor': alternativas,
+            'Fluxo Positivo (ϕ+)': fluxo_positivo,
+            'Fluxo Negativo (ϕ-)': fluxo_negativo,
+            'Fluxo Líquido (ϕ)': fluxo_positivo - fluxo_negativo
+        })
+        resultado = resultado.sort_values('Fluxo Líquido (ϕ)', ascending=False)
+        resultado['Ranking'] = range(1, len(resultado) + 1)
+    return resultado
+
+
+def _primeiros(chave, k):
+    # Posições dos k menores valores de `chave`, em ordem crescente: seleção
+    # parcial O(n) e ordenação só dos k escolhidos
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    escolhidos = np.argpartition(chave, k - 1)[:k] if k < chave.size else np.arange(chave.size)
+    return escolhidos[np.argsort(chave[escolhidos], kind='stable')]
+
+
+def montar_top_k(alternativas, fluxo_positivo, fluxo_negativo, k, ultimos=0):
+    # Como montar_resultado, mas só com os k primeiros e, se pedido, os `ultimos`
+    # últimos do ranking; 'Ranking' é a posição no ranking completo. Nenhuma
+    # estrutura do tamanho de n além dos próprios fluxos
+    import pandas as pd
+
+    with fase('ranking'):
+        liquido = fluxo_positivo - fluxo_negativo
+        n = liquido.size
+        k = min(k, n)
+        ultimos = min(ultimos, n - k)
+
+        topo = _primeiros(-liquido, k)
+        fim = np.empty(0, dtype=np.intp)
+        if ultimos:
+            # Os últimos saem dos que não estão no topo, mesmo com empates na fronteira
+            restantes = np.ones(n, dtype=bool)
+            restantes[topo] = False
+            restantes = np.flatnonzero(restantes)
+            fim = restantes[_primeiros(liquido[restantes], ultimos)[::-1]]
+        linhas = np.concatenate((topo, fim))
+
+        resultado = pd.DataFrame({
+            'Fornecedor': [alternativas[i] for i in linhas],
+            'Fluxo Positivo (ϕ+)': fluxo_positivo[linhas],
+            'Fluxo Negativo (ϕ-)': fluxo_negativo[linhas],
+            'Fluxo Líquido (ϕ)': liquido[linhas]
+        }, index=linhas)
+        resultado['Ranking'] = np.concatenate((np.arange(1, k + 1), np.arange(n - ultimos + 1, n + 1)))
+    return resultado
+
+
+def calcular_promethee_sem_normalizar(df, criterios, objetivo, pesos, funcoes, parametros):
+    alternativas = df.index.tolist()
+    n = len(alternativas)
+    peso_total = sum(pesos.values())
+
+    # Inicializar matrizes
+    matriz_d = {}
+    matriz_pref = {}
+    matriz_agregada = np.zeros((n, n))
+
+    # Passo 1 e 2: calcular d(a,b) e aplicar F_j(a,b) para todos os pares de uma vez
+    for crit in criterios:
+        with fase('d(a,b)'):
+            # Colunas inteiras (notas 1-5) são subtraídas como inteiros, igual ao cálculo par a par
+            valores = df[crit].to_numpy()
+            if valores.dtype.kind not in 'iu':
+                valores = valores.astype(float)
+
+            # Diferença direta dos valores (sem normalizar): d[i, j] = g(a_i) - g(a_j)
+            d = valores[:, np.newaxis] - valores[np.newaxis, :]
+
+            # Inverter se critério for de minimização
+            if objetivo[crit] in OBJETIVOS_MINIMIZACAO:
+                d = -d
+            d = d.astype(float)
+            np.fill_diagonal(d, 0)
+
+        with fase('π(a,b)'):
+            # F_j resolvida uma única vez por critério, com q, p, s validados
+            funcao = resolver_funcao_preferencia(funcoes[crit], parametros[crit])
+            pref = funcao(d)
+            np.fill_diagonal(pref, 0)
+            matriz_agregada += pesos[crit] * pref
+
+        matriz_d[crit] = d
+        # Usual/Quase-critério em bits e Pseudo-critério em int8 (ver compactas.py)
+        matriz_pref[crit] = compactar(pref, funcao)
+
+    with fase('fluxos'):
+        # Passo 3: matriz de preferência agregada (dividir pelo peso total)
+        matriz_agregada /= peso_total
+
+        # Passo 4: cálculo dos fluxos
+        fluxo_positivo = matriz_agregada.sum(axis=1) / (n - 1)
+        fluxo_negativo = matriz_agregada.sum(axis=0) / (n - 1)
+
+    # Ranking final
+    resultado = montar_resultado(alternativas, fluxo_positivo, fluxo_negativo)
+
+    return resultado, matriz_d, matriz_pref, matriz_agregada
@@ -0,0 +1,142 @@
+# ===================================
+# PROMETHEE II em paralelo (pool de processos + memória compartilhada)
+# ===================================
+# A matriz de desempenho orientada (m×n, um critério por linha) é copiada uma
+# única vez para memória compartilhada; os processos a acessam sem serialização.
+# Cada tarefa escreve as somas unicritério Σ_b P_j(a,b) e Σ_b P_j(b,a) de um
+# critério inteiro (funções ordenáveis) ou de um bloco de linhas (Gaussiana)
+# em fatias disjuntas da saída compartilhada. A divisão em tarefas não depende
+# do número de processos e a agregação final segue a ordem dos critérios,
+# portanto o resultado é idêntico bit a bit para qualquer quantidade de workers.
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+from .fluxos import PARES_POR_BLOCO, somas_unicriterio
+from .motor import montar_resultado, valores_orientados
+from .preferencias import resolver_funcao_preferencia
+
+# Abaixo deste número de fornecedores o custo de subir processos não compensa
+LIMITE_PARALELO = 2000
+
+# Arrays compartilhados, anexados uma vez por processo no inicializador
+_compartilhado = {}
+
+
+def _tarefas(funcoes, n):
+    # (índice do critério, início, fim) — inicio/fim = None para o critério inteiro
+    linhas = max(1, PARES_POR_BLOCO // max(n, 1))
+    tarefas = []
+    for j, funcao in enumerate(funcoes):
+        if funcao.ordenavel:
+            tarefas.append((j, None, None))
+        else:
+            tarefas.extend((j, inicio, min(inicio + linhas, n)) for inicio in range(0, n, linhas))
+    return tarefas
+
+
+def _calcular_tarefa(x_todos, saida, tarefa, funcoes):
+    j, inicio, fim = tarefa
+    x = x_todos[j]
+    funcao = funcoes[j]
+
+    if inicio is None:
+        saida[0, j], saida[1, j] = somas_unicriterio(x, funcao)
+        return
+
+    # Bloco de linhas: ϕ+ e ϕ- das linhas do próprio bloco (P(b,a) = F(-d(a,b))),
+    # sem somas por coluna para reduzir entre tarefas
+    d = x[inicio:fim, np.newaxis] - x[np.newaxis, :]
+    diagonal = (np.arange(fim - inicio), np.arange(inicio, fim))
+    pref = funcao(d)
+    pref[diagonal] = 0
+    saida[0, j, inicio:fim] = pref.sum(axis=1)
+    pref = funcao(-d)
+    pref[diagonal] = 0
+    saida[1, j, inicio:fim] = pref.sum(axis=1)
+
+
+def _inicializar_processo(nome_x, forma_x, nome_saida, forma_saida, funcoes):
+    mem_x = shared_memory.SharedMemory(name=nome_x)
+    mem_saida = shared_memory.SharedMemory(name=nome_saida)
+    _compartilhado.update(
+        memorias=(mem_x, mem_saida),
+        x=np.ndarray(forma_x, dtype=np.float64, buffer=mem_x.buf),
+        saida=np.ndarray(forma_saida, dtype=np.float64, buffer=mem_saida.buf),
+        funcoes=funcoes,
+    )
+
+
+def _executar_no_processo(tarefa):
+    _calcular_tarefa(_compartilhado['x'], _compartilhado['saida'], tarefa, _compartilhado['funcoes'])
+
+
+def somas_unicriterio_paralelas(x_todos, funcoes, trabalhadores=None):
+    # x_todos: matriz m×n já orientada, funcoes: F_j resolvidas; retorna saida[0] = Σ_b P_j(a,b) e
+    # saida[1] = Σ_b P_j(b,a), ambos m×n
+    m, n = x_todos.shape
+    tarefas = _tarefas(funcoes, n)
+    if trabalhadores is None:
+        trabalhadores = os.cpu_count() or 1
+    trabalhadores = min(trabalhadores, len(tarefas))
+
+    # Execução serial: mesmas tarefas, mesma ordem, sem processos
+    if trabalhadores <= 1 or n < LIMITE_PARALELO:
+        saida = np.zeros((2, m, n))
+        for tarefa in tarefas:
+            _calcular_tarefa(x_todos, saida, tarefa, funcoes)
+        return saida
+
+    forma_saida = (2, m, n)
+    mem_x = shared_memory.SharedMemory(create=True, size=max(x_todos.nbytes, 1))
+    mem_saida = shared_memory.SharedMemory(create=True, size=8 * 2 * m * n)
+    try:
+        x_comp = np.ndarray(x_todos.shape, dtype=np.float64, buffer=mem_x.buf)
+        x_comp[:] = x_todos
+        saida_comp = np.ndarray(forma_saida, dtype=np.float64, buffer=mem_saida.buf)
+        saida_comp[:] = 0
+
+        with ProcessPoolExecutor(
+            max_workers=trabalhadores,
+            mp_context=get_context('spawn'),
+            initializer=_inicializar_processo,
+            initargs=(mem_x.name, x_todos.shape, mem_saida.name, forma_saida, list(funcoes)),
+        ) as pool:
+            for _ in pool.map(_executar_no_processo, tarefas):
+                pass
+
+        saida = saida_comp.copy()
+        del x_comp, saida_comp
+    finally:
+        mem_x.close()
+        mem_x.unlink()
+        mem_saida.close()
+        mem_saida.unlink()
+    return saida
+
+
+def calcular_promethee_paralelo(df, criterios, objetivo, pesos, funcoes, parametros, trabalhadores=None):
+    alternativas = df.index.tolist()
+    n = len(alternativas)
+    peso_total = sum(pesos.values())
+
+    x_todos = np.vstack([valores_orientados(df, crit, objetivo) for crit in criterios])
+    saida = somas_unicriterio_paralelas(
+        x_todos,
+        [resolver_funcao_preferencia(funcoes[crit], parametros[crit]) for crit in criterios],
+        trabalhadores,
+    )
+
+    # Redução no processo principal, sempre na ordem dos critérios
+    fluxo_positivo = np.zeros(n)
+    fluxo_negativo = np.zeros(n)
+    for j, crit in enumerate(criterios):
+        fluxo_positivo += pesos[crit] * saida[0, j]
+        fluxo_negativo += pesos[crit] * saida[1, j]
+
+    fluxo_positivo /= peso_total * (n - 1)
+    fluxo_negativo /= peso_total * (n - 1)
+
+    return montar_resultado(alternativas, fluxo_positivo, fluxo_negativo)
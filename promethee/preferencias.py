@@ -0,0 +1,171 @@
+# ===================================
+# Funções de Preferência (registro)
+# ===================================
+# Cada função é resolvida uma vez por critério: o nome (PT, EN ou dos
+# protótipos antigos) aponta para a mesma classe, os parâmetros q, p, s são
+# lidos e validados na construção e o objeto resultante é aplicado a arrays
+# inteiros de diferenças d(a,b).
+#
+# As funções ordenáveis descrevem F_j como degraus (limiar, altura) mais uma
+# rampa linear (a, b), o que permite o cálculo por ordenação em fluxos.py.
+import math
+
+import numpy as np
+
+from .erros import ErroEntrada
+
+
+class FuncaoPreferencia:
+    nome = None
+    tipo = None
+    ordenavel = True
+
+    # Degraus (limiar, altura): soma altura quando d > limiar
+    degraus = ()
+    # Rampa (a, b): (d - a) / (b - a) para a < d <= b e 1 para d > b
+    rampa = None
+
+    def __init__(self, q=0, p=0, s=1, exato=False):
+        if q < 0 or p < 0:
+            raise ErroEntrada("os limiares q e p não podem ser negativos")
+        self.q = q
+        self.p = p
+        self.s = s
+        self.exato = exato
+
+    def __call__(self, d):
+        d = np.asarray(d, dtype=float)
+        pref = np.zeros_like(d)
+        for limiar, altura in self.degraus:
+            pref[d > limiar] += altura
+        if self.rampa is not None:
+            a, b = self.rampa
+            linear = (d > a) & (d <= b)
+            pref[linear] = (d[linear] - a) / (b - a)
+            pref[d > b] = 1
+        return pref
+
+    def __repr__(self):
+        return f"{type(self).__name__}(q={self.q}, p={self.p}, s={self.s})"
+
+
+class Usual(FuncaoPreferencia):
+    nome = 'Usual'
+    tipo = 1
+    degraus = ((0, 1),)
+
+
+class QuaseCriterio(FuncaoPreferencia):
+    nome = 'Quase-critério'
+    tipo = 2
+
+    @property
+    def degraus(self):
+        return ((self.q, 1),)
+
+
+class LimiarPreferencia(FuncaoPreferencia):
+    nome = 'Limiar de preferência'
+    tipo = 3
+
+    @property
+    def rampa(self):
+        return (0, self.p)
+
+
+class PseudoCriterio(FuncaoPreferencia):
+    nome = 'Pseudo-critério'
+    tipo = 4
+
+    def __init__(self, q=0, p=0, s=1, exato=False):
+        super().__init__(q, p, s, exato)
+        if p <= q:
+            raise ErroEntrada("o limiar de preferência (p) deve ser MAIOR que o limiar de indiferença (q)")
+
+    def __call__(self, d):
+        # Mesmas máscaras do cálculo par a par (0,5 na faixa, 1 acima de p)
+        d = np.asarray(d, dtype=float)
+        pref = np.zeros_like(d)
+        pref[(d > self.q) & (d <= self.p)] = 0.5
+        pref[d > self.p] = 1
+        return pref
+
+    @property
+    def degraus(self):
+        return ((self.q, 0.5), (self.p, 0.5))
+
+
+class AreaIndiferenca(FuncaoPreferencia):
+    nome = 'Área de indiferença'
+    tipo = 5
+
+    def __init__(self, q=0, p=0, s=1, exato=False):
+        super().__init__(q, p, s, exato)
+        if p <= q:
+            raise ErroEntrada("o limiar de preferência (p) deve ser MAIOR que o limiar de indiferença (q)")
+
+    @property
+    def rampa(self):
+        return (self.q, self.p)
+
+
+class Gaussiana(FuncaoPreferencia):
+    nome = 'Gaussiana'
+    tipo = 6
+    ordenavel = False
+
+    def __init__(self, q=0, p=0, s=1, exato=False):
+        super().__init__(q, p, s, exato)
+        if s <= 0:
+            raise ErroEntrada("o parâmetro s deve ser POSITIVO")
+
+    def __call__(self, d):
+        d = np.asarray(d, dtype=float)
+        pref = np.zeros_like(d)
+        positivo = d > 0
+        expoente = -(d[positivo] ** 2) / (2 * self.s ** 2)
+        if self.exato:
+            # math.exp, uma chamada por par: só para conferir bit a bit com o cálculo
+            # escalar (np.exp pode diferir no último bit)
+            pref[positivo] = 1 - np.fromiter(map(math.exp, expoente), dtype=float, count=expoente.size)
+        else:
+            pref[positivo] = 1 - np.exp(expoente)
+        return pref
+
+
+FUNCOES_PREFERENCIA = {
+    classe.nome: classe
+    for classe in (Usual, QuaseCriterio, LimiarPreferencia, PseudoCriterio, AreaIndiferenca, Gaussiana)
+}
+
+# Nomes usados em app_up_ingles.py e nos protótipos (sad.py, finale1.py, upgrade.py)
+NOMES_ALTERNATIVOS = {
+    'Linear': 'Usual',
+    'U-Shape': 'Quase-critério',
+    'V-Shape': 'Limiar de preferência',
+    'Level': 'Pseudo-critério',
+    'V-Shape with Indifference': 'Área de indiferença',
+    'V-Shape I': 'Área de indiferença',
+    'Gaussian': 'Gaussiana',
+}
+
+
+def nome_canonico(nome):
+    if not isinstance(nome, str):
+        raise ErroEntrada(f"função de preferência deve ser um nome, não {nome!r}")
+    nome = NOMES_ALTERNATIVOS.get(nome, nome)
+    if nome not in FUNCOES_PREFERENCIA:
+        raise ErroEntrada(f"função de preferência desconhecida: {nome!r}")
+    return nome
+
+
+def resolver_funcao_preferencia(nome, parametros=None, exato=False):
+    # Resolve nome + dicionário de parâmetros ('r' é aceito como sinônimo de 'p')
+    parametros = parametros or {}
+    classe = FUNCOES_PREFERENCIA[nome_canonico(nome)]
+    return classe(
+        q=parametros.get('q', 0),
+        p=parametros.get('p', parametros.get('r', 0)),
+        s=parametros.get('s', 1),
+        exato=exato,
+    )
@@ -0,0 +1,233 @@
+# ===================================
+# Regressão contra resultados de referência (golden)
+# ===================================
+# python -m promethee.regressao
+#
+# Cada arquivo em referencias/golden/ traz um cenário (mesmo formato do lote,
+# ver promethee/cli.py) e os fluxos esperados por fornecedor. Todas as
+# variantes do motor rodam sobre cada cenário e precisam reproduzir ϕ+, ϕ- e
+# ϕ dentro da tolerância e a mesma ordem do ranking; assim qualquer modo de
+# desempenho novo pode ser comparado com o laço par a par da definição.
+# Sai com código 1 se alguma variante divergir.
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+
+from . import paralelo
+from .blocos import calcular_promethee_em_blocos
+from .cache import CacheFluxosUnicriterio, calcular_promethee_com_cache
+from .cli import interpretar_cenario
+from .dominancia import calcular_top_k_por_dominancia
+from .duplicados import calcular_promethee_sem_duplicados
+from .fluxos import calcular_promethee_somente_fluxos
+from .importacao import importar_matriz_desempenho
+from .incremental import PrometheeIncremental
+from .motor import calcular_promethee_sem_normalizar, montar_resultado
+
+RAIZ = Path(__file__).resolve().parent.parent
+PASTA_GOLDEN = RAIZ / 'referencias' / 'golden'
+TOLERANCIA = 1e-9
+# Tamanho do top-k conferido com a poda por dominância
+TOP_K = 3
+
+COLUNAS_FLUXO = {
+    'positivo': 'Fluxo Positivo (ϕ+)',
+    'negativo': 'Fluxo Negativo (ϕ-)',
+    'liquido': 'Fluxo Líquido (ϕ)',
+}
+
+
+# ===================================
+# Variantes do motor
+# ===================================
+def _preferencia_escalar(nome, parametros, d):
+    # Fórmulas escritas à parte, como no laço original de app_up_5.py: não usam
+    # o registro de preferencias.py, para que um limiar trocado ou um nome
+    # alternativo mal mapeado lá apareça como divergência aqui
+    q = parametros.get('q', 0)
+    p = parametros.get('p', parametros.get('r', 0))
+    s = parametros.get('s', 1)
+    if nome in ('Usual', 'Linear'):
+        return 1.0 if d > 0 else 0.0
+    elif nome in ('Quase-critério', 'U-Shape'):
+        return 1.0 if d > q else 0.0
+    elif nome in ('Limiar de preferência', 'V-Shape'):
+        if d <= 0:
+            return 0.0
+        elif d <= p:
+            return d / p
+        else:
+            return 1.0
+    elif nome in ('Pseudo-critério', 'Level'):
+        if d <= q:
+            return 0.0
+        elif d <= p:
+            return 0.5
+        else:
+            return 1.0
+    elif nome in ('Área de indiferença', 'V-Shape with Indifference', 'V-Shape I'):
+        if d <= q:
+            return 0.0
+        elif d <= p:
+            return (d - q) / (p - q)
+        else:
+            return 1.0
+    elif nome in ('Gaussiana', 'Gaussian'):
+        return 1 - math.exp(-(d ** 2) / (2 * s ** 2)) if d > 0 else 0.0
+    raise ValueError(f"função de preferência desconhecida: {nome!r}")
+
+
+def calcular_por_laco(df, criterios, objetivo, pesos, funcoes, parametros):
+    # Definição direta, um par (a,b) e um critério por vez: a referência das demais
+    alternativas = df.index.tolist()
+    n = len(alternativas)
+    peso_total = sum(pesos.values())
+    fluxo_positivo = np.zeros(n)
+    fluxo_negativo = np.zeros(n)
+
+    for crit in criterios:
+        minimizar = objetivo[crit] in ('Minimizado', 'Minimize', 'Minimização')
+        valores = df[crit].tolist()
+        for i in range(n):
+            for k in range(n):
+                if i != k:
+                    d = valores[k] - valores[i] if minimizar else valores[i] - valores[k]
+                    pref = pesos[crit] * _preferencia_escalar(funcoes[crit], parametros[crit], d)
+                    fluxo_positivo[i] += pref
+                    fluxo_negativo[k] += pref
+
+    fluxo_positivo /= peso_total * (n - 1)
+    fluxo_negativo /= peso_total * (n - 1)
+    return montar_resultado(alternativas, fluxo_positivo, fluxo_negativo)
+
+
+def _vetorizado(*cenario):
+    return calcular_promethee_sem_normalizar(*cenario)[0]
+
+
+def _blocos_de_uma_linha(*cenario):
+    # Orçamento mínimo: um ladrilho por fornecedor, exercita a acumulação entre blocos
+    return calcular_promethee_em_blocos(*cenario, memoria_mb=1e-6)
+
+
+def _paralelo_forcado(*cenario):
+    # Abaixo de LIMITE_PARALELO o motor cai no cálculo serial; aqui o pool sobe sempre
+    limite = paralelo.LIMITE_PARALELO
+    paralelo.LIMITE_PARALELO = 0
+    try:
+        return paralelo.calcular_promethee_paralelo(*cenario, trabalhadores=2)
+    finally:
+        paralelo.LIMITE_PARALELO = limite
+
+
+def _cache_novo(*cenario):
+    return calcular_promethee_com_cache(*cenario, cache=CacheFluxosUnicriterio())
+
+
+def _incremental(df, criterios, objetivo, pesos, funcoes, parametros):
+    # Um fornecedor por vez, como na inclusão pela tela
+    motor = PrometheeIncremental(criterios, objetivo, pesos, funcoes, parametros)
+    for nome, linha in df[criterios].iterrows():
+        motor.adicionar(nome, linha)
+    return motor.resultado()
+
+
+VARIANTES = {
+    'laço': calcular_por_laco,
+    'vetorizado': _vetorizado,
+    'blocos': _blocos_de_uma_linha,
+    'ordenado': calcular_promethee_somente_fluxos,
+    'paralelo': _paralelo_forcado,
+    'cache': _cache_novo,
+    'incremental': _incremental,
+    'duplicados': calcular_promethee_sem_duplicados,
+}
+
+
+# ===================================
+# Verificação
+# ===================================
+def carregar_golden(caminho):
+    golden = json.loads(Path(caminho).read_text(encoding='utf-8'))
+    return golden, interpretar_cenario(golden)[1:]
+
+
+def conferir(resultado, esperado):
+    # (maior erro absoluto entre os fluxos, ordem do ranking confere)
+    obtido = resultado.set_index('Fornecedor')
+    if set(obtido.index) != set(esperado):
+        return float('inf'), False
+    erro = max(
+        abs(obtido.at[nome, coluna] - valores[chave])
+        for nome, valores in esperado.items()
+        for chave, coluna in COLUNAS_FLUXO.items()
+    )
+    ordem_esperada = sorted(esperado, key=lambda nome: -esperado[nome]['liquido'])
+    return erro, obtido.index.tolist() == ordem_esperada
+
+
+def conferir_top_k(cenario, esperado, k=TOP_K):
+    # Os k primeiros com poda por dominância devem ser os k primeiros esperados
+    resultado, _ = calcular_top_k_por_dominancia(*cenario, k=k)
+    obtido = resultado.set_index('Fornecedor')
+    ordem_esperada = sorted(esperado, key=lambda nome: -esperado[nome]['liquido'])[:k]
+    if not set(obtido.index) <= set(esperado):
+        return float('inf'), False
+    erro = max(
+        abs(obtido.at[nome, coluna] - esperado[nome][chave])
+        for nome in obtido.index
+        for chave, coluna in COLUNAS_FLUXO.items()
+    )
+    return erro, obtido.index.tolist() == ordem_esperada
+
+
+def _conferir_planilha(golden, df):
+    # A matriz do golden precisa ser a que o importador lê da planilha de origem
+    caminho = RAIZ / golden['planilha']
+    try:
+        importada, _ = importar_matriz_desempenho(caminho.read_bytes(), caminho.name, list(df.columns))
+    except ImportError as erro:
+        return f"pulada ({str(erro).split('.')[0]})"
+    if importada.index.tolist() != df.index.tolist() or not np.array_equal(importada.to_numpy(), df.to_numpy()):
+        return "DIVERGE"
+    return "ok"
+
+
+def verificar(pasta=PASTA_GOLDEN, variantes=None, tolerancia=TOLERANCIA):
+    variantes = VARIANTES if variantes is None else {nome: VARIANTES[nome] for nome in variantes}
+    falhas = 0
+    for caminho in sorted(Path(pasta).glob('*.json')):
+        golden, cenario = carregar_golden(caminho)
+        tolerancia_golden = golden.get('tolerancia', tolerancia)
+        print(f"{caminho.name}: {golden.get('origem', '')}")
+
+        if 'planilha' in golden:
+            situacao = _conferir_planilha(golden, cenario[0])
+            falhas += situacao == "DIVERGE"
+            print(f"  {'planilha':12} {situacao}  {golden['planilha']}")
+
+        for nome, calcular in variantes.items():
+            erro, ordem_ok = conferir(calcular(*cenario), golden['esperado'])
+            ok = erro <= tolerancia_golden and ordem_ok
+            falhas += not ok
+            print(f"  {nome:12} {'ok' if ok else 'FALHOU':6} erro máx. {erro:.2e}"
+                  f"{'' if ordem_ok else '  (ordem do ranking diferente)'}")
+
+        erro, ordem_ok = conferir_top_k(cenario, golden['esperado'])
+        ok = erro <= tolerancia_golden and ordem_ok
+        falhas += not ok
+        print(f"  {f'top-{TOP_K}':12} {'ok' if ok else 'FALHOU':6} erro máx. {erro:.2e}"
+              f"{'' if ordem_ok else '  (top-k diferente)'}")
+
+        if 'ordem_publicada' in golden:
+            ordem = calcular_por_laco(*cenario)['Fornecedor'].tolist()
+            ok = ordem == golden['ordem_publicada']
+            falhas += not ok
+            print(f"  {'publicado':12} {'ok' if ok else 'FALHOU':6} ordem {' > '.join(golden['ordem_publicada'])}")
+    return falhas
+
+
+if __name__ == '__main__':
+    raise SystemExit(1 if verificar() else 0)
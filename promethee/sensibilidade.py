@@ -0,0 +1,76 @@
+# ===================================
+# Intervalos de estabilidade dos pesos (PROMETHEE II)
+# ===================================
+# Com os fluxos unicritério ϕ_j, o fluxo líquido é
+#   ϕ(a) = Σ_j w_j ϕ_j(a) / W
+# Variando só w_k para w_k + t, a ordem depende de N(a) + t·ϕ_k(a), pois a
+# divisão por W + t > 0 não altera o ranking. O ranking é uma cadeia: ele se
+# mantém enquanto cada par de posições vizinhas mantiver a ordem, e cada par
+# impõe um limite linear em t. Ordenando uma vez (O(n log n)) e percorrendo
+# os n-1 pares vizinhos por critério, os m intervalos saem em O(m·n).
+import numpy as np
+import pandas as pd
+
+from .cache import fluxos_liquidos_unicriterio, somas_por_criterio
+
+# Diferenças de fluxo abaixo disso são tratadas como empate
+TOLERANCIA = 1e-12
+
+
+def intervalos_estabilidade_pesos(fluxos_unicriterio, vetor_pesos, nomes, criterios, tolerancia=TOLERANCIA):
+    # fluxos_unicriterio: matriz m×n com ϕ_j(a); vetor_pesos na ordem de `criterios`
+    vetor_pesos = np.asarray(vetor_pesos, dtype=float)
+    nomes = list(nomes)
+    fluxo = vetor_pesos @ fluxos_unicriterio
+    ordem = np.argsort(-fluxo, kind='stable')
+
+    # Folga de cada par vizinho (posição i à frente da posição i+1)
+    folga = fluxo[ordem[:-1]] - fluxo[ordem[1:]]
+    folga[folga < tolerancia] = 0
+
+    linhas = []
+    for j, crit in enumerate(criterios):
+        w = vetor_pesos[j]
+        inclinacao = fluxos_unicriterio[j, ordem[:-1]] - fluxos_unicriterio[j, ordem[1:]]
+
+        # Aumentar w_j aproxima os pares em que o de trás é melhor no critério j
+        t_max, troca_acima = np.inf, '-'
+        sobe = inclinacao < -tolerancia
+        if sobe.any():
+            limites = folga[sobe] / -inclinacao[sobe]
+            k = np.argmin(limites)
+            i = np.flatnonzero(sobe)[k]
+            t_max = limites[k]
+            troca_acima = f"{nomes[ordem[i]]} ↔ {nomes[ordem[i + 1]]}"
+
+        # Diminuir w_j aproxima os pares em que o da frente é melhor no critério j
+        t_min, troca_abaixo = -w, '-'
+        desce = inclinacao > tolerancia
+        if desce.any():
+            limites = -folga[desce] / inclinacao[desce]
+            k = np.argmax(limites)
+            if limites[k] > t_min:
+                i = np.flatnonzero(desce)[k]
+                t_min = limites[k]
+                troca_abaixo = f"{nomes[ordem[i]]} ↔ {nomes[ordem[i + 1]]}"
+
+        linhas.append({
+            'Critério': crit,
+            'Peso': w,
+            'Peso mínimo': w + t_min,
+            'Peso máximo': w + t_max,
+            'Troca abaixo do mínimo': troca_abaixo,
+            'Troca acima do máximo': troca_acima,
+        })
+
+    return pd.DataFrame(linhas)
+
+
+def calcular_intervalos_estabilidade(df, criterios, objetivo, pesos, funcoes, parametros, cache=None):
+    somas_pos, somas_neg = somas_por_criterio(df, criterios, objetivo, funcoes, parametros, cache)
+    return intervalos_estabilidade_pesos(
+        fluxos_liquidos_unicriterio(somas_pos, somas_neg),
+        [pesos[crit] for crit in criterios],
+        df.index,
+        criterios,
+    )
@@ -0,0 +1,200 @@
+# ===================================
+# Serviço HTTP local de ranking PROMETHEE II
+# ===================================
+# python -m promethee.servico --porta 8765 --processos 2
+#
+# POST /ranking, /sensibilidade e /monte-carlo recebem o JSON de um cenário do
+# lote (formato em promethee/cli.py) com os dados em "fornecedores". O
+# /monte-carlo aceita ainda "amostras", "modo", "variacao" e "semente".
+# GET /saude informa processos, pedidos e quantos foram agrupados. Entrada
+# inválida (ErroEntrada, validada em interpretar_cenario) responde 400.
+#
+# O laço asyncio só recebe e responde; o cálculo roda em um pool de processos
+# aquecido na partida, e cada processo guarda seu cache de somas unicritério
+# entre pedidos. Pedidos idênticos que chegam enquanto um deles está em
+# cálculo esperam o mesmo resultado em vez de calcular de novo.
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from multiprocessing import get_context
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from .erros import ErroEntrada
+
+OPERACOES = ('ranking', 'sensibilidade', 'monte-carlo')
+OPCOES_MONTE_CARLO = ('amostras', 'modo', 'variacao', 'semente')
+MAX_AMOSTRAS = 200_000
+
+_CENARIO_AQUECIMENTO = {
+    'fornecedores': {'A': {'C1': 1.0, 'C2': 2.0}, 'B': {'C1': 2.0, 'C2': 1.0}, 'C': {'C1': 3.0, 'C2': 3.0}},
+    'criterios': {'C1': {'objetivo': 'Minimizado', 'funcao': 'Área de indiferença', 'q': 0.5, 'p': 1.5},
+                  'C2': {'funcao': 'Gaussiana', 's': 1.0}},
+    'amostras': 100,
+}
+
+
+def _registros(tabela):
+    # to_json troca NaN/inf por null, que o JSON aceita
+    return json.loads(tabela.to_json(orient='records', force_ascii=False))
+
+
+def _opcoes_monte_carlo(cenario):
+    opcoes = {chave: cenario[chave] for chave in OPCOES_MONTE_CARLO if chave in cenario}
+    # semente pode ser null (sorteio não reprodutível); bool não vale como número
+    for chave, tipos in (('amostras', int), ('variacao', (int, float)), ('semente', (int, type(None)))):
+        if chave in opcoes and (isinstance(opcoes[chave], bool) or not isinstance(opcoes[chave], tipos)):
+            raise ErroEntrada(f"'{chave}' inválido: {opcoes[chave]!r}")
+    if not 0 < opcoes.get('amostras', 1) <= MAX_AMOSTRAS:
+        raise ErroEntrada(f"'amostras' deve estar entre 1 e {MAX_AMOSTRAS}")
+    return opcoes
+
+
+def _executar(operacao, cenario):
+    # Roda nos processos do pool; os módulos de cálculo só existem lá
+    from .cli import MOTORES, interpretar_cenario
+    from .monte_carlo import calcular_aceitabilidade
+    from .sensibilidade import calcular_intervalos_estabilidade
+
+    motor, df, criterios, objetivo, pesos, funcoes, parametros = interpretar_cenario(cenario, motor_padrao='cache')
+    argumentos = (df, criterios, objetivo, pesos, funcoes, parametros)
+
+    if operacao == 'ranking':
+        return {'motor': motor, 'ranking': _registros(MOTORES[motor](*argumentos))}
+    if operacao == 'sensibilidade':
+        return {'intervalos': _registros(calcular_intervalos_estabilidade(*argumentos))}
+
+    opcoes = _opcoes_monte_carlo(cenario)
+    aceitabilidade, pesos_centrais = calcular_aceitabilidade(*argumentos, **opcoes)
+    return {
+        'aceitabilidade': _registros(aceitabilidade.reset_index()),
+        'pesos_centrais': _registros(pesos_centrais.reset_index()),
+    }
+
+
+def _aquecer():
+    # Inicializador de cada processo: importa o motor e passa uma vez por cada caminho
+    for operacao in OPERACOES:
+        _executar(operacao, _CENARIO_AQUECIMENTO)
+
+
+def _pronto():
+    return os.getpid()
+
+
+def chave_pedido(operacao, cenario):
+    texto = json.dumps(cenario, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return operacao, hashlib.blake2b(texto.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ServicoPromethee:
+    def __init__(self, processos=None):
+        self.processos = processos or os.cpu_count() or 1
+        self.pool = None
+        self._em_andamento = {}
+        self.pedidos = 0
+        self.calculos = 0
+        self.agrupados = 0
+
+    async def iniciar(self):
+        self.pool = ProcessPoolExecutor(max_workers=self.processos, mp_context=get_context('spawn'),
+                                        initializer=_aquecer)
+        # Um pedido por processo força todos a subir (e aquecer) antes do primeiro cliente
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, _pronto) for _ in range(self.processos)))
+
+    def encerrar(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    async def calcular(self, operacao, cenario):
+        self.pedidos += 1
+        chave = chave_pedido(operacao, cenario)
+        futuro = self._em_andamento.get(chave)
+        if futuro is None:
+            self.calculos += 1
+            futuro = asyncio.get_running_loop().run_in_executor(self.pool, _executar, operacao, cenario)
+            self._em_andamento[chave] = futuro
+            futuro.add_done_callback(lambda _: self._em_andamento.pop(chave, None))
+        else:
+            self.agrupados += 1
+        # shield: um cliente que desiste não cancela o cálculo dos outros
+        return await asyncio.shield(futuro)
+
+    def estado(self):
+        return {
+            'processos': self.processos,
+            'pedidos': self.pedidos,
+            'calculos': self.calculos,
+            'agrupados': self.agrupados,
+            'em_andamento': len(self._em_andamento),
+        }
+
+
+def criar_app(processos=None):
+    servico = ServicoPromethee(processos)
+
+    @asynccontextmanager
+    async def ciclo_de_vida(app):
+        await servico.iniciar()
+        try:
+            yield
+        finally:
+            servico.encerrar()
+
+    async def calcular(request):
+        operacao = request.path_params['operacao']
+        if operacao not in OPERACOES:
+            return JSONResponse({'erro': f"operação desconhecida: {operacao!r} (use {', '.join(OPERACOES)})"},
+                                status_code=404)
+        try:
+            cenario = await request.json()
+        except (json.JSONDecodeError, UnicodeDecodeError) as erro:
+            return JSONResponse({'erro': f"JSON inválido: {erro}"}, status_code=400)
+        if not isinstance(cenario, dict):
+            return JSONResponse({'erro': "o corpo deve ser um objeto JSON"}, status_code=400)
+
+        try:
+            resultado = await servico.calcular(operacao, cenario)
+        except ErroEntrada as erro:
+            # Só entrada inválida é 400; outras exceções são falha do serviço (500)
+            return JSONResponse({'erro': str(erro)}, status_code=400)
+        return JSONResponse(resultado)
+
+    async def saude(request):
+        return JSONResponse(servico.estado())
+
+    app = Starlette(
+        routes=[Route('/saude', saude, methods=['GET']), Route('/{operacao}', calcular, methods=['POST'])],
+        lifespan=ciclo_de_vida,
+    )
+    app.state.servico = servico
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m promethee.servico',
+        description="Serviço HTTP local de ranking, sensibilidade e Monte Carlo PROMETHEE II.",
+    )
+    parser.add_argument('--host', default='127.0.0.1', help="endereço (padrão: 127.0.0.1, só a máquina local)")
+    parser.add_argument('--porta', type=int, default=8765, help="porta (padrão: 8765)")
+    parser.add_argument('--processos', type=int, default=None,
+                        help="processos de cálculo (padrão: número de CPUs)")
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    uvicorn.run(criar_app(args.processos), host=args.host, port=args.porta, log_level='warning')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
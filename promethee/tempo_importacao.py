@@ -0,0 +1,64 @@
+# ===================================
+# Orçamento de tempo de importação
+# ===================================
+# python -m promethee.tempo_importacao
+#
+# Cada instrução roda em um interpretador novo (sem cache de módulos), algumas
+# vezes, e vale o menor tempo. Falha (código de saída 1) se passar do
+# orçamento ou se carregar um módulo pesado que aquele caminho não usa.
+# O pytest confere os mesmos orçamentos em tests/test_tempo_importacao.py;
+# o comando fica para rodar à mão e ver os tempos.
+import subprocess
+import sys
+from pathlib import Path
+
+REPETICOES = 5
+
+# (instrução, orçamento em ms, módulos que não podem ser carregados)
+ORCAMENTOS = (
+    ('import promethee', 50, ('numpy', 'pandas', 'plotly', 'streamlit')),
+    ('from promethee import DESCRICAO_CRITERIOS, ESCALA_QUALITATIVA', 50, ('numpy', 'pandas', 'plotly', 'streamlit')),
+    ('from promethee import somas_unicriterio, combinar_pesos', 400, ('pandas', 'plotly', 'streamlit')),
+    ('from promethee import calcular_promethee_sem_normalizar', 400, ('pandas', 'plotly', 'streamlit')),
+    ('from promethee import calcular_intervalos_estabilidade', 1500, ('plotly', 'streamlit')),
+    ('from promethee.cli import main', 1500, ('plotly', 'streamlit')),
+)
+
+_PROGRAMA = """
+import sys, time
+inicio = time.perf_counter()
+{instrucao}
+decorrido = time.perf_counter() - inicio
+carregados = [m for m in {proibidos!r} if m in sys.modules]
+print(decorrido * 1000, ','.join(carregados))
+"""
+
+
+def medir(instrucao, proibidos=(), repeticoes=REPETICOES):
+    # (menor tempo em ms, módulos proibidos que foram carregados)
+    tempos = []
+    carregados = ''
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, '-c', _PROGRAMA.format(instrucao=instrucao, proibidos=tuple(proibidos))],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parent.parent,
+        ).stdout.split()
+        tempos.append(float(saida[0]))
+        carregados = saida[1] if len(saida) > 1 else ''
+    return min(tempos), [m for m in carregados.split(',') if m]
+
+
+def verificar(orcamentos=ORCAMENTOS, repeticoes=REPETICOES):
+    falhas = 0
+    for instrucao, orcamento_ms, proibidos in orcamentos:
+        tempo_ms, carregados = medir(instrucao, proibidos, repeticoes)
+        ok = tempo_ms <= orcamento_ms and not carregados
+        falhas += not ok
+        situacao = 'ok' if ok else 'FALHOU'
+        extra = f" (carregou {', '.join(carregados)})" if carregados else ''
+        print(f"{situacao:6} {tempo_ms:8.1f} ms / {orcamento_ms:5d} ms  {instrucao}{extra}")
+    return falhas
+
+
+if __name__ == '__main__':
+    raise SystemExit(1 if verificar() else 0)
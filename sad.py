@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
-import math
+
+from promethee import resolver_funcao_preferencia
 
 # Etapa 1: Estruturação do Problema e Definição dos Critérios
 st.title("Aplicação do Modelo Proposto - Seleção de Fornecedores")
@@ -107,58 +109,48 @@ st.write("### Desempenho dos Fornecedores:")
 df_desempenho = pd.DataFrame(desempenho_fornecedores)
 st.dataframe(df_desempenho)
 
-# Função para calcular o diferencial de desempenho
-def calcular_diferencial(df, fornecedor_1, fornecedor_2, criterio):
-    return abs(df[fornecedor_1][criterio] - df[fornecedor_2][criterio])
+# Função para calcular o diferencial de desempenho (todos os pares de fornecedores no critério)
+def calcular_diferencial(valores):
+    return np.abs(valores[:, np.newaxis] - valores[np.newaxis, :])
 
 # Função para aplicar a função de preferência
-def aplicar_funcao_preferencia(funcao, diferenca, parametros):
-    if funcao == 'Linear':
-        return 1 if diferenca > 0 else 0
-    elif funcao == 'U-Shape':
-        return 1 if diferenca > parametros['q'] else 0
-    elif funcao == 'V-Shape':
-        return min(diferenca / parametros['r'], 1)
-    elif funcao == 'Level':
-        if diferenca <= parametros['q']:
-            return 0
-        elif parametros['q'] < diferenca <= parametros['r']:
-            return 0.5
-        else:
-            return 1
-    elif funcao == 'V-Shape I':
-        if diferenca <= parametros['q']:
-            return 0
-        elif parametros['q'] < diferenca <= parametros['r']:
-            return (diferenca - parametros['q']) / (parametros['r'] - parametros['q'])
-        else:
-            return 1
-    elif funcao == 'Gaussian':
-        return 1 - math.exp(-(diferenca ** 2) / (2 * (parametros['s'] ** 2)))
+# (`funcao` já resolvida pelo núcleo PROMETHEE: 'Linear' = Usual, 'V-Shape I' = Área de indiferença, r = p)
+def aplicar_funcao_preferencia(funcao, diferenca):
+    return funcao(diferenca)
 
 # Etapa 5: Cálculo dos Fluxos Positivos, Negativos e Líquidos (PROMETHEE II)
 st.subheader("Cálculo dos Fluxos (PROMETHEE II)")
 
 # Função para calcular os fluxos (considerando as funções de preferência)
 def calcular_fluxos(df, pesos, funcoes_selecionadas, parametros):
-    fluxos_positivos = {}
-    fluxos_negativos = {}
-    for fornecedor in df.columns:
-        fluxo_positivo = 0
-        fluxo_negativo = 0
-        for outro_fornecedor in df.columns:
-            if fornecedor != outro_fornecedor:
-                for criterio in df.index:
-                    diferenca = calcular_diferencial(df, fornecedor, outro_fornecedor, criterio)
-                    pref_value = aplicar_funcao_preferencia(funcoes_selecionadas[fornecedor][criterio], diferenca, parametros[fornecedor].get(criterio, {}))
-                    if df[fornecedor][criterio] > df[outro_fornecedor][criterio]:
-                        fluxo_positivo += pesos[criterio] * pref_value
-                    else:
-                        fluxo_negativo += pesos[criterio] * pref_value
-        fluxos_positivos[fornecedor] = fluxo_positivo
-        fluxos_negativos[fornecedor] = fluxo_negativo
+    fluxo_positivo = np.zeros(len(df.columns))
+    fluxo_negativo = np.zeros(len(df.columns))
+    for criterio in df.index:
+        valores = df.loc[criterio].to_numpy(dtype=float)
+        diferencas = calcular_diferencial(valores)
+        # π(a,b) vai para o fluxo positivo de a quando a tem o maior valor, senão para o negativo (o par consigo mesmo vale 0)
+        melhor = valores[:, np.newaxis] > valores[np.newaxis, :]
+        for i, fornecedor in enumerate(df.columns):
+            # Função de preferência resolvida uma vez por fornecedor e critério, aplicada contra todos os outros
+            funcao = resolver_funcao_preferencia(funcoes_selecionadas[fornecedor][criterio], parametros[fornecedor].get(criterio, {}))
+            pref_values = aplicar_funcao_preferencia(funcao, diferencas[i])
+            fluxo_positivo[i] += pesos[criterio] * pref_values[melhor[i]].sum()
+            fluxo_negativo[i] += pesos[criterio] * pref_values[~melhor[i]].sum()
+    fluxos_positivos = dict(zip(df.columns, fluxo_positivo.tolist()))
+    fluxos_negativos = dict(zip(df.columns, fluxo_negativo.tolist()))
     return fluxos_positivos, fluxos_negativos
 
+# Level e V-Shape I precisam de r > q (com r <= q não há faixa entre os limiares)
+limiares_invalidos = [
+    f"{criterio} ({fornecedor})"
+    for fornecedor in fornecedores_selecionados
+    for criterio, valores in parametros[fornecedor].items()
+    if funcoes_selecionadas[fornecedor][criterio] in ['Level', 'V-Shape I'] and valores['r'] <= valores['q']
+]
+if limiares_invalidos:
+    st.error("O limiar de preferência (r) deve ser maior que o limiar de indiferença (q) nas funções Level e V-Shape I: " + ", ".join(limiares_invalidos))
+    st.stop()
+
 # Calcular os fluxos
 fluxos_positivos, fluxos_negativos = calcular_fluxos(df_desempenho, pesos, funcoes_selecionadas, parametros)
 
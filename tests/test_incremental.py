@@ -0,0 +1,60 @@
+# Motor incremental da tela: depois de inclusões, exclusões e edições de
+# fornecedores, sincronizar() chega ao mesmo ranking do cálculo completo.
+import numpy as np
+import pandas as pd
+
+from promethee.cache import CacheFluxosUnicriterio, calcular_promethee_com_cache
+from promethee.incremental import PrometheeIncremental
+
+CRITERIOS = ['C1', 'C2', 'C3']
+CONFIGURACAO = (
+    {'C1': 'Minimizado', 'C2': 'Maximizado', 'C3': 'Maximizado'},
+    {'C1': 3.0, 'C2': 2.0, 'C3': 1.0},
+    {'C1': 'Área de indiferença', 'C2': 'Usual', 'C3': 'Gaussiana'},
+    {'C1': {'q': 5.0, 'p': 20.0}, 'C2': {}, 'C3': {'s': 1.5}},
+)
+
+
+def _matriz(n, semente=3):
+    rng = np.random.default_rng(semente)
+    return pd.DataFrame({'C1': np.round(rng.uniform(0, 100, n), 1), 'C2': rng.integers(1, 6, n),
+                         'C3': np.round(rng.uniform(0, 5, n), 2)}, index=[f'F{i}' for i in range(n)])
+
+
+def _conferir(motor, df, **top_k):
+    esperado = calcular_promethee_com_cache(df, CRITERIOS, *CONFIGURACAO, cache=CacheFluxosUnicriterio(), **top_k)
+    obtido = motor.resultado(df.index.tolist(), **top_k)
+    assert sorted(obtido['Fornecedor']) == sorted(esperado['Fornecedor'])
+    obtido, esperado = obtido.set_index('Fornecedor'), esperado.set_index('Fornecedor')
+    for coluna in ('Fluxo Positivo (ϕ+)', 'Fluxo Negativo (ϕ-)', 'Fluxo Líquido (ϕ)'):
+        np.testing.assert_allclose(obtido.loc[esperado.index, coluna], esperado[coluna], rtol=0, atol=1e-12)
+
+
+def test_sincronizar_segue_a_selecao():
+    todos = _matriz(30)
+    selecao = todos.iloc[:12]
+    motor = PrometheeIncremental.a_partir_de(selecao, CRITERIOS, *CONFIGURACAO)
+    _conferir(motor, selecao)
+
+    # Inclui dois, exclui um
+    selecao = todos.iloc[1:14]
+    assert motor.sincronizar(selecao) == 3
+    _conferir(motor, selecao)
+
+    # Edita uma linha: sai e entra de novo
+    selecao = selecao.copy()
+    selecao.loc['F5', 'C1'] += 40
+    assert motor.sincronizar(selecao) == 2
+    _conferir(motor, selecao, top_k=4, ultimos=2)
+
+    # Sem mudanças, nada a fazer
+    assert motor.sincronizar(selecao) == 0
+
+
+def test_muitos_eventos_recalculam():
+    todos = _matriz(40)
+    motor = PrometheeIncremental.a_partir_de(todos.iloc[:5], CRITERIOS, *CONFIGURACAO)
+    selecao = todos.iloc[20:]
+    motor.sincronizar(selecao)
+    assert motor.eventos == 0
+    _conferir(motor, selecao)
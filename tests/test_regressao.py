@@ -0,0 +1,31 @@
+# Regressão golden: todas as variantes do motor reproduzem os fluxos de
+# referencias/golden/ (o mesmo que `python -m promethee.regressao`), e o laço
+# de referência, que tem as fórmulas escritas à parte, concorda com o registro
+# de funções de preferência em todos os nomes aceitos.
+import numpy as np
+import pandas as pd
+import pytest
+
+from promethee.motor import calcular_promethee_sem_normalizar
+from promethee.preferencias import FUNCOES_PREFERENCIA, NOMES_ALTERNATIVOS
+from promethee.regressao import COLUNAS_FLUXO, calcular_por_laco, verificar
+
+
+def test_golden():
+    assert verificar() == 0
+
+
+@pytest.mark.parametrize('funcao', [*FUNCOES_PREFERENCIA, *NOMES_ALTERNATIVOS])
+@pytest.mark.parametrize('objetivo', ['Maximizado', 'Minimizado'])
+def test_laco_concorda_com_o_registro(funcao, objetivo):
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({'C1': np.round(rng.uniform(0, 10, 12), 1), 'C2': rng.integers(1, 6, 12).astype(float)},
+                      index=[f'F{i}' for i in range(12)])
+    criterios = ['C1', 'C2']
+    cenario = (df, criterios, {'C1': objetivo, 'C2': 'Maximizado'}, {'C1': 3.0, 'C2': 1.0},
+               {'C1': funcao, 'C2': 'Usual'}, {'C1': {'q': 1.0, 'r': 4.0, 's': 2.5}, 'C2': {}})
+
+    laco = calcular_por_laco(*cenario).set_index('Fornecedor')
+    vetorizado = calcular_promethee_sem_normalizar(*cenario)[0].set_index('Fornecedor')
+    for coluna in COLUNAS_FLUXO.values():
+        np.testing.assert_allclose(vetorizado.loc[laco.index, coluna], laco[coluna], rtol=0, atol=1e-12)
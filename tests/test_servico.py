@@ -0,0 +1,139 @@
+# Serviço HTTP: cenário com entrada inválida responde 400 com a mensagem do
+# ErroEntrada, nunca 500, e pedidos idênticos em cálculo são agrupados num só.
+# Sobe o serviço de verdade (uvicorn numa thread, um processo de cálculo) e
+# conversa com ele por HTTP.
+import copy
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+uvicorn = pytest.importorskip('uvicorn')
+
+from promethee.servico import criar_app
+
+CENARIO = {
+    'fornecedores': {'A': {'C1': 1.0, 'C2': 2}, 'B': {'C1': 2.0, 'C2': 1}, 'C': {'C1': 3.0, 'C2': 3}},
+    'criterios': {'C1': {'peso': 2, 'objetivo': 'Minimizado', 'funcao': 'Área de indiferença', 'q': 0.5, 'p': 1.5},
+                  'C2': {'peso': 1, 'funcao': 'Usual'}},
+}
+
+
+@pytest.fixture(scope='module')
+def url():
+    with socket.socket() as livre:
+        livre.bind(('127.0.0.1', 0))
+        porta = livre.getsockname()[1]
+    servidor = uvicorn.Server(uvicorn.Config(criar_app(processos=1), host='127.0.0.1', port=porta,
+                                             log_level='warning'))
+    thread = threading.Thread(target=servidor.run, daemon=True)
+    thread.start()
+    while not servidor.started:
+        assert thread.is_alive(), "o serviço não subiu"
+        time.sleep(0.05)
+    yield f'http://127.0.0.1:{porta}'
+    servidor.should_exit = True
+    thread.join()
+
+
+def _post(url, operacao, corpo):
+    pedido = urllib.request.Request(f'{url}/{operacao}', data=json.dumps(corpo).encode('utf-8'),
+                                    headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(pedido) as resposta:
+            return resposta.status, json.loads(resposta.read())
+    except urllib.error.HTTPError as erro:
+        return erro.code, json.loads(erro.read())
+
+
+def _cenario(caminho, valor):
+    # Cópia de CENARIO com `valor` em cenario[caminho[0]][caminho[1]]...
+    cenario = copy.deepcopy(CENARIO)
+    alvo = cenario
+    for chave in caminho[:-1]:
+        alvo = alvo[chave]
+    alvo[caminho[-1]] = valor
+    return cenario
+
+
+def test_cenario_valido(url):
+    status, corpo = _post(url, 'ranking', CENARIO)
+    assert status == 200
+    assert [linha['Fornecedor'] for linha in corpo['ranking']] == ['A', 'C', 'B']
+
+
+@pytest.mark.parametrize('caminho, valor', [
+    (('criterios', 'C1', 'p'), 0.2),                           # p <= q
+    (('criterios', 'C1', 'q'), 'x'),
+    (('criterios', 'C1', 'q'), None),
+    (('criterios', 'C2'), {'funcao': 'Gaussiana', 's': 0}),    # s <= 0
+    (('criterios', 'C2', 'funcao'), 'Inexistente'),
+    (('criterios', 'C2', 'funcao'), ['Usual']),
+    (('criterios', 'C2', 'peso'), 'alto'),
+    (('criterios', 'C1', 'objetivo'), 'Minimizar'),            # seria lido como maximização
+    (('criterios', 'C1', 'objetivo'), None),
+    (('criterios', 'C2'), 3),
+    (('criterios',), ['C1', 'C2']),
+    (('fornecedores', 'B'), {'C1': 2.0}),                      # valor ausente
+    (('fornecedores', 'B', 'C2'), 'abc'),
+    (('fornecedores',), [1, 2]),
+    (('motor',), 'inexistente'),
+])
+def test_parametros_invalidos_respondem_400(url, caminho, valor):
+    status, corpo = _post(url, 'ranking', _cenario(caminho, valor))
+    assert status == 400
+    assert corpo['erro']
+
+
+@pytest.mark.parametrize('chave, valor', [
+    ('amostras', 'muitas'),
+    ('amostras', 10 ** 9),
+    ('variacao', 'x'),
+    ('semente', 's'),
+    ('modo', 'inexistente'),
+])
+def test_opcoes_monte_carlo_invalidas_respondem_400(url, chave, valor):
+    status, corpo = _post(url, 'monte-carlo', dict(CENARIO, **{'amostras': 100, chave: valor}))
+    assert status == 400
+    assert corpo['erro']
+
+
+def _saude(url):
+    with urllib.request.urlopen(f'{url}/saude') as resposta:
+        return json.loads(resposta.read())
+
+
+def test_pedidos_identicos_simultaneos_sao_agrupados(url):
+    # Monte Carlo grande o bastante para que todos cheguem com o primeiro ainda em cálculo
+    n = 6
+    fornecedores = {f'F{i}': {'C1': float(i % 7), 'C2': (3 * i) % 5} for i in range(100)}
+    cenario = dict(CENARIO, fornecedores=fornecedores, amostras=200_000, semente=17)
+    antes = _saude(url)
+    with ThreadPoolExecutor(n) as clientes:
+        respostas = list(clientes.map(lambda _: _post(url, 'monte-carlo', cenario), range(n)))
+    depois = _saude(url)
+
+    assert all(status == 200 for status, _ in respostas)
+    assert all(corpo == respostas[0][1] for _, corpo in respostas)
+    assert depois['pedidos'] - antes['pedidos'] == n
+    assert depois['calculos'] - antes['calculos'] == 1
+    assert depois['agrupados'] - antes['agrupados'] == n - 1
+    assert depois['em_andamento'] == 0
+
+
+def test_calculo_que_falha_nao_fica_em_andamento(url):
+    # A exceção não fica guardada: o mesmo pedido de novo é calculado de novo
+    cenario = _cenario(('criterios', 'C1', 'p'), 0.2)
+    antes = _saude(url)
+    for _ in range(2):
+        status, _ = _post(url, 'ranking', cenario)
+        assert status == 400
+        assert _saude(url)['em_andamento'] == 0
+    depois = _saude(url)
+    assert depois['calculos'] - antes['calculos'] == 2
+    assert depois['agrupados'] == antes['agrupados']
@@ -0,0 +1,13 @@
+# Orçamento de tempo de importação: cada instrução de ORCAMENTOS roda em um
+# interpretador novo, precisa caber no orçamento e não pode carregar os módulos
+# pesados listados (o mesmo que `python -m promethee.tempo_importacao`).
+import pytest
+
+from promethee.tempo_importacao import ORCAMENTOS, medir
+
+
+@pytest.mark.parametrize('instrucao, orcamento_ms, proibidos', ORCAMENTOS, ids=[o[0] for o in ORCAMENTOS])
+def test_orcamento_de_importacao(instrucao, orcamento_ms, proibidos):
+    tempo_ms, carregados = medir(instrucao, proibidos)
+    assert not carregados, f"{instrucao} carregou {', '.join(carregados)}"
+    assert tempo_ms <= orcamento_ms, f"{instrucao}: {tempo_ms:.1f} ms (orçamento {orcamento_ms} ms)"